@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import bisect
+import collections
+import collections.abc
 import logging
 import queue
 
@@ -25,6 +29,7 @@ from orquesta import machines
 from orquesta.specs import base as spec_base
 from orquesta.specs import loader as spec_loader
 from orquesta import statuses
+from orquesta.utils import cache as cache_util
 from orquesta.utils import context as ctx_util
 from orquesta.utils import dictionary as dict_util
 from orquesta.utils import jsonify as json_util
@@ -33,8 +38,106 @@ from orquesta.utils import plugin as plugin_util
 
 LOG = logging.getLogger(__name__)
 
+ITEM_STATUSES = statuses.ALL_STATUSES + [None]
+
+ITEM_STATUS_CODES = {status: code for code, status in enumerate(ITEM_STATUSES)}
+
+
+class StagedTaskItems(collections.abc.Sequence):
+    # The execution status of each item in a staged with items task. The statuses are packed
+    # into an array of status codes and the number of items per status is kept up to date so
+    # the status of an item can be updated and the items assessed without scanning the list.
+    # Each item reads and serializes as the {"status": ...} dict of the list it replaces.
+
+    def __init__(self, count=0, status=statuses.UNSET):
+        self._codes = array.array("B", [ITEM_STATUS_CODES[status]]) * count
+        self._counts = collections.Counter({status: count} if count else {})
+
+    @classmethod
+    def deserialize(cls, items):
+        instance = cls()
+
+        for item in items:
+            status = item.get("status", statuses.UNSET)
+            instance._codes.append(ITEM_STATUS_CODES[status])
+            instance._counts[status] += 1
+
+        return instance
+
+    def serialize(self):
+        return [{"status": ITEM_STATUSES[code]} for code in self._codes]
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [{"status": ITEM_STATUSES[code]} for code in self._codes[idx]]
+
+        return {"status": self.get_status(idx)}
+
+    def __repr__(self):
+        return repr(self.serialize())
+
+    def __copy__(self):
+        return self.__deepcopy__({})
+
+    def __deepcopy__(self, memo):
+        instance = self.__class__()
+        instance._codes = array.array("B", self._codes)
+        instance._counts = collections.Counter(self._counts)
+
+        return instance
+
+    def get_status(self, idx):
+        return ITEM_STATUSES[self._codes[idx]]
+
+    def set_status(self, idx, status):
+        old_status = self.get_status(idx)
+        self._codes[idx] = ITEM_STATUS_CODES[status]
+        self._counts[old_status] -= 1
+        self._counts[status] += 1
+
+    def reset_statuses(self, statuses_to_reset=None):
+        for idx in range(0, len(self._codes)):
+            if statuses_to_reset is None or self.get_status(idx) in statuses_to_reset:
+                self.set_status(idx, statuses.UNSET)
+
+    def get_status_counts(self):
+        return collections.Counter({k: v for k, v in self._counts.items() if v > 0})
+
+    def count_statuses(self, statuses_to_count):
+        return sum(self._counts[status] for status in statuses_to_count)
+
+    def get_indices(self, status, limit=None):
+        # Use the index method of the array to skip to the next match instead of looping.
+        code = ITEM_STATUS_CODES[status]
+        indices = []
+        start = 0
+
+        while limit is None or len(indices) < limit:
+            try:
+                idx = self._codes.index(code, start)
+            except ValueError:
+                break
+
+            indices.append(idx)
+            start = idx + 1
+
+        return indices
+
 
 class WorkflowState(object):
+    # The sections of the workflow state in the order they are serialized. The contexts and
+    # routes are append only. New entries are also appended to the sequence but the existing
+    # entries are updated in place as the task progresses.
+    sections = ["contexts", "routes", "sequence", "staged", "status", "tasks", "reruns"]
+    appended_sections = ["contexts", "routes", "sequence"]
+
+    # The changes are recorded since the sections were last serialized and since the last
+    # checkpoint of the conductor. The same changes are marked in both records.
+    change_records = ["serialized", "checkpoint"]
+
     def __init__(self, conductor=None):
         self.conductor = conductor
         self.contexts = list()
@@ -44,22 +147,216 @@ class WorkflowState(object):
         self.status = statuses.UNSET
         self.tasks = dict()
         self.reruns = list()
+        self.rebuild_indexes()
+        self.reset_all_changes()
+
+    def rebuild_indexes(self):
+        # The indexes are secondary lookups derived from the sequence, tasks, and staged
+        # lists. They are kept in sync by the methods that mutate the workflow state and
+        # they are not included when the workflow state is serialized.
+        self._task_state_idxs = {}
+        self._tasks_by_status = {}
+        self._last_occurrences = set(self.tasks.values())
+        self._last_occurrence_status_counts = {}
+        self._staged_tasks = {}
+        self._task_successors = {}
+        self._task_occurrences = {}
+
+        for idx, task_state_entry in enumerate(self.sequence):
+            self._task_state_idxs[id(task_state_entry)] = idx
+            self._index_task_occurrence(idx, task_state_entry)
+            self._index_task_status(idx, task_state_entry)
+            self._index_task_successor(idx, task_state_entry)
+
+        for staged_task in self.staged:
+            if isinstance(staged_task.get("items"), list):
+                staged_task["items"] = StagedTaskItems.deserialize(staged_task["items"])
+
+            self._staged_tasks.setdefault((staged_task["id"], staged_task["route"]), [])
+            self._staged_tasks[(staged_task["id"], staged_task["route"])].append(staged_task)
+
+    def _index_task_status(self, idx, task_state_entry, increment=1):
+        if "status" not in task_state_entry:
+            return
 
-    def serialize(self):
-        data = {
-            "contexts": json_util.deepcopy(self.contexts),
-            "routes": json_util.deepcopy(self.routes),
-            "sequence": json_util.deepcopy(self.sequence),
-            "staged": json_util.deepcopy(self.staged),
-            "status": self.status,
-            "tasks": json_util.deepcopy(self.tasks),
-        }
+        status = task_state_entry["status"]
+
+        if increment > 0:
+            self._tasks_by_status.setdefault(status, {})[idx] = task_state_entry
+        else:
+            self._tasks_by_status.get(status, {}).pop(idx, None)
+
+        if idx in self._last_occurrences:
+            count = self._last_occurrence_status_counts.get(status, 0) + increment
+            self._last_occurrence_status_counts[status] = count
+
+    def _index_task_successor(self, idx, task_state_entry):
+        # Map the task id and route of each previous task to the entries that succeed it. The
+        # entry is indexed once per back reference to match the scan of the sequence it replaces.
+        for prev_idx in (task_state_entry.get("prev") or {}).values():
+            prev_task_state_entry = self.sequence[prev_idx]
+            prev_task = (prev_task_state_entry["id"], prev_task_state_entry["route"])
+            self._task_successors.setdefault(prev_task, []).append(idx)
+
+    def _index_task_occurrence(self, idx, task_state_entry):
+        # Map the task id and route to the indices of the entries in the order they are added.
+        task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (
+            task_state_entry["id"],
+            str(task_state_entry["route"]),
+        )
+
+        self._task_occurrences.setdefault(task_state_entry_id, []).append(idx)
+
+    def _unindex_task_status(self, idx, task_state_entry):
+        self._index_task_status(idx, task_state_entry, increment=-1)
+
+    def _set_last_occurrence(self, task_state_entry_id, idx):
+        prev_idx = self.tasks.get(task_state_entry_id)
+
+        if prev_idx is not None and prev_idx != idx:
+            prev_task_state_entry = self.sequence[prev_idx]
+            self._unindex_task_status(prev_idx, prev_task_state_entry)
+            self._last_occurrences.discard(prev_idx)
+            self._index_task_status(prev_idx, prev_task_state_entry)
+
+        self.tasks[task_state_entry_id] = idx
+        self._last_occurrences.add(idx)
+        self.mark_changed("tasks")
+
+    def get_serializable_sections(self):
+        sections = ["contexts", "routes", "sequence", "staged", "status", "tasks"]
 
         if self.reruns:
-            data["reruns"] = json_util.deepcopy(self.reruns)
+            sections.append("reruns")
+
+        return sections
+
+    def get_section_value(self, section):
+        # Return the value of the section in serializable form without making a copy.
+        if section not in self.sections:
+            raise KeyError(section)
+
+        value = getattr(self, section)
+
+        if section == "staged":
+            value = [self.get_entry_value(t) for t in value]
+
+        return value
+
+    def get_last_occurrence(self, task_state_entry_id, sequence_length=None):
+        # Return the index of the last entry for the task before the given length of the
+        # sequence. The entries are only appended so this is the task pointer at that time.
+        idxs = self._task_occurrences.get(task_state_entry_id, [])
+
+        if sequence_length is None:
+            sequence_length = len(self.sequence)
+
+        pos = bisect.bisect_left(idxs, sequence_length)
+
+        return idxs[pos - 1] if pos > 0 else None
+
+    @staticmethod
+    def get_entry_value(entry):
+        # Return a single entry of a section in serializable form without making a copy.
+        if isinstance(entry, dict) and isinstance(entry.get("items"), StagedTaskItems):
+            entry = dict(entry, items=entry["items"].serialize())
+
+        return entry
+
+    @classmethod
+    def serialize_entry(cls, entry):
+        # Copy a single entry of a section in the same form as the section is serialized.
+        return json_util.deepcopy(cls.get_entry_value(entry))
+
+    def serialize_section(self, section):
+        value = self.get_section_value(section)
+
+        return value if section == "status" else json_util.deepcopy(value)
+
+    def serialize(self, sections=None):
+        # Only the given sections are copied and their changes are reset once serialized.
+        if sections is None:
+            sections = self.get_serializable_sections()
+
+        data = {k: self.serialize_section(k) for k in sections}
+        self.reset_changes(sections)
 
         return data
 
+    def mark_changed(self, section):
+        if section not in self.sections:
+            raise KeyError(section)
+
+        for record in self._changes.values():
+            record["sections"].add(section)
+
+    def _mark_task_state_idx_changed(self, idx):
+        for record in self._changes.values():
+            record["task_states"].add(idx)
+
+    def mark_task_state_changed(self, task_state_entry):
+        idx = self._task_state_idxs.get(id(task_state_entry))
+
+        # The task state entry is not tracked if it is not in the sequence.
+        if idx is not None and self.sequence[idx] is task_state_entry:
+            self._mark_task_state_idx_changed(idx)
+
+    def get_changes(self, record="serialized"):
+        # Return the sections that changed since they were last serialized or, if the record
+        # is "checkpoint", since the last checkpoint. For the sections that are appended to,
+        # the range of the new entries is returned under "appended". The indices of the
+        # existing entries in the sequence that are updated are returned under "modified".
+        # Any other section that changed is flagged with "modified" set to True.
+        changes = {}
+        record = self._changes[record]
+
+        for section in self.appended_sections:
+            start, end = record["lengths"][section], len(getattr(self, section))
+
+            if end > start:
+                changes[section] = {"appended": [start, end]}
+
+        modified = sorted(i for i in record["task_states"] if i < record["lengths"]["sequence"])
+
+        if modified:
+            changes.setdefault("sequence", {})["modified"] = modified
+
+        for section in self.sections:
+            if section in record["sections"] or (
+                section == "status" and self.status != record["status"]
+            ):
+                changes.setdefault(section, {})["modified"] = True
+
+        return changes
+
+    def reset_changes(self, sections=None, record="serialized"):
+        if sections is None:
+            self._changes[record] = {"sections": set(), "task_states": set(), "lengths": {}}
+            sections = self.sections
+
+        record = self._changes[record]
+
+        for section in sections:
+            record["sections"].discard(section)
+
+            if section in self.appended_sections:
+                record["lengths"][section] = len(getattr(self, section))
+
+            if section == "sequence":
+                record["task_states"].clear()
+
+            if section == "status":
+                record["status"] = self.status
+
+    def reset_all_changes(self):
+        self._changes = {}
+
+        for record in self.change_records:
+            self.reset_changes(record=record)
+
+    def get_view(self):
+        return WorkflowStateView(self)
+
     @classmethod
     def deserialize(cls, data):
         instance = cls()
@@ -70,6 +367,8 @@ class WorkflowState(object):
         instance.status = data.get("status", statuses.UNSET)
         instance.tasks = json_util.deepcopy(data.get("tasks", dict()))
         instance.reruns = json_util.deepcopy(data.get("reruns", list()))
+        instance.rebuild_indexes()
+        instance.reset_all_changes()
 
         return instance
 
@@ -92,37 +391,63 @@ class WorkflowState(object):
             result = list(enumerate(self.sequence))
 
         if last_occurrence:
-            result = [s for s in result if s[0] in self.tasks.values()]
+            result = [s for s in result if s[0] in self._last_occurrences]
 
         return result
 
     def get_tasks_by_status(self, statuses, last_occurrence=True):
-        result = [
-            (i, t) for i, t in enumerate(self.sequence) if "status" in t and t["status"] in statuses
-        ]
+        if isinstance(statuses, str):
+            statuses = [statuses]
+
+        result = {}
+
+        for status in statuses:
+            result.update(self._tasks_by_status.get(status, {}))
 
         if last_occurrence:
-            result = [s for s in result if s[0] in self.tasks.values()]
+            result = {i: t for i, t in result.items() if i in self._last_occurrences}
 
-        return result
+        return sorted(result.items(), key=lambda x: x[0])
 
-    def get_task_sequence(self, task_id, route):
-        idx = self.tasks[constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))]
-        seq = [(idx, self.sequence[idx])]
+    def has_tasks_by_status(self, statuses):
+        return any(self._last_occurrence_status_counts.get(s, 0) > 0 for s in statuses)
+
+    def add_task_state_entry(self, task_state_entry):
+        idx = len(self.sequence)
+        self.sequence.append(task_state_entry)
+        self._task_state_idxs[id(task_state_entry)] = idx
+
+        task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (
+            task_state_entry["id"],
+            str(task_state_entry["route"]),
+        )
+
+        self._set_last_occurrence(task_state_entry_id, idx)
+        self._index_task_occurrence(idx, task_state_entry)
+        self._index_task_status(idx, task_state_entry)
+        self._index_task_successor(idx, task_state_entry)
 
-        q = queue.Queue()
-        q.put((task_id, route))
+        return idx
 
-        while not q.empty():
-            task_id, route = q.get()
+    def update_task_status(self, task_state_entry, status):
+        idx = self._task_state_idxs.get(id(task_state_entry))
 
-            for i, t in enumerate(self.sequence):
-                for k, v in t["prev"].items():
-                    p = self.sequence[v]
-                    if p["id"] == task_id and p["route"] == route:
-                        seq.append((i, t))
-                        if (i, t) not in seq:
-                            q.put((t["id"], t["route"]))
+        # The task state entry is not tracked if it is not in the sequence.
+        if idx is None or self.sequence[idx] is not task_state_entry:
+            task_state_entry["status"] = status
+            return
+
+        self._unindex_task_status(idx, task_state_entry)
+        task_state_entry["status"] = status
+        self._index_task_status(idx, task_state_entry)
+        self._mark_task_state_idx_changed(idx)
+
+    def get_task_sequence(self, task_id, route):
+        # Return the last entry of the task followed by the entries that succeed any entry of
+        # the task, in the order of the sequence, using the index of successors.
+        idx = self.tasks[constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))]
+        seq = [(idx, self.sequence[idx])]
+        seq.extend((i, self.sequence[i]) for i in self._task_successors.get((task_id, route), []))
 
         return seq
 
@@ -137,23 +462,23 @@ class WorkflowState(object):
 
     @property
     def has_active_tasks(self):
-        return len(self.get_tasks_by_status(statuses.ACTIVE_STATUSES)) > 0
+        return self.has_tasks_by_status(statuses.ACTIVE_STATUSES)
 
     @property
     def has_pausing_tasks(self):
-        return len(self.get_tasks_by_status([statuses.PAUSING])) > 0
+        return self.has_tasks_by_status([statuses.PAUSING])
 
     @property
     def has_paused_tasks(self):
-        return len(self.get_tasks_by_status([statuses.PAUSED, statuses.PENDING])) > 0
+        return self.has_tasks_by_status([statuses.PAUSED, statuses.PENDING])
 
     @property
     def has_canceling_tasks(self):
-        return len(self.get_tasks_by_status([statuses.CANCELING])) > 0
+        return self.has_tasks_by_status([statuses.CANCELING])
 
     @property
     def has_canceled_tasks(self):
-        return len(self.get_tasks_by_status([statuses.CANCELED])) > 0
+        return self.has_tasks_by_status([statuses.CANCELED])
 
     def get_unreachable_barriers(self):
         unreachable_barriers = []
@@ -204,11 +529,13 @@ class WorkflowState(object):
             entry["retry"] = retry
 
         self.staged.append(entry)
+        self._staged_tasks.setdefault((task_id, route), []).append(entry)
+        self.mark_changed("staged")
 
         return entry
 
     def get_staged_task(self, task_id, route):
-        staged_tasks = [x for x in self.staged if x["id"] == task_id and x["route"] == route]
+        staged_tasks = self._staged_tasks.get((task_id, route))
 
         return staged_tasks[0] if staged_tasks else None
 
@@ -216,17 +543,383 @@ class WorkflowState(object):
         staged_task = self.get_staged_task(task_id, route)
 
         if staged_task:
-            any_items_running = [
-                item
-                for item in staged_task.get("items", [])
-                if item["status"] in statuses.ACTIVE_STATUSES
-            ]
+            items = staged_task.get("items")
+            any_items_running = items.count_statuses(statuses.ACTIVE_STATUSES) if items else 0
 
             if not any_items_running:
+                self._staged_tasks[(task_id, route)].remove(staged_task)
+
+                if not self._staged_tasks[(task_id, route)]:
+                    self._staged_tasks.pop((task_id, route))
+
                 self.staged.remove(staged_task)
+                self.mark_changed("staged")
+
+
+class WorkflowStateView(collections.abc.Mapping):
+    # The workflow state view is a read-only snapshot of the serialized workflow state that is
+    # passed to the expression evaluators as __state. Instead of serializing the entire workflow
+    # state up front, the view records the length of the sections that are appended to, the
+    # staged tasks, and the workflow status when it is created. The entries are only copied
+    # when they are read, so the cost of an expression is proportional to what it reads. The
+    # entries of the sequence and staged tasks are read as they are at the time of the read.
+
+    def __init__(self, state):
+        self._state = state
+        self._serializable_sections = state.get_serializable_sections()
+        self._lengths = {s: len(getattr(state, s)) for s in WorkflowStateListView.sections}
+        self._staged = list(state.staged)
+        self._status = state.status
+
+    def __getitem__(self, key):
+        if key not in self._serializable_sections:
+            raise KeyError(key)
+
+        if key == "status":
+            return self._status
+
+        if key == "tasks":
+            return WorkflowStateTasksView(self._state, self._lengths["sequence"])
+
+        if key == "staged":
+            return WorkflowStateListView(self._staged, len(self._staged))
+
+        return WorkflowStateListView(getattr(self._state, key), self._lengths[key])
+
+    def __iter__(self):
+        return iter(self._serializable_sections)
+
+    def __len__(self):
+        return len(self._serializable_sections)
+
+    def __repr__(self):
+        return repr(self.toDict())
+
+    def __copy__(self):
+        return self.toDict()
+
+    def __deepcopy__(self, memo):
+        return self.toDict()
+
+    def toDict(self):
+        # The method name is the hook used by ujson to serialize custom objects. The entries of
+        # the snapshot are collected without copying and then copied all at once.
+        data = {}
+
+        for k in self._serializable_sections:
+            if k == "status":
+                data[k] = self._status
+            elif k == "tasks":
+                data[k] = dict(self[k])
+            elif k == "staged":
+                data[k] = [WorkflowState.get_entry_value(t) for t in self._staged]
+            else:
+                data[k] = getattr(self._state, k)[: self._lengths[k]]
+
+        return json_util.deepcopy(data)
+
+
+class WorkflowStateListView(collections.abc.Sequence):
+    # A read-only view of the first entries of a section of the workflow state. Each entry is
+    # copied when it is read so the entries in the workflow state cannot be modified.
+    sections = ["contexts", "routes", "sequence", "reruns"]
+
+    def __init__(self, entries, length):
+        self._entries = entries
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._length))]
+
+        if idx < 0:
+            idx += self._length
+
+        if idx < 0 or idx >= self._length:
+            raise IndexError("The index of the entry is out of range.")
+
+        return WorkflowState.serialize_entry(self._entries[idx])
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class WorkflowStateTasksView(collections.abc.Mapping):
+    # A read-only view of the task pointers of the workflow state when the sequence had the
+    # given length. The pointers only change when entries are added to the sequence, so the
+    # pointers are looked up from the index of the task occurrences if the sequence grew.
+
+    def __init__(self, state, sequence_length):
+        self._state = state
+        self._sequence_length = sequence_length
+
+    def _is_current(self):
+        return len(self._state.sequence) == self._sequence_length
+
+    def __getitem__(self, key):
+        if self._is_current():
+            return self._state.tasks[key]
+
+        idx = self._state.get_last_occurrence(key, sequence_length=self._sequence_length)
+
+        if idx is None:
+            raise KeyError(key)
+
+        return idx
+
+    def __iter__(self):
+        if self._is_current():
+            return iter(list(self._state.tasks))
+
+        return iter([k for k in self._state.tasks if k in self])
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+
+        return True
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class TaskItemResultStore(object):
+    # The store for the results of the items of with items tasks which are added one at a time
+    # and only assembled into the accumulated result when the task is completed. The results
+    # are serialized with the conductor under "item_results" by task id and route and then by
+    # item id. The results that are added or cleared since the last checkpoint are tracked so
+    # the delta of the conductor only includes the changes to the results.
+
+    def __init__(self):
+        self._results = {}
+        self.checkpoint()
+
+    @staticmethod
+    def _get_key(task_id, route):
+        return constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))
+
+    @classmethod
+    def deserialize(cls, data):
+        instance = cls()
+
+        for key, results in (data or {}).items():
+            instance._results[key] = {int(k): v for k, v in results.items()}
+
+        instance.checkpoint()
+
+        return instance
+
+    def _serialize_results(self, key):
+        return {str(k): v for k, v in self._results[key].items()}
+
+    def serialize(self):
+        return json_util.deepcopy({key: self._serialize_results(key) for key in self._results})
+
+    def __len__(self):
+        return len(self._results)
+
+    def add_item_result(self, task_id, route, item_id, result):
+        key = self._get_key(task_id, route)
+        self._results.setdefault(key, {})[item_id] = result
+        self._added.setdefault(key, set()).add(item_id)
+
+    def has_results(self, task_id, route):
+        return self._get_key(task_id, route) in self._results
+
+    def validate_item_results(self, task_id, route, item_ids):
+        # Raise if the result of any of the given items is missing.
+        results = self._results.get(self._get_key(task_id, route), {})
+        missing = [i for i in item_ids if i not in results]
+
+        if missing:
+            raise exc.TaskItemResultsError(task_id, route, missing)
+
+    def get_accumulated_result(self, task_id, route, items_count, item_ids=None):
+        # Raise if the result of any of the given items, or of all the items if the list of
+        # items is not given, is missing. The result of any other item that is missing is None.
+        item_ids = range(0, items_count) if item_ids is None else item_ids
+        self.validate_item_results(task_id, route, item_ids)
+        results = self._results.get(self._get_key(task_id, route), {})
+
+        return [results.get(item_id) for item_id in range(0, items_count)]
+
+    def clear(self, task_id, route):
+        key = self._get_key(task_id, route)
+
+        if self._results.pop(key, None) is not None:
+            self._added.pop(key, None)
+            self._cleared.add(key)
+
+    def checkpoint(self):
+        self._checkpoint_keys = set(self._results.keys())
+        self._added = {}
+        self._cleared = set()
+
+    def has_changes(self):
+        return bool(self._added or self._cleared)
+
+    def serialize_delta(self, path):
+        # Return the changes since the last checkpoint as delta operations under the given path
+        # and move the checkpoint. If there was no result at the checkpoint, then the section
+        # may not be in the serialized conductor and the whole section is replaced.
+        delta = []
+
+        if not self.has_changes():
+            return delta
+
+        if not self._checkpoint_keys:
+            delta.append({"op": "replace", "path": list(path), "value": self.serialize()})
+            self.checkpoint()
+            return delta
+
+        for key in sorted(self._checkpoint_keys | self._cleared | set(self._added.keys())):
+            if key not in self._results:
+                if key in self._checkpoint_keys:
+                    delta.append({"op": "remove", "path": list(path) + [key]})
+            elif key not in self._checkpoint_keys or key in self._cleared:
+                value = json_util.deepcopy(self._serialize_results(key))
+                delta.append({"op": "replace", "path": list(path) + [key], "value": value})
+            else:
+                for item_id in sorted(self._added.get(key, [])):
+                    value = json_util.deepcopy(self._results[key][item_id])
+                    item_path = list(path) + [key, str(item_id)]
+                    delta.append({"op": "replace", "path": item_path, "value": value})
+
+        self.checkpoint()
+
+        return delta
+
+
+class CompiledWorkflow(object):
+    # The spec and the frozen graph of a workflow definition which are shared by the conductors
+    # of workflow executions with the same definition. The spec is instantiated from a frozen
+    # copy of the serialized spec so the shared spec cannot be modified by any conductor. The
+    # graph is composed on first use and the hashes are computed on first use.
+
+    def __init__(self, spec, spec_hash=None):
+        self.spec = spec
+        self._spec_hash = spec_hash
+        self._graph = None
+        self._graph_hash = None
+
+    @property
+    def spec_hash(self):
+        if not self._spec_hash:
+            self._spec_hash = json_util.content_hash(self.spec.serialize())
+
+        return self._spec_hash
+
+    @property
+    def graph(self):
+        if not self._graph:
+            composer = plugin_util.get_module("orquesta.composers", self.spec.get_catalog())
+            self._graph = composer.compose(self.spec).freeze()
+
+        return self._graph
+
+    @property
+    def graph_hash(self):
+        if not self._graph_hash:
+            self._graph_hash = json_util.content_hash(self.graph.serialize())
+
+        return self._graph_hash
+
+    def is_graph(self, graph):
+        # Check if the graph is the compiled graph without composing the graph.
+        return self._graph is not None and graph is self._graph
+
+    def get_graph(self, graph_hash):
+        # Return the graph if it is already composed and it has the given content hash. The
+        # graph is not composed here to compare with a graph that is serialized.
+        if self._graph and graph_hash and graph_hash == self.graph_hash:
+            return self._graph
+
+        return None
 
 
 class WorkflowConductor(object):
+    # The sections of the serialized conductor in the order they are serialized.
+    sections = [
+        "spec",
+        "graph",
+        "input",
+        "context",
+        "state",
+        "log",
+        "errors",
+        "output",
+        "item_results",
+    ]
+
+    # The max number of merged task contexts to keep in memory per conductor.
+    task_context_cache_size = 128
+
+    # The paths to the sections of the serialized conductor that are recorded in the delta in
+    # the order they are recorded. The delta is made from the changes recorded since the last
+    # checkpoint. The spec, graph, input, and parent context do not change after the conductor
+    # is created and are only in the full serialization. The changes to the item results are
+    # tracked by the task item result store.
+    delta_sections = [
+        ("state", "contexts"),
+        ("state", "routes"),
+        ("state", "sequence"),
+        ("log",),
+        ("errors",),
+        ("state", "staged"),
+        ("state", "tasks"),
+        ("state", "status"),
+        ("state", "reruns"),
+        ("output",),
+    ]
+
+    # The type of store for the results of the items of with items tasks.
+    task_item_result_store_cls = TaskItemResultStore
+
+    # The process wide cache of the compiled workflows by the content hash of the spec.
+    compiled_workflow_cache = cache_util.LRUCache(maxsize=256)
+
+    @classmethod
+    def get_compiled_workflow(cls, spec=None, spec_data=None, spec_hash=None, resolver=None):
+        # Look up the compiled workflow by the content hash of the serialized spec. On a cache
+        # miss, the spec of the compiled workflow is instantiated from a frozen copy of the
+        # serialized spec. If only the content hash is given, then the serialized spec is
+        # fetched from the resolver on a cache miss.
+        if spec_data is None and spec is not None:
+            spec_data = spec.serialize()
+
+        if spec_hash is None:
+            spec_hash = json_util.content_hash(spec_data)
+
+        compiled = cls.compiled_workflow_cache.get(spec_hash)
+
+        if compiled is None:
+            if spec_data is None:
+                if resolver is None:
+                    raise ValueError("The resolver is required to resolve the spec by hash.")
+
+                spec_data = resolver.get(spec_hash)
+
+            spec_module = spec_loader.get_spec_module(spec_data["catalog"])
+            spec = spec_module.WorkflowSpec.deserialize(dict_util.freeze(spec_data))
+            compiled = CompiledWorkflow(spec, spec_hash=spec_hash)
+            cls.compiled_workflow_cache.put(spec_hash, compiled)
+
+        return compiled
+
     def __init__(self, spec, context=None, inputs=None):
         if not spec or not isinstance(spec, spec_base.Spec):
             raise ValueError('The value of "spec" is not type of Spec.')
@@ -236,6 +929,7 @@ class WorkflowConductor(object):
         self.spec_module = spec_loader.get_spec_module(self.catalog)
         self.composer = plugin_util.get_module("orquesta.composers", self.catalog)
 
+        self._compiled = None
         self._errors = []
         self._graph = None
         self._inputs = inputs or {}
@@ -243,6 +937,13 @@ class WorkflowConductor(object):
         self._outputs = None
         self._parent_ctx = context or {}
         self._workflow_state = None
+        self._task_ctx_cache = cache_util.LRUCache(maxsize=self.task_context_cache_size)
+        self._has_checkpoint = False
+        self._changes = {
+            record: {"sections": set(self.sections) - {"state"}, "lengths": {"log": 0, "errors": 0}}
+            for record in WorkflowState.change_records
+        }
+        self.task_item_result_store = self.task_item_result_store_cls()
 
     def restore(
         self, graph, log=None, errors=None, state=None, inputs=None, outputs=None, context=None
@@ -260,36 +961,275 @@ class WorkflowConductor(object):
             raise ValueError('The value of "outputs" is not type of dict.')
 
         self._errors = errors or []
-        self._graph = graph
+        self._graph = graph.freeze()
         self._inputs = inputs or {}
         self._log = log or []
         self._outputs = outputs
         self._parent_ctx = context or {}
         self._workflow_state = state
+        self._task_ctx_cache.clear()
+        self._has_checkpoint = False
+        self.reset_changes()
 
         # Assign a back reference of the conductor to the workflow state.
         # This back reference is needed to help the workflow state machine
         # identify if there are next tasks.
         self._workflow_state.conductor = self
 
-    def serialize(self):
-        return {
-            "spec": self.spec.serialize(),
-            "graph": self.graph.serialize(),
-            "input": self.get_workflow_input(),
-            "context": self.get_workflow_parent_context(),
-            "state": self.workflow_state.serialize(),
-            "log": json_util.deepcopy(self.log),
-            "errors": json_util.deepcopy(self.errors),
-            "output": self.get_workflow_output(),
+    def serialize_section(self, section):
+        serializers = {
+            "spec": lambda: self.spec.serialize(),
+            "graph": lambda: self.graph.serialize(),
+            "input": lambda: self.get_workflow_input(),
+            "context": lambda: self.get_workflow_parent_context(),
+            "state": lambda: self.workflow_state.serialize(),
+            "log": lambda: json_util.deepcopy(self.log),
+            "errors": lambda: json_util.deepcopy(self.errors),
+            "output": lambda: self.get_workflow_output(),
+            "item_results": lambda: self.task_item_result_store.serialize(),
         }
 
+        if section not in serializers:
+            raise KeyError(section)
+
+        return serializers[section]()
+
+    def get_serializable_sections(self):
+        sections = [s for s in self.sections if s != "item_results"]
+
+        if len(self.task_item_result_store) > 0:
+            sections.append("item_results")
+
+        return sections
+
+    def serialize_reference(self, section, resolver):
+        # Store the serialized spec or graph in the resolver by its content hash and return the
+        # hash. The hashes of the compiled workflow are reused so the spec and the graph are
+        # only serialized if the content is not already in the resolver.
+        if section == "spec":
+            content_hash = self.compiled.spec_hash
+        elif section == "graph" and self.compiled.is_graph(self.graph):
+            content_hash = self.compiled.graph_hash
+        elif section == "graph":
+            content_hash = json_util.content_hash(self.graph.serialize())
+        else:
+            raise KeyError(section)
+
+        if not resolver.has(content_hash):
+            resolver.put(content_hash, self.serialize_section(section))
+
+        return content_hash
+
+    def serialize(self, sections=None, resolver=None):
+        # The sections of the workflow state can be given individually as "state.<section>",
+        # for example, "state.sequence". Only the given sections are copied and serialized.
+        # If a resolver is given, then the spec and the graph are stored in the resolver and
+        # only their content hashes are serialized as "spec_hash" and "graph_hash".
+        full = sections is None
+
+        if full:
+            sections = self.get_serializable_sections()
+
+        data = {}
+        state_sections = []
+
+        for section in sections:
+            if section.startswith("state."):
+                state_sections.append(section[len("state.") :])
+            elif resolver is not None and section in ["spec", "graph"]:
+                data[section + "_hash"] = self.serialize_reference(section, resolver)
+            else:
+                data[section] = self.serialize_section(section)
+
+            # Store the content hash of the compiled graph with the graph so the compiled graph
+            # can be used on deserialize without comparing the graphs.
+            if section == "graph" and resolver is None and self.compiled.is_graph(self.graph):
+                data["graph_hash"] = self.compiled.graph_hash
+
+        if state_sections and "state" not in data:
+            data["state"] = self.workflow_state.serialize(sections=state_sections)
+
+        self.reset_changes(None if full else [s for s in sections if s in self.sections])
+
+        return data
+
+    def mark_changed(self, section):
+        if section not in self.sections:
+            raise KeyError(section)
+
+        for record in self._changes.values():
+            record["sections"].add(section)
+
+    def get_changes(self, record="serialized"):
+        # Return the sections that changed since they were last serialized or, if the record
+        # is "checkpoint", since the last checkpoint. The log and errors are appended to and
+        # the range of the new entries is returned under "appended". If existing entries are
+        # removed or the section is replaced, then "modified" is set to True. The changes of
+        # the workflow state are returned under the state section.
+        changes = {}
+        changes_record = self._changes[record]
+
+        for section in ["log", "errors"]:
+            start, end = changes_record["lengths"][section], len(getattr(self, section))
+
+            if end > start:
+                changes[section] = {"appended": [start, end]}
+
+        for section in self.sections:
+            if section in changes_record["sections"]:
+                changes.setdefault(section, {})["modified"] = True
+
+        state_changes = self.workflow_state.get_changes(record=record)
+
+        if state_changes:
+            changes["state"] = state_changes
+
+        return changes
+
+    def reset_changes(self, sections=None, record="serialized"):
+        if sections is None:
+            sections = self.sections
+
+        changes_record = self._changes[record]
+
+        for section in sections:
+            changes_record["sections"].discard(section)
+
+            if section in changes_record["lengths"]:
+                changes_record["lengths"][section] = len(getattr(self, section))
+
+            # The changes of the workflow state are reset when the workflow state is serialized.
+            if section == "state" and self._workflow_state:
+                self._workflow_state.reset_changes(record=record)
+
+    def _get_delta_section_value(self, path):
+        if path[0] == "state":
+            return self.workflow_state.get_section_value(path[1])
+
+        return {"log": self.log, "errors": self.errors, "output": self._outputs or None}[path[0]]
+
+    def checkpoint(self):
+        # Mark the current state of the conductor as the base for the next delta.
+        self.reset_changes(record="checkpoint")
+        self.task_item_result_store.checkpoint()
+        self._has_checkpoint = True
+
+    def serialize_delta(self):
+        # Return the ordered list of changes since the last checkpoint and move the checkpoint.
+        # The delta is made from the changes that are recorded as the conductor is updated so
+        # only the appended and modified entries are read and copied into the delta.
+        if not self._has_checkpoint:
+            raise exc.WorkflowCheckpointError("There is no checkpoint for the workflow conductor.")
+
+        delta = []
+        changes = self.get_changes(record="checkpoint")
+
+        for path in self.delta_sections:
+            section_changes = changes.get(path[0], {})
+
+            if path[0] == "state":
+                section_changes = section_changes.get(path[1], {})
+
+            if not section_changes:
+                continue
+
+            value = self._get_delta_section_value(path)
+            modified = section_changes.get("modified", [])
+
+            # Replace the whole section if the section is modified as a whole.
+            if modified is True:
+                delta.append(
+                    {"op": "replace", "path": list(path), "value": json_util.deepcopy(value)}
+                )
+                continue
+
+            for idx in modified:
+                delta.append(
+                    {
+                        "op": "replace",
+                        "path": list(path) + [idx],
+                        "value": json_util.deepcopy(value[idx]),
+                    }
+                )
+
+            if "appended" in section_changes:
+                start, end = section_changes["appended"]
+                appended = json_util.deepcopy(value[start:end])
+                delta.append({"op": "append", "path": list(path), "value": appended})
+
+        delta.extend(self.task_item_result_store.serialize_delta(["item_results"]))
+
+        self.reset_changes(record="checkpoint")
+
+        return delta
+
     @classmethod
-    def deserialize(cls, data):
-        spec_module = spec_loader.get_spec_module(data["spec"]["catalog"])
-        spec = spec_module.WorkflowSpec.deserialize(data["spec"])
+    def apply_delta(cls, data, delta):
+        # Return a copy of the serialized conductor with the changes in the delta applied. Only
+        # the dicts and lists along the path of each change are copied and the rest is shared
+        # with the given data, which is not modified.
+        data = dict(data)
+        copied = {id(data)}
+
+        for change in delta:
+            path = change["path"]
+            parent = data
+
+            for key in path[:-1]:
+                child = parent[key]
+
+                if id(child) not in copied:
+                    child = dict(child) if isinstance(child, dict) else list(child)
+                    copied.add(id(child))
+                    parent[key] = child
+
+                parent = child
+
+            if change["op"] == "append":
+                target = parent[path[-1]]
+
+                if id(target) not in copied:
+                    target = list(target)
+                    copied.add(id(target))
+                    parent[path[-1]] = target
+
+                target.extend(change["value"])
+            elif change["op"] == "replace":
+                parent[path[-1]] = change["value"]
+            elif change["op"] == "remove":
+                parent.pop(path[-1], None)
+            else:
+                raise ValueError('The delta operation "%s" is not supported.' % change["op"])
+
+        return data
+
+    @classmethod
+    def deserialize(cls, data, deltas=None, resolver=None):
+        for delta in deltas or []:
+            data = cls.apply_delta(data, delta)
+
+        # Use the spec and the graph of the compiled workflow with the same definition. The
+        # compiled graph is only used if it is already composed and the content hash of the
+        # graph that is stored in the serialized data is the same. Otherwise, the serialized
+        # graph is deserialized. The spec and the graph that are serialized by reference are
+        # fetched from the resolver only if they are not already compiled.
+        if "spec" in data:
+            compiled = cls.get_compiled_workflow(spec_data=data["spec"])
+        else:
+            compiled = cls.get_compiled_workflow(spec_hash=data["spec_hash"], resolver=resolver)
+
+        spec = compiled.spec
+        graph_data = data.get("graph")
+        graph_hash = data.get("graph_hash")
+        graph = compiled.get_graph(graph_hash)
+
+        if graph is None and graph_data is not None:
+            graph = graphing.WorkflowGraph.deserialize(graph_data)
+        elif graph is None and resolver is not None:
+            graph = graphing.WorkflowGraph.deserialize(resolver.get(graph_hash))
+        elif graph is None:
+            raise ValueError("The resolver is required to resolve the graph by hash.")
 
-        graph = graphing.WorkflowGraph.deserialize(data["graph"])
         inputs = json_util.deepcopy(data["input"])
         context = json_util.deepcopy(data["context"])
         state = WorkflowState.deserialize(data["state"])
@@ -298,14 +1238,25 @@ class WorkflowConductor(object):
         outputs = json_util.deepcopy(data["output"])
 
         instance = cls(spec)
+        instance._compiled = compiled
         instance.restore(graph, log, errors, state, inputs, outputs, context)
+        instance.task_item_result_store = cls.task_item_result_store_cls.deserialize(
+            data.get("item_results")
+        )
 
         return instance
 
+    @property
+    def compiled(self):
+        if not self._compiled:
+            self._compiled = self.get_compiled_workflow(self.spec)
+
+        return self._compiled
+
     @property
     def graph(self):
         if not self._graph:
-            self._graph = self.composer.compose(self.spec)
+            self._graph = self.compiled.graph
 
         return self._graph
 
@@ -494,13 +1445,14 @@ class WorkflowConductor(object):
         # Render workflow outputs if workflow is completed.
         if wf_status in statuses.COMPLETED_STATUSES and not self._outputs:
             workflow_ctx = self.get_workflow_terminal_context()
-            state_ctx = {"__state": self.workflow_state.serialize()}
+            state_ctx = {"__state": self.workflow_state.get_view()}
             workflow_ctx = dict_util.merge_dicts(workflow_ctx, state_ctx, True)
             outputs, errors = self.spec.render_output(workflow_ctx)
 
             # Persist outputs if it is not empty.
             if outputs:
                 self._outputs = outputs
+                self.mark_changed("output")
 
             # Log errors if any returned and mark workflow as failed.
             if errors:
@@ -514,6 +1466,7 @@ class WorkflowConductor(object):
 
     def reset_workflow_output(self):
         self._outputs = None
+        self.mark_changed("output")
 
     def get_inbound_criteria_status(self, task_id, route):
         # Get the list of inbound task transitions for the barrier task.
@@ -563,17 +1516,21 @@ class WorkflowConductor(object):
         # If reached here, then the requirement is not satisified.
         return constants.INBOUND_CRITERIA_NOT_SATISFIED
 
-    def get_task(self, task_id, route):
+    def _get_task(self, task_id, route):
         try:
-            task_ctx = self.get_task_initial_context(task_id, route)
+            task_ctx = self._get_task_initial_context(task_id, route)
         except ValueError:
-            task_ctx = self.get_workflow_initial_context()
+            task_ctx = self.workflow_state.contexts[0]
 
-        state_ctx = {"__state": self.workflow_state.serialize()}
+        state_ctx = {"__state": self.workflow_state.get_view()}
         current_task = {"id": task_id, "route": route}
         task_ctx = ctx_util.set_current_task(task_ctx, current_task)
         task_ctx = dict_util.merge_dicts(task_ctx, state_ctx, True)
-        task_spec = self.spec.tasks.get_task(task_id).copy()
+        # The task spec is from the frozen spec of the compiled workflow which is shared by the
+        # conductors of the same workflow definition and so it cannot be modified. Rendering
+        # the task spec does not modify it and the rendered action specs do not share any value
+        # with the task spec.
+        task_spec = self.compiled.spec.tasks.get_task(task_id)
         task_spec, action_specs = task_spec.render(task_ctx)
 
         task = {
@@ -605,6 +1562,24 @@ class WorkflowConductor(object):
 
         return task
 
+    def _detach_task(self, task, state=None):
+        # The task is rendered from a context that shares values with the contexts in the
+        # workflow state. The context and the action specs are copied before the task is
+        # returned so changes by the caller do not affect the workflow state. The view of the
+        # workflow state is replaced with the given serialized workflow state or, if it is not
+        # given, with the serialized view. The action specs of a with items task are rendered
+        # on demand and are returned as a list.
+        state_view = task["ctx"]["__state"]
+        task_ctx = {k: v for k, v in task["ctx"].items() if k != "__state"}
+        task["ctx"] = json_util.deepcopy(task_ctx)
+        task["ctx"]["__state"] = state if state is not None else state_view.toDict()
+        task["actions"] = json_util.deepcopy(list(task["actions"]))
+
+        return task
+
+    def get_task(self, task_id, route):
+        return self._detach_task(self._get_task(task_id, route))
+
     def _evaluate_task_actions(self, task):
         task_id = task["id"]
         task_route = task["route"]
@@ -618,23 +1593,23 @@ class WorkflowConductor(object):
 
         # Prepare the staging task to track items execution status.
         if "items" not in staged_task or not staged_task["items"]:
-            staged_task["items"] = [{"status": statuses.UNSET}] * task["items_count"]
+            staged_task["items"] = StagedTaskItems(task["items_count"])
+            self.workflow_state.mark_changed("staged")
 
-        # Trim the list of actions in the task per concurrency policy.
-        all_items = list(zip(task["actions"], staged_task["items"]))
-        notrun_items = list(filter(lambda x: x[1]["status"] == statuses.UNSET, all_items))
-        active_items = list(filter(lambda x: x[1]["status"] in statuses.ACTIVE_STATUSES, all_items))
+        # Trim the list of actions in the task per concurrency policy. The action specs of
+        # the items are rendered on access so only the items that are selected get rendered.
+        items = staged_task["items"]
 
         if task["concurrency"] is not None:
             # Concurrency below 1 prevents scheduling of tasks.
             if task["concurrency"] <= 0:
                 task["concurrency"] = 1
-            availability = task["concurrency"] - len(active_items)
-            candidates = list(zip(*notrun_items[:availability]))
-            task["actions"] = list(candidates[0]) if candidates and availability > 0 else []
+            availability = task["concurrency"] - items.count_statuses(statuses.ACTIVE_STATUSES)
+            candidates = items.get_indices(statuses.UNSET, limit=availability)
         else:
-            candidates = list(zip(*notrun_items))
-            task["actions"] = list(candidates[0]) if candidates else []
+            candidates = items.get_indices(statuses.UNSET)
+
+        task["actions"] = [task["actions"][i] for i in candidates if i < task["items_count"]]
 
         return task
 
@@ -706,10 +1681,13 @@ class WorkflowConductor(object):
         # Return the list of tasks that are staged and readied. If there is exception on
         # task rendering, then log the error and continue. This allows user to know about
         # all task rendering errors for this task transition instead of getting rendering
-        # error one at a time during runtime.
+        # error one at a time during runtime. The workflow state is serialized once and the
+        # copy is shared by the contexts of the tasks that are returned.
+        state = None
+
         for staged_task in remediation_tasks or staged_tasks:
             try:
-                next_task = self.get_task(staged_task["id"], staged_task["route"])
+                next_task = self._get_task(staged_task["id"], staged_task["route"])
                 next_task = self._evaluate_task_actions(next_task)
 
                 # Assign the task retry delay which will overwrite any task delay
@@ -717,10 +1695,13 @@ class WorkflowConductor(object):
                 if "retry" in staged_task:
                     next_task["delay"] = staged_task["retry"].get("delay") or 0
 
-                if "actions" in next_task and len(next_task["actions"]) > 0:
-                    next_tasks.append(next_task)
-                elif "items_count" in next_task and next_task["items_count"] == 0:
-                    next_tasks.append(next_task)
+                if ("actions" in next_task and len(next_task["actions"]) > 0) or (
+                    "items_count" in next_task and next_task["items_count"] == 0
+                ):
+                    if state is None:
+                        state = next_task["ctx"]["__state"].toDict()
+
+                    next_tasks.append(self._detach_task(next_task, state=state))
             except Exception as e:
                 fail_on_task_rendering = True
                 self.log_error(e, task_id=staged_task["id"], route=staged_task["route"])
@@ -748,7 +1729,7 @@ class WorkflowConductor(object):
 
     def make_task_context(self, task_state_entry, task_result=None):
         in_ctx_idxs = task_state_entry["ctxs"]["in"]
-        in_ctx_val = self.get_task_context(in_ctx_idxs)
+        in_ctx_val = self._get_task_context(in_ctx_idxs)
 
         current_task = {
             "id": task_state_entry["id"],
@@ -757,25 +1738,85 @@ class WorkflowConductor(object):
         }
 
         current_ctx = ctx_util.set_current_task(in_ctx_val, current_task)
-        state_ctx = {"__state": self.workflow_state.serialize()}
+        state_ctx = {"__state": self.workflow_state.get_view()}
         current_ctx = dict_util.merge_dicts(current_ctx, state_ctx, True)
 
         return current_ctx
 
-    def make_task_result(self, task_spec, event):
+    def make_task_result(self, task_spec, event, task_id=None, route=None, items=None):
         # Format task result depending on the type of task.
         if not task_spec.has_items():
             task_result = event.result
+        elif not isinstance(event, events.TaskItemActionExecutionEvent):
+            task_result = event.result or []
+        elif event.accumulated_result is None and self.task_item_result_store.has_results(
+            task_id, route
+        ):
+            # If the event does not include the accumulated result, then assemble the
+            # accumulated result from the item results in the result store. The result
+            # of every item that is completed must be in the result store.
+            items = items or []
+            completed_item_ids = [
+                i for i, item in enumerate(items) if item["status"] in statuses.COMPLETED_STATUSES
+            ]
+
+            task_result = self.task_item_result_store.get_accumulated_result(
+                task_id, route, len(items), item_ids=completed_item_ids
+            )
         else:
             # For with items task, use the accumulated result from the event.
-            task_result = (
-                event.accumulated_result or []
-                if isinstance(event, events.TaskItemActionExecutionEvent)
-                else event.result or []
-            )
+            task_result = event.accumulated_result or []
 
         return task_result
 
+    def _validate_task_item(self, task_id, route, staged_task, item_id):
+        if not staged_task or not staged_task.get("items"):
+            raise exc.InvalidTaskStateEntry(task_id)
+
+        items_count = len(staged_task["items"])
+
+        if not isinstance(item_id, int) or item_id < 0 or item_id >= items_count:
+            raise exc.InvalidTaskItem(task_id, route, item_id)
+
+    def _validate_task_item_results(self, task_id, route, staged_task, event):
+        # The accumulated result is assembled from the item results in the result store when
+        # the task is completed. Validate that the result of every item that is completed,
+        # including the item of the event, is in the result store before the workflow state is
+        # updated so a missing result does not leave the workflow state partially updated.
+        if not isinstance(event, events.TaskItemActionExecutionEvent) or not staged_task:
+            return
+
+        self._validate_task_item(task_id, route, staged_task, event.item_id)
+
+        if event.accumulated_result is not None or not self.task_item_result_store.has_results(
+            task_id, route
+        ):
+            return
+
+        items = staged_task["items"]
+        item_ids = set()
+
+        for status in statuses.COMPLETED_STATUSES:
+            item_ids.update(items.get_indices(status))
+
+        if event.status in statuses.COMPLETED_STATUSES:
+            item_ids.add(event.item_id)
+        else:
+            item_ids.discard(event.item_id)
+
+        self.task_item_result_store.validate_item_results(task_id, route, sorted(item_ids))
+
+    def add_task_item_result(self, task_id, route, item_id, result):
+        # Add the result of a single item of a with items task to the result store. This is
+        # used in place of the accumulated result in the task item action execution event.
+        if not self.graph.has_task(task_id):
+            raise exc.InvalidTask(task_id)
+
+        staged_task = self.workflow_state.get_staged_task(task_id, route)
+        self._validate_task_item(task_id, route, staged_task, item_id)
+        self.task_item_result_store.add_item_result(task_id, route, item_id, result)
+        self.mark_changed("item_results")
+
     def setup_retry_in_task_state(self, task_state_entry, in_ctx_idxs):
         # Setup the retry in the task state.
         task_id = task_state_entry["id"]
@@ -784,7 +1825,7 @@ class WorkflowConductor(object):
         task_state_entry["retry"]["tally"] = 0
 
         # Get task context for evaluating the expression in delay and count.
-        in_ctx = self.get_task_context(in_ctx_idxs)
+        in_ctx = self._get_task_context(in_ctx_idxs)
 
         # Evaluate the retry delay value.
         if "delay" in task_state_entry["retry"] and isinstance(
@@ -819,7 +1860,7 @@ class WorkflowConductor(object):
             "id": task_id,
             "route": route,
             "ctxs": {"in": in_ctx_idxs},
-            "prev": prev or {},
+            "prev": dict(prev) if prev else {},
             "next": {},
         }
 
@@ -828,9 +1869,7 @@ class WorkflowConductor(object):
             self.setup_retry_in_task_state(task_state_entry, in_ctx_idxs)
 
         # Append the task state entry to the list of task execution.
-        task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))
-        self.workflow_state.sequence.append(task_state_entry)
-        self.workflow_state.tasks[task_state_entry_id] = len(self.workflow_state.sequence) - 1
+        self.workflow_state.add_task_state_entry(task_state_entry)
 
         return task_state_entry
 
@@ -856,6 +1895,9 @@ class WorkflowConductor(object):
         if not staged_task and not task_state_entry:
             raise exc.InvalidTaskStateEntry(task_id)
 
+        # Throw exception if the item or the results of the items are not valid.
+        self._validate_task_item_results(task_id, route, staged_task, event)
+
         # Create new task state entry if it does not exist or if it is an engine command.
         if not task_state_entry or task_id in events.ENGINE_EVENT_MAP.keys():
             task_state_entry = self.add_task_state(
@@ -888,6 +1930,9 @@ class WorkflowConductor(object):
             # Update the index value since a new entry is created.
             task_state_idx = self._get_task_state_idx(task_id, route)
 
+        # Flag the task state entry as changed for tracking of changes to the workflow state.
+        self.workflow_state.mark_task_state_changed(task_state_entry)
+
         # Remove task from staging if task is not with items.
         if event.status and staged_task and "items" not in staged_task:
             self.workflow_state.remove_staged_task(task_id, route)
@@ -896,7 +1941,8 @@ class WorkflowConductor(object):
         # Result for each item is not recorded in the staged_task because it impacts database
         # write performance if there are a lot of items and/or item result size is huge.
         if staged_task and isinstance(event, events.TaskItemActionExecutionEvent):
-            staged_task["items"][event.item_id] = {"status": event.status}
+            staged_task["items"].set_status(event.item_id, event.status)
+            self.workflow_state.mark_changed("staged")
 
         # Log the error if it is a failed execution event.
         if event.status == statuses.FAILED:
@@ -930,14 +1976,26 @@ class WorkflowConductor(object):
         if new_task_status in statuses.COMPLETED_STATUSES:
             # Remove task from staging if exists but keep and flag entry
             # if task has items and failed for manual rerun.
-            if not (task_spec.has_items() and new_task_status in statuses.ABENDED_STATUSES):
+            rerunnable = task_spec.has_items() and new_task_status in statuses.ABENDED_STATUSES
+
+            if not rerunnable:
                 self.workflow_state.remove_staged_task(task_id, route)
             else:
                 staged_task = self.workflow_state.get_staged_task(task_id, route)
                 staged_task["completed"] = True
+                self.workflow_state.mark_changed("staged")
 
             # Format task result depending on the type of task.
-            task_result = self.make_task_result(task_spec, event)
+            items = staged_task.get("items") if staged_task else None
+
+            task_result = self.make_task_result(
+                task_spec, event, task_id=task_id, route=route, items=items
+            )
+
+            # Clear the item results unless the task is kept in staging for rerun.
+            if task_spec.has_items() and not rerunnable:
+                self.task_item_result_store.clear(task_id, route)
+                self.mark_changed("item_results")
 
             # Set current task in the context.
             current_ctx = self.make_task_context(task_state_entry, task_result=task_result)
@@ -983,13 +2041,12 @@ class WorkflowConductor(object):
 
                 # If criteria met, then mark the next task staged and calculate outgoing context.
                 if task_state_entry["next"][task_transition_id]:
-                    next_task_node = self.graph.get_task(task_transition[1])
-                    next_task_id = next_task_node["id"]
+                    next_task_id = task_transition[1]
                     new_ctx_idx = None
 
                     # Get and process new context for the task transition.
                     out_ctx, new_ctx, errors = task_spec.finalize_context(
-                        next_task_id, task_transition, json_util.deepcopy(current_ctx)
+                        next_task_id, task_transition, current_ctx
                     )
 
                     if errors:
@@ -1055,6 +2112,8 @@ class WorkflowConductor(object):
                         == constants.INBOUND_CRITERIA_SATISFIED
                     )
 
+                    self.workflow_state.mark_changed("staged")
+
                     # Put the next task in the engine event queue if it is an engine command.
                     if next_task_id in events.ENGINE_EVENT_MAP.keys():
                         queue_entry = (staged_next_task["id"], staged_next_task["route"])
@@ -1081,6 +2140,7 @@ class WorkflowConductor(object):
             if has_manual_fail:
                 for staged_next_task in staged_next_tasks:
                     staged_next_task["run_on_fail"] = True
+                    self.workflow_state.mark_changed("staged")
 
         # Process the task event using the workflow state machine and update the workflow status.
         task_ex_event = events.TaskExecutionEvent(task_id, route, task_state_entry["status"])
@@ -1144,27 +2204,52 @@ class WorkflowConductor(object):
 
         return False
 
-    def get_task_context(self, ctx_idxs):
-        ctx = {}
+    def _get_task_context(self, ctx_idxs):
+        # The list of contexts in the workflow state is append only so the merged context for
+        # the same list of context indices never changes. The merged context is cached and
+        # layered on top of the longest cached prefix of the list without copying the prefix.
+        # The cached context shares values with the prefix and the workflow state contexts
+        # and must not be modified by the caller. The expression evaluators are only given
+        # immutable or copied values so the expressions cannot modify the shared values.
+        key = tuple(ctx_idxs)
+        ctx = self._task_ctx_cache.get(key)
+
+        if ctx is not None:
+            return ctx
+
+        prefix_len = max(len(key) - 1, 0)
+
+        while prefix_len > 0 and key[:prefix_len] not in self._task_ctx_cache:
+            prefix_len -= 1
+
+        ctx = self._task_ctx_cache.get(key[:prefix_len]) if prefix_len else {}
 
-        for ctx_idx in ctx_idxs:
-            ctx = dict_util.merge_dicts(ctx, self.workflow_state.contexts[ctx_idx], overwrite=True)
+        for ctx_idx in key[prefix_len:]:
+            ctx = dict_util.layer_dicts(ctx, self.workflow_state.contexts[ctx_idx], overwrite=True)
+
+        self._task_ctx_cache.put(key, ctx)
 
         return ctx
 
-    def get_task_initial_context(self, task_id, route):
+    def get_task_context(self, ctx_idxs):
+        return json_util.deepcopy(self._get_task_context(ctx_idxs))
+
+    def _get_task_initial_context(self, task_id, route):
         staged_task = self.workflow_state.get_staged_task(task_id, route)
 
         if staged_task:
-            return self.get_task_context(staged_task["ctxs"]["in"])
+            return self._get_task_context(staged_task["ctxs"]["in"])
 
         task_state_entry = self.get_task_state_entry(task_id, route)
 
         if task_state_entry:
-            return self.get_task_context(task_state_entry["ctxs"]["in"])
+            return self._get_task_context(task_state_entry["ctxs"]["in"])
 
         raise ValueError('Unable to determine context for task "%s".' % task_id)
 
+    def get_task_initial_context(self, task_id, route):
+        return json_util.deepcopy(self._get_task_initial_context(task_id, route))
+
     def get_task_transition_contexts(self, task_id, route):
         contexts = {}
 
@@ -1193,23 +2278,28 @@ class WorkflowConductor(object):
         # Reset terminal status for the rerunnable candidate.
         task.pop("term", None)
         task.pop("ignore", None)
+        self.workflow_state.mark_task_state_changed(task)
 
         # Reset staged task for the rerunnable candidate.
         staged_task = self.workflow_state.get_staged_task(task_id, route)
 
         if staged_task:
             staged_task.pop("completed", None)
+            self.workflow_state.mark_changed("staged")
 
         # Reset the list of errors for the task.
         for e in [e for e in self.errors if e.get("task_id", None) == task_id]:
             self.errors.remove(e)
+            self.mark_changed("errors")
 
         # If task has items, then use existing staged task entry and reset failed items.
         if task_spec.has_items():
             staged_task = self.workflow_state.get_staged_task(task_id, route)
-            for item in staged_task.get("items", []):
-                if reset_items or item["status"] in statuses.ABENDED_STATUSES:
-                    item["status"] = statuses.UNSET
+            if staged_task.get("items"):
+                staged_task["items"].reset_statuses(
+                    None if reset_items else statuses.ABENDED_STATUSES
+                )
+                self.workflow_state.mark_changed("staged")
         # Otherwise, add a new task state entry and stage task to be returned in get_next_tasks.
         else:
             self.add_task_state(task_id, route, in_ctx_idxs=task_ctx, prev=task_prev)
@@ -1218,6 +2308,7 @@ class WorkflowConductor(object):
         # Reset terminal status for the task branch which will also be rerun.
         for _, next_task in self.workflow_state.get_task_sequence(task_id, route):
             next_task.pop("term", None)
+            self.workflow_state.mark_task_state_changed(next_task)
 
     def _collapse_task_rerun_requests(self, tasks=None):
         # Get the subsequent sequence of tasks that already ran for each task in the task requests.
@@ -1233,10 +2324,14 @@ class WorkflowConductor(object):
         # task rerun requests. If they are not collapsed/consolidated, then the rerun
         # will result in multiple branches of executions.
         if len(tasks) > 1:
-            # The for loops below identify task requests that have subsequent task sequences
-            # not in other task requests.
+            # Identify task requests that have subsequent task sequences not in other task
+            # requests. The sequences are converted to sets once for the comparisons below.
+            seqs = {k: set(i) for k, i in result.items()}
+
             result = {
-                k: i for k, i in result.items() for j in result.values() if len(set(i) - set(j)) > 0
+                k: i
+                for k, i in result.items()
+                if any(not seqs[k].issubset(j) for j in seqs.values())
             }
 
         return result
@@ -1265,18 +2360,21 @@ class WorkflowConductor(object):
             }
         # Otherwise if the list of tasks is provided, then filter the list of rerun candidates.
         else:
+            collapsed_tasks = self._collapse_task_rerun_requests(tasks)
+
             rerunnable_candidates = {
                 k: (
                     self._get_task_state_idx(t.task_id, t.route),
                     self.workflow_state.get_task(t.task_id, t.route),
                 )
                 for k, t in tasks.items()
-                if k in self._collapse_task_rerun_requests(tasks)
+                if k in collapsed_tasks
             }
 
         # Keep record of which task sequence(s) is being rerun in the workflow state.
         rerun_entry = [i for i, t in rerunnable_candidates.values()]
         self.workflow_state.reruns.append(rerun_entry)
+        self.workflow_state.mark_changed("reruns")
 
         # Setup task candidates for rerun.
         sorted_rerunnable_candidates = sorted(
@@ -1299,6 +2397,7 @@ class WorkflowConductor(object):
         for _, task in sorted(continuable_candidates.items(), key=lambda x: x[0]):
             # Reset terminal status for the continuable candidate.
             task.pop("term", None)
+            self.workflow_state.mark_task_state_changed(task)
 
         # Reset the workflow output.
         self.reset_workflow_output()
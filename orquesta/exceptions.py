@@ -72,6 +72,12 @@ class AmbiguousTaskTransition(OrquestaException):
         OrquestaException.__init__(self, message)
 
 
+class WorkflowGraphFrozenError(OrquestaException):
+    def __init__(self):
+        message = "The workflow graph is frozen and cannot be modified."
+        super(WorkflowGraphFrozenError, self).__init__(message)
+
+
 class InvalidEventType(OrquestaException):
     def __init__(self, type_name, event_name):
         message = 'Event type "%s" with event "%s" is not valid.' % (type_name, event_name)
@@ -128,6 +134,10 @@ class WorkflowLogEntryError(OrquestaException):
     pass
 
 
+class WorkflowCheckpointError(OrquestaException):
+    pass
+
+
 class WorkflowIsActiveAndNotRerunableError(OrquestaException):
     def __init__(self):
         message = "Unable to rerun workflow because it is not in a completed state."
@@ -146,6 +156,18 @@ class InvalidTaskRerunRequest(OrquestaException):
         super(InvalidTaskRerunRequest, self).__init__(message % tasks_str)
 
 
+class InvalidTaskItem(OrquestaException):
+    def __init__(self, task_id, route, item_id):
+        message = 'The item %s of task|route "%s|%s" does not exist.'
+        super(InvalidTaskItem, self).__init__(message % (item_id, task_id, route))
+
+
+class TaskItemResultsError(OrquestaException):
+    def __init__(self, task_id, route, item_ids):
+        message = 'The results of the items %s of task|route "%s|%s" are missing.'
+        super(TaskItemResultsError, self).__init__(message % (item_ids, task_id, route))
+
+
 class UnreachableJoinError(OrquestaException):
     def __init__(self, task_id, route):
         message = 'The join task|route "%s|%s" is partially satisfied but unreachable.'
@@ -154,3 +176,15 @@ class UnreachableJoinError(OrquestaException):
 
 class WorkflowRehearsalError(OrquestaException):
     pass
+
+
+class ContentNotFoundError(OrquestaException):
+    def __init__(self, content_hash):
+        message = 'The content "%s" is not found.'
+        super(ContentNotFoundError, self).__init__(message % content_hash)
+
+
+class ContentHashMismatchError(OrquestaException):
+    def __init__(self, content_hash, actual_hash):
+        message = 'The content "%s" does not match its hash. The hash of the content is "%s".'
+        super(ContentHashMismatchError, self).__init__(message % (content_hash, actual_hash))
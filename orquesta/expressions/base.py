@@ -16,6 +16,7 @@
 # limitations under the License.
 
 import abc
+import collections.abc
 import inspect
 import logging
 import re
@@ -23,6 +24,7 @@ import threading
 
 from stevedore import extension
 
+from orquesta.utils import cache as cache_util
 from orquesta.utils import expression as expr_util
 from orquesta.utils import plugin as plugin_util
 
@@ -33,11 +35,108 @@ _EXP_EVALUATORS = None
 _EXP_EVALUATORS_LOCK = threading.Lock()
 _EXP_EVALUATOR_NAMESPACE = "orquesta.expressions.evaluators"
 
+# The lookup expressions are calls to ctx, item, or result with an optional key and followed by
+# an optional path of attributes, for example, ctx(foo).bar or item('x'). The names that are
+# keywords in any of the expression languages or private are not recognized.
+_LOOKUP_NAME = r"[a-zA-Z_][a-zA-Z0-9_]*"
+_LOOKUP_REGEX = re.compile(
+    r"^(ctx|item|result)\(\s*(?:'([^'\\]*)'|\"([^\"\\]*)\"|({name}))?\s*\)((?:\.{name})*)$".format(
+        name=_LOOKUP_NAME
+    )
+)
+_LOOKUP_KEYWORDS = [
+    "and",
+    "mod",
+    "or",
+    "not",
+    "in",
+    "is",
+    "if",
+    "else",
+    "true",
+    "false",
+    "null",
+    "none",
+    "True",
+    "False",
+    "None",
+]
+_LOOKUP_CACHE = cache_util.LRUCache(maxsize=1024)
+
 
 class Evaluator(metaclass=abc.ABCMeta):
     _type = "unspecified"
     _delimiter = None
 
+    # The parsed expressions are cached by text and shared by all evaluations in the process.
+    # Each evaluator declares its own caches by name with create_caches. Only the texts from
+    # the workflow specs are cached. The texts from the data, such as the results of the
+    # expressions, and the texts longer than the max length are parsed every time.
+    cache_size = 1024
+    cache_max_text_length = 4096
+    _caches = {}
+
+    @classmethod
+    def set_cache_size(cls, maxsize):
+        for cache in cls._caches.values():
+            cache.resize(maxsize)
+
+    @classmethod
+    def get_cache_stats(cls):
+        return {name: cache.get_stats() for name, cache in cls._caches.items()}
+
+    @classmethod
+    def clear_cache(cls):
+        for cache in cls._caches.values():
+            cache.clear()
+
+    @classmethod
+    def _get_cached(cls, name, text, parse, cache=True):
+        if not cache or len(text) > cls.cache_max_text_length:
+            return parse(text)
+
+        value = cls._caches[name].get(text)
+
+        if value is None:
+            value = parse(text)
+            cls._caches[name].put(text, value)
+
+        return value
+
+    # The lookup expressions such as ctx(foo).bar are evaluated by traversing the data without
+    # the expression engine. The evaluator sets whether keys without quotes are recognized,
+    # whether the path stops at the attributes of the value, and how the value is copied.
+    _lookup_bare_keys = False
+    _lookup_attributes = False
+
+    @classmethod
+    def _copy_lookup_output(cls, value):
+        return value
+
+    @classmethod
+    def _lookup_has_expressions(cls, value):
+        return cls.has_expressions(value)
+
+    @classmethod
+    def _evaluate_lookup(cls, expr, data):
+        # Return a tuple of whether the lookup is evaluated and the value. If the expression is
+        # not a lookup or the lookup cannot be evaluated directly, then it is to be evaluated by
+        # the expression engine.
+        lookup = parse_lookup(cls.strip_delimiter(expr), bare_keys=cls._lookup_bare_keys)
+
+        if not lookup:
+            return False, None
+
+        found, value = evaluate_lookup(lookup, data, attributes=cls._lookup_attributes)
+
+        if not found or (isinstance(value, str) and cls._lookup_has_expressions(value)):
+            return False, None
+
+        try:
+            return True, cls._copy_lookup_output(value)
+        except TypeError:
+            return False, None
+
     @classmethod
     def get_type(cls):
         return cls._type
@@ -70,6 +169,10 @@ class Evaluator(metaclass=abc.ABCMeta):
         raise NotImplementedError()
 
 
+def create_caches(*names):
+    return {name: cache_util.LRUCache(maxsize=Evaluator.cache_size) for name in names}
+
+
 def get_evaluator(language):
     return plugin_util.get_module(_EXP_EVALUATOR_NAMESPACE, language)
 
@@ -170,6 +273,81 @@ def extract_vars(statement):
     return sorted(list(set(variables)), key=lambda var: var[2])
 
 
+def parse_lookup(expr, bare_keys=False):
+    # Classify the expression without the delimiter as a lookup and return a tuple of the
+    # function, the key, and the path of attributes. Return None if the expression is not a
+    # lookup. The key without quotes such as ctx(foo) is only recognized if bare_keys is True.
+    lookup = _LOOKUP_CACHE.get((expr, bare_keys))
+
+    if lookup is not None:
+        return lookup or None
+
+    lookup = False
+    match = _LOOKUP_REGEX.match(expr)
+
+    if match:
+        function, single_quoted_key, double_quoted_key, bare_key, path = match.groups()
+        key = single_quoted_key or double_quoted_key or bare_key or None
+        names = tuple(path.split(".")[1:]) if path else tuple()
+
+        if (
+            (bare_key is None or (bare_keys and bare_key not in _LOOKUP_KEYWORDS))
+            and (function != "result" or key is None)
+            and not any(name in _LOOKUP_KEYWORDS or name.startswith("__") for name in names)
+        ):
+            lookup = (function, key, names)
+
+    _LOOKUP_CACHE.put((expr, bare_keys), lookup)
+
+    return lookup or None
+
+
+def evaluate_lookup(lookup, data, attributes=False):
+    # Evaluate the lookup by traversing the data directly and return a tuple of whether the
+    # value is found and the value. If the value is not found, then the expression is to be
+    # evaluated by the expression engine so the error is the same. If attributes is True, then
+    # the path is not traversed when the attribute is also an attribute of the value, for
+    # example, the items method of a dict.
+    function, key, names = lookup
+
+    if not isinstance(data, collections.abc.Mapping):
+        return False, None
+
+    if function == "ctx" and key is None:
+        value = {k: v for k, v in data.items() if not k.startswith("__")}
+    elif function == "ctx":
+        if key not in data or key.startswith("__"):
+            return False, None
+
+        value = data[key]
+    elif function == "item":
+        value = data.get("__current_item")
+
+        if key is not None:
+            if not isinstance(value, collections.abc.Mapping) or key not in value:
+                return False, None
+
+            value = value[key]
+    else:
+        current_task = data.get("__current_task")
+
+        if not current_task or not isinstance(current_task, collections.abc.Mapping):
+            return False, None
+
+        value = current_task.get("result")
+
+    for name in names:
+        if not isinstance(value, collections.abc.Mapping) or name not in value:
+            return False, None
+
+        if attributes and hasattr(value, name):
+            return False, None
+
+        value = value[name]
+
+    return True, value
+
+
 def func_has_ctx_arg(func):
     getargspec = inspect.getfullargspec  # pylint: disable=no-member
 
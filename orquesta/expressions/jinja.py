@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections.abc
+import copy
 import functools
 import inspect
 import itertools
@@ -32,15 +34,93 @@ from orquesta.utils import strings as str_util
 LOG = logging.getLogger(__name__)
 
 
+# The decorator for functions that are passed the context of the evaluation is renamed in 3.0.
+pass_context = getattr(jinja2, "pass_context", None) or jinja2.contextfunction
+
+
+def bind_context(func):
+    @functools.wraps(func)
+    def bound_func(context, *args, **kwargs):
+        return func(context, *args, **kwargs)
+
+    return pass_context(bound_func)
+
+
 def register_functions(env):
     catalog = func_base.load()
 
     for name, func in catalog.items():
         env.filters[name] = func
 
+        # The functions are registered as globals so they do not have to be added to the context
+        # of every evaluation. The functions that take the context are identified here once and
+        # Jinja passes the context of the evaluation to them when they are called.
+        env.globals[name] = bind_context(func) if expr_base.func_has_ctx_arg(func) else func
+
     return catalog
 
 
+def copy_input_data(obj):
+    # Copy the dicts, lists, and tuples in the data and keep the type of every value.
+    if obj is None or isinstance(obj, (str, bool, int, float)):
+        return obj
+
+    if isinstance(obj, dict):
+        return {k: copy_input_data(v) for k, v in obj.items()}
+
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(copy_input_data(v) for v in obj)
+
+    return copy.deepcopy(obj)
+
+
+class LazyCopyDict(collections.abc.Mapping):
+    # A read-only view of a dict that copies the value of a key on first access and keeps the
+    # copy. The data is shared with the contexts in the workflow state and Jinja expressions can
+    # call methods that modify the values in place, so the expressions are only given copies of
+    # the values that they read. The values of the keys in passthrough are returned as is.
+
+    def __init__(self, data, passthrough=None):
+        self._d = data
+        self._copied = {}
+        self._passthrough = passthrough or []
+
+    def __getitem__(self, key):
+        if key in self._copied:
+            return self._copied[key]
+
+        value = self._d[key]
+
+        if key not in self._passthrough:
+            value = copy_input_data(value)
+
+        self._copied[key] = value
+
+        return value
+
+    def __contains__(self, key):
+        return key in self._d
+
+    def __iter__(self):
+        return iter(self._d)
+
+    def __len__(self):
+        return len(self._d)
+
+    def __repr__(self):
+        return repr(self.toDict())
+
+    def __copy__(self):
+        return self.toDict()
+
+    def __deepcopy__(self, memo):
+        return self.toDict()
+
+    def toDict(self):
+        # The method name is the hook used by ujson to serialize custom objects.
+        return {k: self[k] for k in self}
+
+
 class JinjaGrammarException(exc.ExpressionGrammarException):
     pass
 
@@ -86,18 +166,35 @@ class JinjaEvaluator(expr_base.Evaluator):
 
     _custom_functions = register_functions(_jinja_env)
 
+    _caches = expr_base.create_caches("expressions", "templates")
+
+    @classmethod
+    def _compile_expression(cls, expr, cache=True):
+        return cls._get_cached(
+            "expressions",
+            expr,
+            lambda e: cls._jinja_env.compile_expression(e, undefined_to_none=False),
+            cache=cache,
+        )
+
+    @classmethod
+    def _compile_template(cls, text, cache=True):
+        return cls._get_cached("templates", text, cls._jinja_env.from_string, cache=cache)
+
+    _lookup_attributes = True
+
     @classmethod
     def contextualize(cls, data):
         ctx = {"__vars": data}
 
-        if isinstance(data, dict):
+        # The values are copied when they are read by the expression. The workflow state under
+        # __state is a read-only view that copies the entries when they are read.
+        if isinstance(data, collections.abc.Mapping):
+            ctx["__vars"] = LazyCopyDict(data, passthrough=["__state"])
             ctx["__state"] = ctx["__vars"].get("__state")
             ctx["__current_task"] = ctx["__vars"].get("__current_task")
             ctx["__current_item"] = ctx["__vars"].get("__current_item")
 
-        for name, func in cls._custom_functions.items():
-            ctx[name] = functools.partial(func, ctx) if expr_base.func_has_ctx_arg(func) else func
-
         return ctx
 
     @classmethod
@@ -146,22 +243,21 @@ class JinjaEvaluator(expr_base.Evaluator):
         return errors
 
     @classmethod
-    def _evaluate_and_expand(cls, text, data=None):
+    def _evaluate_and_expand(cls, text, data=None, cache=True):
         exprs = cls._regex_parser.findall(text)
         block_exprs = cls._regex_block_parser.findall(text)
         ctx = cls.contextualize(data)
-        opts = {"undefined_to_none": False}
 
         try:
             # If there is a Jinja block expression in the text, then process the whole text.
             if block_exprs:
                 expr = text
-                output = cls._jinja_env.from_string(expr).render(ctx)
+                output = cls._compile_template(expr, cache=cache).render(ctx)
                 output = str_util.unicode(output)
 
                 # Traverse and evaulate again in case additional inline epxressions are
                 # introduced after the jinja block is evaluated.
-                output = cls._evaluate_and_expand(output, data)
+                output = cls._evaluate_and_expand(output, data, cache=False)
             else:
                 # The output will first be the original text and the expressions
                 # will be substituted by the evaluated value.
@@ -170,14 +266,14 @@ class JinjaEvaluator(expr_base.Evaluator):
                 # Evaluate inline jinja expressions first.
                 for expr in exprs:
                     stripped = cls.strip_delimiter(expr)
-                    compiled = cls._jinja_env.compile_expression(stripped, **opts)
-                    result = compiled(**ctx)
+                    result = cls._compile_expression(stripped, cache=cache)(**ctx)
 
                     if inspect.isgenerator(result):
                         result = list(result)
 
+                    # The expressions in the result are from the data and are not cached.
                     if isinstance(result, str):
-                        result = cls._evaluate_and_expand(result, data)
+                        result = cls._evaluate_and_expand(result, data, cache=False)
 
                     # For StrictUndefined values, UndefinedError only gets raised when the value is
                     # accessed, not when it gets created. The simplest way to access it is to try
@@ -203,9 +299,17 @@ class JinjaEvaluator(expr_base.Evaluator):
         if not isinstance(text, str):
             raise ValueError("Text to be evaluated is not typeof string.")
 
-        if data and not isinstance(data, dict):
+        if data and not isinstance(data, collections.abc.Mapping):
             raise ValueError("Provided data is not typeof dict.")
 
+        exprs = cls._regex_parser.findall(text)
+
+        if len(exprs) == 1 and exprs[0] == text:
+            found, output = cls._evaluate_lookup(text, data)
+
+            if found:
+                return output
+
         # Remove raw blocks from the expression.
         raw_blocks = cls._regex_raw_block_parser.findall(text)
 
@@ -230,7 +334,7 @@ class JinjaEvaluator(expr_base.Evaluator):
 
             # Evaluate the raw blocks.
             ctx = cls.contextualize(data)
-            output = cls._jinja_env.from_string(output).render(ctx)
+            output = cls._compile_template(output, cache=False).render(ctx)
 
         return output
 
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections.abc
 import inspect
 import itertools
 import logging
@@ -41,6 +42,63 @@ def register_functions(ctx):
     return catalog
 
 
+def convert_input_data(obj, rec=None):
+    # Convert the data to the hashable types that yaql expects. The dicts are wrapped in a
+    # LazyFrozenDict so their values are only converted when they are read by the expression.
+    if isinstance(obj, yaql_utils.MappingType):
+        return LazyFrozenDict(obj)
+
+    return yaql_utils.convert_input_data(obj, rec=convert_input_data)
+
+
+def copy_output_data(obj):
+    # Copy the data the same way as the data is converted into and out of the yaql engine. Raise
+    # TypeError for the types that are not copied here so the data is evaluated by the engine.
+    if obj is None or isinstance(obj, (str, bool, int, float)):
+        return obj
+
+    if isinstance(obj, yaql_utils.MappingType):
+        return {copy_output_data(k): copy_output_data(v) for k, v in obj.items()}
+
+    if isinstance(obj, (list, tuple)):
+        return [copy_output_data(v) for v in obj]
+
+    raise TypeError("The type %s is not supported." % type(obj).__name__)
+
+
+class LazyFrozenDict(yaql_utils.FrozenDict):
+    # A read-only view of a dict that converts the value of a key on first access and keeps the
+    # converted value. The values of the keys in passthrough are returned as is.
+
+    def __init__(self, data, passthrough=None):
+        self._d = data
+        self._converted = {}
+        self._passthrough = passthrough or []
+        self._hash = None
+
+    def __getitem__(self, key):
+        if key in self._converted:
+            return self._converted[key]
+
+        value = self._d[key]
+
+        if key not in self._passthrough:
+            value = convert_input_data(value)
+
+        self._converted[key] = value
+
+        return value
+
+    def __contains__(self, key):
+        return key in self._d
+
+    def get(self, key, default=None):
+        return self[key] if key in self._d else default
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 class YaqlGrammarException(exc.ExpressionGrammarException):
     pass
 
@@ -77,6 +135,28 @@ class YAQLEvaluator(expr_base.Evaluator):
     _root_ctx = yaql.create_context()
     _custom_functions = register_functions(_root_ctx)
 
+    _caches = expr_base.create_caches("expressions", "findall")
+
+    @classmethod
+    def _findall(cls, text, cache=True):
+        return cls._get_cached(
+            "findall", text, lambda t: tuple(cls._regex_parser.findall(t)), cache=cache
+        )
+
+    @classmethod
+    def _parse(cls, expr, cache=True):
+        return cls._get_cached("expressions", expr, cls._engine, cache=cache)
+
+    _lookup_bare_keys = True
+
+    @classmethod
+    def _copy_lookup_output(cls, value):
+        return copy_output_data(value)
+
+    @classmethod
+    def _lookup_has_expressions(cls, value):
+        return len(cls._findall(value, cache=False)) > 0
+
     @classmethod
     def contextualize(cls, data):
         ctx = cls._root_ctx.create_child_context()
@@ -84,8 +164,13 @@ class YAQLEvaluator(expr_base.Evaluator):
         # Some yaql expressions (e.g. distinct()) refer to hash value of variable.
         # But some built-in Python type values (e.g. list and dict) don't have __hash__() method.
         # The convert_input_data method parses specified variable and convert it to hashable one.
-        if isinstance(data, yaql_utils.SequenceType) or isinstance(data, yaql_utils.MappingType):
-            ctx["__vars"] = yaql_utils.convert_input_data(data)
+        # The data is converted lazily so only the values read by the expression are converted.
+        # The workflow state under __state is only read by the workflow functions and is passed
+        # as is since converting it would require reading and copying the entire workflow state.
+        if isinstance(data, yaql_utils.MappingType):
+            ctx["__vars"] = LazyFrozenDict(data, passthrough=["__state"])
+        elif isinstance(data, yaql_utils.SequenceType):
+            ctx["__vars"] = convert_input_data(data)
         else:
             ctx["__vars"] = data or {}
 
@@ -101,7 +186,7 @@ class YAQLEvaluator(expr_base.Evaluator):
 
     @classmethod
     def has_expressions(cls, text):
-        exprs = cls._regex_parser.findall(text)
+        exprs = cls._findall(text)
 
         return exprs is not None and len(exprs) > 0
 
@@ -116,9 +201,9 @@ class YAQLEvaluator(expr_base.Evaluator):
 
         errors = []
 
-        for expr in cls._regex_parser.findall(text):
+        for expr in cls._findall(text):
             try:
-                cls._engine(cls.strip_delimiter(expr))
+                cls._parse(cls.strip_delimiter(expr))
             except (yaql_exc.YaqlException, ValueError, TypeError) as e:
                 errors.append(expr_util.format_error(cls._type, expr, e))
 
@@ -129,23 +214,35 @@ class YAQLEvaluator(expr_base.Evaluator):
         if not isinstance(text, str):
             raise ValueError("Text to be evaluated is not typeof string.")
 
-        if data and not isinstance(data, dict):
+        if data and not isinstance(data, collections.abc.Mapping):
             raise ValueError("Provided data is not typeof dict.")
 
+        return cls._evaluate(text, data)
+
+    @classmethod
+    def _evaluate(cls, text, data=None, cache=True):
         output = str_util.unicode(text)
-        exprs = cls._regex_parser.findall(text)
+        exprs = cls._findall(text, cache=cache)
+
+        if len(exprs) == 1 and exprs[0] == text:
+            found, result = cls._evaluate_lookup(text, data)
+
+            if found:
+                return result
+
         ctx = cls.contextualize(data)
 
         try:
             for expr in exprs:
                 stripped = cls.strip_delimiter(expr)
-                result = cls._engine(stripped).evaluate(context=ctx)
+                result = cls._parse(stripped, cache=cache).evaluate(context=ctx)
 
                 if inspect.isgenerator(result):
                     result = list(result)
 
+                # The expressions in the result are from the data and are not cached.
                 if isinstance(result, str):
-                    result = cls.evaluate(result, data)
+                    result = cls._evaluate(result, data, cache=False)
 
                 if len(exprs) > 1 or len(output) > len(expr):
                     output = output.replace(expr, str_util.unicode(result, force=True))
@@ -15,11 +15,9 @@
 import abc
 import logging
 
-import networkx as nx
-from networkx.readwrite import json_graph
-
 from orquesta import exceptions as exc
 from orquesta.utils import dictionary as dict_util
+from orquesta.utils import graph as graph_util
 from orquesta.utils import jsonify as json_util
 
 
@@ -27,14 +25,46 @@ LOG = logging.getLogger(__name__)
 
 
 class WorkflowGraph(metaclass=abc.ABCMeta):
+    # The type of graph that models the workflow. The native graph does not depend on networkx.
+    # The graph backed by networkx can be used instead but requires networkx to be installed.
+    graph_cls = graph_util.MultiDiGraph
+
     def __init__(self, graph=None):
         # self._graph is the graph model for the workflow. The tracking of workflow and task
         # progress and state is separate from the graph model. There are use cases where tasks
         # may be cycled and states overwritten.
-        self._graph = graph if graph else nx.MultiDiGraph()
+        self._graph = graph if graph is not None else self.graph_cls()
+        self._frozen = False
+
+    @property
+    def frozen(self):
+        return self._frozen
+
+    def freeze(self):
+        # The graph does not change after it is composed. Once frozen, the lookups used by the
+        # conductor are computed once here and the graph can no longer be modified.
+        if self._frozen:
+            return self
+
+        nodes = dict(self._graph.nodes.items())
+
+        self._next_transitions = {n: tuple(self._get_next_transitions(n)) for n in nodes}
+        self._prev_transitions = {n: tuple(self._get_prev_transitions(n)) for n in nodes}
+        self._barriers = {n: d.get("barrier") for n, d in nodes.items()}
+        self._retries = {n: d.get("retry") for n, d in nodes.items()}
+        self._tasks_in_cycle = frozenset(graph_util.get_nodes_in_cycle(self._graph))
+        self._roots = self.get_root_nodes(self._graph)
+        self._leaves = self.get_leaf_nodes(self._graph)
+        self._frozen = True
+
+        return self
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise exc.WorkflowGraphFrozenError()
 
     def serialize(self):
-        data = json_graph.adjacency_data(self._graph)
+        data = self._graph.serialize()
 
         data["adjacency"] = [
             sorted(outbounds, key=lambda x: x["id"]) for outbounds in data["adjacency"]
@@ -44,27 +74,42 @@ class WorkflowGraph(metaclass=abc.ABCMeta):
 
     @classmethod
     def deserialize(cls, data):
-        g = json_graph.adjacency_graph(json_util.deepcopy(data), directed=True, multigraph=True)
+        g = cls.graph_cls.deserialize(json_util.deepcopy(data))
         return cls(graph=g)
 
     @staticmethod
     def get_root_nodes(graph):
         nodes = [
-            {"id": n, "name": graph.nodes[n].get("name", n)}
-            for n, d in dict(graph.in_degree()).items()
-            if d == 0
+            {"id": n, "name": d.get("name", n)}
+            for n, d in graph.nodes.items()
+            if graph.get_in_degree(n) == 0
+        ]
+
+        return sorted(nodes, key=lambda x: x["id"])
+
+    @staticmethod
+    def get_leaf_nodes(graph):
+        nodes = [
+            {"id": n, "name": d.get("name", n)}
+            for n, d in graph.nodes.items()
+            if graph.get_out_degree(n) == 0
         ]
 
         return sorted(nodes, key=lambda x: x["id"])
 
     @property
     def roots(self):
+        if self._frozen:
+            return [dict(n) for n in self._roots]
+
         return self.get_root_nodes(self._graph)
 
     @property
     def leaves(self):
-        # Reverse the graph using a copy to identify the root nodes.
-        return self.get_root_nodes(self._graph.reverse(copy=True))
+        if self._frozen:
+            return [dict(n) for n in self._leaves]
+
+        return self.get_leaf_nodes(self._graph)
 
     def has_tasks(self):
         return len(self._graph) > 0
@@ -83,51 +128,48 @@ class WorkflowGraph(metaclass=abc.ABCMeta):
 
     def get_task_attributes(self, attribute):
         return dict_util.merge_dicts(
-            {n: None for n in self._graph.nodes()},
-            nx.get_node_attributes(self._graph, attribute),
+            {n: None for n in self._graph.nodes},
+            {n: d[attribute] for n, d in self._graph.nodes.items() if attribute in d},
             overwrite=True,
         )
 
     def add_task(self, task_id, **kwargs):
+        self._check_not_frozen()
+
         if not self.has_task(task_id):
             self._graph.add_node(task_id, **kwargs)
         else:
             self.update_task(task_id, **kwargs)
 
     def update_task(self, task_id, **kwargs):
+        self._check_not_frozen()
+
         if not self.has_task(task_id):
             raise exc.InvalidTask(task_id)
 
         for key, value in kwargs.items():
             self._graph.nodes[task_id][key] = value
 
-    def has_transition(self, source, destination, **kwargs):
-        edges = filter(
-            lambda e: e[0] == source and e[1] == destination,
-            self._graph.edges(data=True, keys=True),  # pylint: disable=unexpected-keyword-arg
-        )
-
-        for attr, value in kwargs.items():
-            edges = filter(lambda e: e[3].get(attr, None) == value, list(edges))
+    @staticmethod
+    def _match_transition_attributes(transition, **kwargs):
+        return all(transition[3].get(attr, None) == value for attr, value in kwargs.items())
 
-        return list(edges)
+    def has_transition(self, source, destination, **kwargs):
+        # The transitions are looked up by the source and destination and then matched by the
+        # attributes instead of filtering every transition in the graph.
+        return [
+            e
+            for e in self._graph.get_edges_between(source, destination)
+            if self._match_transition_attributes(e, **kwargs)
+        ]
 
     def get_transition(self, source, destination, key=None, **kwargs):
+        edges = self._graph.get_edges_between(source, destination)
+
         if key is not None:
-            edges = filter(
-                lambda e: e[0] == source and e[1] == destination and e[2] == key,
-                self._graph.edges(data=True, keys=True),  # pylint: disable=unexpected-keyword-arg
-            )
+            edges = [e for e in edges if e[2] == key]
         else:
-            edges = filter(
-                lambda e: e[0] == source and e[1] == destination,
-                self._graph.edges(data=True, keys=True),  # pylint: disable=unexpected-keyword-arg
-            )
-
-            for attr, value in kwargs.items():
-                edges = filter(lambda e: e[3].get(attr, None) == value, list(edges))
-
-        edges = list(edges)
+            edges = [e for e in edges if self._match_transition_attributes(e, **kwargs)]
 
         if len(edges) <= 0:
             raise exc.InvalidTaskTransition(source, destination)
@@ -138,9 +180,15 @@ class WorkflowGraph(metaclass=abc.ABCMeta):
         return edges[0]
 
     def get_transition_attributes(self, attribute):
-        return nx.get_edge_attributes(self._graph, attribute)
+        return {
+            (e[0], e[1], e[2]): e[3][attribute]
+            for e in self._graph.get_edges()
+            if attribute in e[3]
+        }
 
     def add_transition(self, source, destination, **kwargs):
+        self._check_not_frozen()
+
         if not self.has_task(source):
             self.add_task(source)
 
@@ -157,30 +205,46 @@ class WorkflowGraph(metaclass=abc.ABCMeta):
         self._graph.add_edge(source, destination, **attrs)
 
     def update_transition(self, source, destination, key, **kwargs):
+        self._check_not_frozen()
+
         seq = self.get_transition(source, destination, key=key)
 
         for attr, value in kwargs.items():
-            self._graph[source][destination][seq[2]][attr] = value
+            self._graph.get_edge(source, destination, seq[2])[attr] = value
+
+    def _get_next_transitions(self, task_id):
+        return sorted(self._graph.get_out_edges(task_id), key=lambda x: x[1])
+
+    def _get_prev_transitions(self, task_id):
+        return sorted(self._graph.get_in_edges(task_id), key=lambda x: x[1])
 
     def get_next_transitions(self, task_id):
-        return sorted(
-            [e for e in self._graph.out_edges([task_id], data=True, keys=True)], key=lambda x: x[1]
-        )
+        if self._frozen:
+            return list(self._next_transitions.get(task_id, ()))
+
+        return self._get_next_transitions(task_id)
 
     def get_prev_transitions(self, task_id):
-        return sorted(
-            [e for e in self._graph.in_edges([task_id], data=True, keys=True)], key=lambda x: x[1]
-        )
+        if self._frozen:
+            return list(self._prev_transitions.get(task_id, ()))
+
+        return self._get_prev_transitions(task_id)
 
     def get_barriers(self):
         return {
-            x[0]: x[1] for x in filter(lambda x: x[1].get("barrier"), self._graph.nodes(data=True))
+            x[0]: x[1] for x in filter(lambda x: x[1].get("barrier"), self._graph.nodes.items())
         }
 
     def set_barrier(self, task_id, value="*"):
         self.update_task(task_id, barrier=value)
 
     def get_barrier(self, task_id):
+        if self._frozen:
+            if task_id not in self._barriers:
+                raise exc.InvalidTask(task_id)
+
+            return self._barriers[task_id]
+
         return self.get_task(task_id).get("barrier")
 
     def has_barrier(self, task_id):
@@ -188,14 +252,30 @@ class WorkflowGraph(metaclass=abc.ABCMeta):
 
         return b is not None and b != ""
 
+    def to_networkx(self):
+        # Return the graph as a MultiDiGraph in networkx for tooling. This requires networkx
+        # which is not required to run workflows.
+        if isinstance(self._graph, graph_util.NetworkxMultiDiGraph):
+            return self._graph.to_networkx()
+
+        data = json_util.deepcopy(self._graph.serialize())
+
+        return graph_util.NetworkxMultiDiGraph.deserialize(data).to_networkx()
+
     def get_cycles(self):
+        import networkx as nx
+
+        graph = self.to_networkx()
+
         return [
-            {"tasks": sorted(c), "route": nx.find_cycle(self._graph, c)}
-            for c in nx.simple_cycles(self._graph)
+            {"tasks": sorted(c), "route": nx.find_cycle(graph, c)} for c in nx.simple_cycles(graph)
         ]
 
     def in_cycle(self, task_id):
-        return [c for c in nx.simple_cycles(self._graph) if task_id in c]
+        if self._frozen:
+            return task_id in self._tasks_in_cycle
+
+        return task_id in graph_util.get_nodes_in_cycle(self._graph)
 
     def is_cycle_closed(self, cycle):
         # A cycle is closed, for a lack of better term, if there is no task
@@ -208,9 +288,18 @@ class WorkflowGraph(metaclass=abc.ABCMeta):
         return True
 
     def get_task_retry_spec(self, task_id):
+        if self._frozen:
+            if task_id not in self._retries:
+                raise exc.InvalidTask(task_id)
+
+            return json_util.deepcopy(self._retries[task_id])
+
         return self.get_task(task_id).get("retry")
 
     def task_has_retry(self, task_id):
-        r = self.get_task_retry_spec(task_id)
+        if self._frozen and task_id in self._retries:
+            r = self._retries[task_id]
+        else:
+            r = self.get_task_retry_spec(task_id)
 
         return r is not None and isinstance(r, dict) and "count" in r
@@ -18,7 +18,6 @@ import logging
 from orquesta import events
 from orquesta import exceptions as exc
 from orquesta import statuses
-from orquesta.utils import jsonify as json_util
 
 
 LOG = logging.getLogger(__name__)
@@ -451,6 +450,14 @@ TASK_STATE_MACHINE_DATA = {
 
 
 class TaskStateMachine(object):
+    @classmethod
+    def set_task_status(cls, workflow_state, task_state, status):
+        # Update the status thru the workflow state so the status index is kept in sync.
+        if workflow_state is not None:
+            workflow_state.update_task_status(task_state, status)
+        else:
+            task_state["status"] = status
+
     @classmethod
     def is_transition_valid(cls, old_status, new_status):
         if old_status is None:
@@ -507,7 +514,7 @@ class TaskStateMachine(object):
         new_task_status = TASK_STATE_MACHINE_DATA[current_task_status][event_name]
 
         # Assign new status to the task flow entry.
-        task_state["status"] = new_task_status
+        cls.set_task_status(workflow_state, task_state, new_task_status)
 
     @classmethod
     def add_context_to_task_item_event(cls, workflow_state, task_id, task_route, ac_ex_event):
@@ -525,18 +532,20 @@ class TaskStateMachine(object):
         ]
 
         if ac_ex_event.status in requirements:
-            # Make a copy of the items and remove current item under evaluation.
+            # Count the status of the items except the current item under evaluation.
             staged_task = workflow_state.get_staged_task(task_id, task_route)
-            items = json_util.deepcopy(staged_task["items"])
-            del items[ac_ex_event.item_id]
-            items_status = [item.get("status", statuses.UNSET) for item in items]
+            items = staged_task["items"]
+            items_status = items.get_status_counts()
+            items_status[items.get_status(ac_ex_event.item_id)] -= 1
 
             # Assess various situations.
-            active = list(filter(lambda x: x in statuses.ACTIVE_STATUSES, items_status))
-            incomplete = list(filter(lambda x: x not in statuses.COMPLETED_STATUSES, items_status))
-            paused = list(filter(lambda x: x in [statuses.PENDING, statuses.PAUSED], items_status))
-            canceled = list(filter(lambda x: x == statuses.CANCELED, items_status))
-            failed = list(filter(lambda x: x in statuses.ABENDED_STATUSES, items_status))
+            active = sum(items_status[x] for x in statuses.ACTIVE_STATUSES)
+            incomplete = sum(
+                v for k, v in items_status.items() if k not in statuses.COMPLETED_STATUSES
+            )
+            paused = sum(items_status[x] for x in [statuses.PENDING, statuses.PAUSED])
+            canceled = items_status[statuses.CANCELED]
+            failed = sum(items_status[x] for x in statuses.ABENDED_STATUSES)
 
             # Attach info on whether task is still active or dormant.
             action_event += "_task_active" if active else "_task_dormant"
@@ -589,7 +598,7 @@ class TaskStateMachine(object):
         new_task_status = TASK_STATE_MACHINE_DATA[current_task_status][event_name]
 
         # Assign new status to the task flow entry.
-        task_state["status"] = new_task_status
+        cls.set_task_status(workflow_state, task_state, new_task_status)
 
     @classmethod
     def add_context_to_workflow_event(cls, workflow_state, task_id, task_route, wf_ex_event):
@@ -598,9 +607,11 @@ class TaskStateMachine(object):
         staged_task = workflow_state.get_staged_task(task_id, task_route)
 
         if wf_ex_event.status in requirements and staged_task and "items" in staged_task:
-            items_status = [item.get("status", statuses.UNSET) for item in staged_task["items"]]
-            active = list(filter(lambda x: x in statuses.ACTIVE_STATUSES, items_status))
-            incomplete = list(filter(lambda x: x not in statuses.COMPLETED_STATUSES, items_status))
+            items_status = staged_task["items"].get_status_counts()
+            active = sum(items_status[x] for x in statuses.ACTIVE_STATUSES)
+            incomplete = sum(
+                v for k, v in items_status.items() if k not in statuses.COMPLETED_STATUSES
+            )
             workflow_event += "_task_active" if active else "_task_dormant"
             workflow_event += "_items_incomplete" if incomplete else "_items_completed"
 
@@ -636,7 +647,7 @@ class TaskStateMachine(object):
         new_task_status = TASK_STATE_MACHINE_DATA[current_task_status][event_name]
 
         # Assign new status to the task flow entry.
-        task_state["status"] = new_task_status
+        cls.set_task_status(workflow_state, task_state, new_task_status)
 
     @classmethod
     def process_event(cls, workflow_state, task_state, event):
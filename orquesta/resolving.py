@@ -0,0 +1,125 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+
+from orquesta import exceptions as exc
+from orquesta.utils import jsonify as json_util
+
+
+LOG = logging.getLogger(__name__)
+
+CONTENT_HASH_REGEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ContentResolver(metaclass=abc.ABCMeta):
+    # The resolver stores the serialized spec and graph by their content hash so the serialized
+    # conductor can refer to them by the hash instead of including them.
+
+    @staticmethod
+    def validate_content_hash(content_hash):
+        if not isinstance(content_hash, str) or not CONTENT_HASH_REGEX.match(content_hash):
+            raise ValueError('The content hash "%s" is not valid.' % str(content_hash))
+
+    @staticmethod
+    def verify_content(content_hash, content):
+        # The content is resolved by its hash and so it has to match the hash. Otherwise, the
+        # content is changed or stored under the wrong hash and it cannot be used.
+        actual_hash = json_util.content_hash(content)
+
+        if actual_hash != content_hash:
+            raise exc.ContentHashMismatchError(content_hash, actual_hash)
+
+        return content
+
+    @abc.abstractmethod
+    def has(self, content_hash):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get(self, content_hash):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def put(self, content_hash, content):
+        raise NotImplementedError()
+
+
+class MemoryContentResolver(ContentResolver):
+    def __init__(self):
+        self._contents = {}
+        self._lock = threading.Lock()
+
+    def has(self, content_hash):
+        return content_hash in self._contents
+
+    def get(self, content_hash):
+        self.validate_content_hash(content_hash)
+
+        if content_hash not in self._contents:
+            raise exc.ContentNotFoundError(content_hash)
+
+        return self.verify_content(content_hash, json_util.deepcopy(self._contents[content_hash]))
+
+    def put(self, content_hash, content):
+        self.validate_content_hash(content_hash)
+
+        with self._lock:
+            self._contents[content_hash] = json_util.deepcopy(content)
+
+
+class FileContentResolver(ContentResolver):
+    # The content is written to a JSON file named after the content hash in the given directory.
+    # The file is written to a temporary file first and then renamed so a partially written
+    # file is never read by another process.
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(self.path, exist_ok=True)
+
+    def get_file_path(self, content_hash):
+        self.validate_content_hash(content_hash)
+
+        return os.path.join(self.path, content_hash + ".json")
+
+    def has(self, content_hash):
+        return os.path.isfile(self.get_file_path(content_hash))
+
+    def get(self, content_hash):
+        try:
+            with open(self.get_file_path(content_hash), "r") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            raise exc.ContentNotFoundError(content_hash)
+
+        return self.verify_content(content_hash, content)
+
+    def put(self, content_hash, content):
+        file_path = self.get_file_path(content_hash)
+        fd, tmp_file_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(content, f)
+
+            os.replace(tmp_file_path, file_path)
+        except Exception:
+            os.remove(tmp_file_path)
+            raise
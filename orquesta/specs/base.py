@@ -14,11 +14,14 @@
 # limitations under the License.
 
 import collections.abc
+import copy
 import inspect
+import itertools
 import json
 import jsonschema
 import logging
 import re
+import weakref
 
 from orquesta import exceptions as exc
 from orquesta.expressions import base as expr_base
@@ -32,6 +35,10 @@ from orquesta.utils import yml as yaml_util
 
 LOG = logging.getLogger(__name__)
 
+# The schemas merged with the schemas of the base classes are cached per spec class. The cache
+# is keyed by the class itself and the entry is dropped when the class is garbage collected.
+_schema_caches = weakref.WeakKeyDictionary()
+
 
 def isspec(value):
     return inspect.isclass(value) and issubclass(value, Spec)
@@ -56,17 +63,19 @@ class Spec(object):
 
     _schema_validator = None
 
+    # The attributes that map to the spec properties and the patterns of the pattern properties.
+    # They are resolved from the schema cache when the spec is instantiated.
+    _schema_attributes = {}
+    _schema_patterns = []
+
     # Put the name of the spec properties in the order of validation.
     _context_evaluation_sequence = []
 
     # Put the name of the spec properties that are inputs for the context.
     _context_inputs = []
 
-    def getattr_default(self, name, meta=False):
-        properties = (
-            self._meta_schema.get("properties", {}) if meta else self._schema.get("properties", {})
-        )
-
+    @staticmethod
+    def _get_property_default(properties, name):
         attr = properties.get(name, {})
 
         if inspect.isclass(attr) and issubclass(attr, Spec):
@@ -74,28 +83,28 @@ class Spec(object):
 
         return attr.get("default", None)
 
+    def getattr_default(self, name, meta=False):
+        properties = (
+            self._meta_schema.get("properties", {}) if meta else self._schema.get("properties", {})
+        )
+
+        return self._get_property_default(properties, name)
+
     # Override __getattr__ so we can dynamically map class attributes to spec properties.
     # Per documentation, __getattr__ is called by __getattribute__ on AttributeError. In
     # this case, the attribute does not physically exist on the class and so __getattr__
     # is called which it is overridden here to access the spec dict.
     def __getattr__(self, name):
-        # Retrieve from spec if attribute is a meta schema property.
-        if name in self._meta_schema.get("properties", {}):
-            return self.spec.get(name, self.getattr_default(name, meta=True))
-
-        if name.replace("_", "-") in self._meta_schema.get("properties", {}):
-            return self.spec.get(name.replace("_", "-"), self.getattr_default(name, meta=True))
+        # Retrieve from spec if attribute is a meta schema or schema property. The property
+        # and the default value for the attribute are resolved in the schema cache.
+        attribute = self._schema_attributes.get(name)
 
-        # Retrieve from spec if attribute is a schema property.
-        if name in self._schema.get("properties", {}):
-            return self.spec.get(name, self.getattr_default(name))
-
-        if name.replace("_", "-") in self._schema.get("properties", {}):
-            return self.spec.get(name.replace("_", "-"), self.getattr_default(name))
+        if attribute is not None:
+            return self.spec.get(attribute[0], attribute[1])
 
         # Retrieve from spec if attribute match a regex pattern in the schema.
-        for pattern in self._schema.get("patternProperties", {}).keys():
-            if re.match(pattern, name):
+        for pattern in self._schema_patterns:
+            if pattern.match(name):
                 return self.spec.get(name)
 
         # Use default for all other attributes.
@@ -113,8 +122,11 @@ class Spec(object):
             if False property_specs and regex_property_specs are combined from
             self._schema and self._meta_schema
         """
-        self._schema = self.get_schema(includes=None, resolve_specs=False)
-        self._meta_schema = self.get_meta_schema()
+        schema_cache = self._get_schema_cache()
+        self._schema = schema_cache["schema"]
+        self._meta_schema = schema_cache["meta_schema"]
+        self._schema_attributes = schema_cache["attributes"]
+        self._schema_patterns = schema_cache["patterns"]
 
         if not spec:
             raise ValueError("The spec cannot be type of None.")
@@ -133,27 +145,18 @@ class Spec(object):
 
         self.member = member
 
-        schema = (
-            self._schema
-            if member
-            else schema_util.merge_schema(self.get_meta_schema(), self._schema)
-        )
-
         # Process attributes defined under properties in the schema.
-        property_specs = {k: v for k, v in schema.get("properties", {}).items() if isspec(v)}
+        instance_schema_cache = self._get_instance_schema_cache(member=member)
 
-        for name, spec_cls in property_specs.items():
+        for name, spec_cls in instance_schema_cache["property_specs"]:
             if self.spec.get(name):
                 setattr(self, name, spec_cls(self.spec.get(name), member=True))
 
         # Process pattern properties (regex) defined in the schema.
-        regex_property_specs = {
-            k: v for k, v in schema.get("patternProperties", {}).items() if isspec(v)
-        }
         # regex_property_specs are member=True so they don't use meta_schema
-        for pattern, spec_cls in regex_property_specs.items():
+        for regex, spec_cls in instance_schema_cache["regex_property_specs"]:
             for name, value in self.spec.items():
-                if re.match(pattern, name) and value:
+                if regex.match(name) and value:
                     setattr(self, name, spec_cls(value, member=True))
 
     def copy(self):
@@ -196,32 +199,113 @@ class Spec(object):
         return cls._schema_validator
 
     @classmethod
-    def get_meta_schema(cls):
-        meta_schema = {}
+    def _get_schema_cache(cls):
+        # The cache entry keeps the schemas of the class and its base classes that it is merged
+        # from. The cache is rebuilt if any of them is assigned a different schema.
+        schemas = [
+            s
+            for c in cls.__mro__
+            if issubclass(c, Spec)
+            for s in (c.__dict__.get("_schema"), c.__dict__.get("_meta_schema"))
+        ]
+
+        schema_cache = _schema_caches.get(cls)
+
+        if schema_cache and all(a is b for a, b in zip(schema_cache["schemas"], schemas)):
+            return schema_cache
 
         bases = [b for b in cls.__bases__ if issubclass(b, Spec)]
+        meta_schema = {}
+        schema = {}
 
         for base_cls in bases:
-            parent_meta_schema = base_cls.get_meta_schema()
+            parent_meta_schema = base_cls._get_schema_cache()["meta_schema"]
             meta_schema = schema_util.merge_schema(meta_schema, parent_meta_schema)
+            parent_schema = base_cls.get_schema(includes=None)
+            schema = schema_util.merge_schema(schema, parent_schema)
+
+        meta_schema = schema_util.merge_schema(meta_schema, cls._meta_schema)
+        schema = schema_util.merge_schema(schema, cls._schema)
+
+        schema_cache = {
+            "schemas": schemas,
+            "schema": schema,
+            "meta_schema": meta_schema,
+            "attributes": cls._resolve_schema_attributes(schema, meta_schema),
+            "patterns": [re.compile(k) for k in schema.get("patternProperties", {}).keys()],
+            "instances": {},
+        }
+
+        _schema_caches[cls] = schema_cache
 
-        return schema_util.merge_schema(meta_schema, cls._meta_schema)
+        return schema_cache
 
     @classmethod
-    def get_schema(cls, includes=["meta"], resolve_specs=True):
-        schema = {}
+    def _resolve_schema_attributes(cls, schema, meta_schema):
+        # Map the names of the attributes to the spec properties and the default values. The
+        # attribute name can be the property name with any of the dashes replaced with
+        # underscores. The meta schema properties take precedence over the schema properties.
+        meta_properties = meta_schema.get("properties", {})
+        properties = schema.get("properties", {})
+        attributes = {}
 
-        bases = [b for b in cls.__bases__ if issubclass(b, Spec)]
+        for prop_name in itertools.chain(meta_properties.keys(), properties.keys()):
+            parts = prop_name.split("-")
 
-        for base_cls in bases:
-            parent_schema = base_cls.get_schema(includes=None)
-            schema = schema_util.merge_schema(schema, parent_schema)
+            for separators in itertools.product(["-", "_"], repeat=len(parts) - 1):
+                name = parts[0] + "".join(s + p for s, p in zip(separators, parts[1:]))
 
-        schema = schema_util.merge_schema(schema, cls._schema)
+                if name in attributes:
+                    continue
+
+                for props in [meta_properties, properties]:
+                    key = name if name in props else name.replace("_", "-")
+
+                    if key in props:
+                        attributes[name] = (key, cls._get_property_default(props, name))
+                        break
+
+        return attributes
+
+    @classmethod
+    def _get_instance_schema_cache(cls, member=False):
+        # Identify the properties that are specs for the member or non-member instances. The
+        # schema of a non-member instance is merged with the meta schema.
+        schema_cache = cls._get_schema_cache()
+        member = bool(member)
+
+        if member not in schema_cache["instances"]:
+            schema = (
+                schema_cache["schema"]
+                if member
+                else schema_util.merge_schema(schema_cache["meta_schema"], schema_cache["schema"])
+            )
+
+            schema_cache["instances"][member] = {
+                "schema": schema,
+                "property_specs": [
+                    (k, v) for k, v in schema.get("properties", {}).items() if isspec(v)
+                ],
+                "regex_property_specs": [
+                    (re.compile(k), v)
+                    for k, v in schema.get("patternProperties", {}).items()
+                    if isspec(v)
+                ],
+            }
+
+        return schema_cache["instances"][member]
+
+    @classmethod
+    def get_meta_schema(cls):
+        return copy.deepcopy(cls._get_schema_cache()["meta_schema"])
+
+    @classmethod
+    def get_schema(cls, includes=["meta"], resolve_specs=True):
+        schema_cache = cls._get_schema_cache()
+        schema = copy.deepcopy(schema_cache["schema"])
 
         if includes and "meta" in includes:
-            meta_schema = cls.get_meta_schema()
-            schema = schema_util.merge_schema(schema, meta_schema)
+            schema = schema_util.merge_schema(schema, schema_cache["meta_schema"])
 
         if not resolve_specs:
             return schema
@@ -335,7 +419,7 @@ class Spec(object):
 
         errors = []
         properties = {}
-        schema = self.get_schema(includes=None)
+        schema = self._get_schema_cache()["schema"]
 
         for prop_name, prop_type in schema.get("properties", {}).items():
             properties[prop_name] = getattr(self, prop_name)
@@ -387,7 +471,7 @@ class Spec(object):
 
         errors = []
         properties = {}
-        schema = self.get_schema(includes=None)
+        schema = self._get_schema_cache()["schema"]
 
         for prop_name, prop_type in schema.get("properties", {}).items():
             properties[prop_name] = getattr(self, prop_name)
@@ -616,11 +700,7 @@ class SequenceSpec(Spec, collections.abc.MutableSequence):
     def __init__(self, spec, name=None, member=False):
         super(SequenceSpec, self).__init__(spec, name=name, member=member)
 
-        schema = (
-            self._schema
-            if member
-            else schema_util.merge_schema(self.get_meta_schema(), self._schema)
-        )
+        schema = self._get_instance_schema_cache(member=member)["schema"]
 
         if schema.get("type") != "array":
             raise exc.SchemaDefinitionError("The schema for SequenceSpec must be type of array.")
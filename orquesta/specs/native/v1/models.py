@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections.abc
 import logging
 import queue
 
@@ -23,6 +24,7 @@ from orquesta.specs.native.v1 import base as native_v1_specs
 from orquesta.specs import types as spec_types
 from orquesta.utils import context as ctx_util
 from orquesta.utils import dictionary as dict_util
+from orquesta.utils import graph as graph_util
 from orquesta.utils import jsonify as json_util
 from orquesta.utils import parameters as args_util
 from orquesta.utils import yml as yaml_util
@@ -113,6 +115,47 @@ class TaskRetrySpec(native_v1_specs.Spec):
     _context_evaluation_sequence = ["when", "count", "delay"]
 
 
+class TaskItemActionSpecs(collections.abc.Sequence):
+    # The list of action specs for a with items task. The action and input of an item are only
+    # rendered on first access by index so the conductor can render just the items that will
+    # be dispatched per the concurrency policy. The number of items is known without rendering.
+    # The conductor converts the action specs to a list before the task is returned.
+
+    def __init__(self, task_spec, items, item_keys, in_ctx):
+        self._task_spec = task_spec
+        self._items = items
+        self._item_keys = item_keys
+        self._in_ctx = in_ctx
+        self._action_specs = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if idx < 0:
+            idx += len(self)
+
+        if idx < 0 or idx >= len(self):
+            raise IndexError("The index of the item is out of range.")
+
+        if idx not in self._action_specs:
+            self._action_specs[idx] = self._task_spec.render_item(
+                idx, self._items[idx], self._item_keys, self._in_ctx
+            )
+
+        return self._action_specs[idx]
+
+    def __repr__(self):
+        return "<%s items=%d rendered=%d>" % (
+            self.__class__.__name__,
+            len(self),
+            len(self._action_specs),
+        )
+
+
 class TaskSpec(native_v1_specs.Spec):
     _schema = {
         "type": "object",
@@ -153,6 +196,8 @@ class TaskSpec(native_v1_specs.Spec):
         return hasattr(self, "retry") and self.retry
 
     def render(self, in_ctx):
+        # Render the action specs without modifying the task spec so the same instance of the
+        # task spec can be rendered for different contexts and executions.
         action_specs = []
 
         if not self.has_items():
@@ -182,26 +227,28 @@ class TaskSpec(native_v1_specs.Spec):
                 else items_spec.items[: items_spec.items.index(" in ")].replace(" ", "").split(",")
             )
 
-            for idx, item in enumerate(items):
-                if item_keys and (isinstance(item, tuple) or isinstance(item, list)):
-                    item = dict(zip(item_keys, list(item)))
-                elif item_keys and len(item_keys) == 1:
-                    item = {item_keys[0]: item}
+            action_specs = TaskItemActionSpecs(self, items, item_keys, in_ctx)
 
-                item_ctx_value = ctx_util.set_current_item(in_ctx, item)
+        return self, action_specs
 
-                action_spec = {
-                    "action": expr_base.evaluate(self.action, item_ctx_value),
-                    "input": expr_base.evaluate(getattr(self, "input", {}), item_ctx_value),
-                    "item_id": idx,
-                }
+    def render_item(self, idx, item, item_keys, in_ctx):
+        if item_keys and (isinstance(item, tuple) or isinstance(item, list)):
+            item = dict(zip(item_keys, list(item)))
+        elif item_keys and len(item_keys) == 1:
+            item = {item_keys[0]: item}
 
-                action_specs.append(action_spec)
+        item_ctx_value = ctx_util.set_current_item(in_ctx, item)
 
-        return self, action_specs
+        action_spec = {
+            "action": expr_base.evaluate(self.action, item_ctx_value),
+            "input": expr_base.evaluate(getattr(self, "input", {}), item_ctx_value),
+            "item_id": idx,
+        }
+
+        return action_spec
 
     def finalize_context(self, next_task_name, task_transition_meta, in_ctx):
-        rolling_ctx = json_util.deepcopy(in_ctx)
+        rolling_ctx = dict(in_ctx) if in_ctx else dict()
         new_ctx = {}
         errors = []
 
@@ -221,7 +268,7 @@ class TaskSpec(native_v1_specs.Spec):
                 except exc.ExpressionEvaluationException as e:
                     errors.append(e)
 
-        out_ctx = dict_util.merge_dicts(in_ctx, new_ctx, overwrite=True)
+        out_ctx = dict_util.layer_dicts(in_ctx, new_ctx, overwrite=True)
 
         for key in list(out_ctx.keys()):
             if key.startswith("__"):
@@ -233,6 +280,10 @@ class TaskSpec(native_v1_specs.Spec):
 class TaskMappingSpec(native_v1_specs.MappingSpec):
     _schema = {"type": "object", "minProperties": 1, "patternProperties": {r"^\w+$": TaskSpec}}
 
+    def __init__(self, spec, name=None, member=False):
+        super(TaskMappingSpec, self).__init__(spec, name=name, member=member)
+        self._transition_index = None
+
     def has_tasks(self):
         return len(self.keys()) > 0
 
@@ -248,7 +299,7 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
 
         return self[task_name]
 
-    def get_next_tasks(self, task_name, *args, **kwargs):
+    def _get_transitions(self, task_name):
         task_spec = self.get_task(task_name)
 
         next_tasks = []
@@ -267,21 +318,50 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
 
         return sorted(next_tasks, key=lambda x: x[0])
 
-    def get_prev_tasks(self, task_name, *args, **kwargs):
-        prev_tasks = []
+    def _get_transition_index(self):
+        # The next and previous tasks of every task and the tasks in a cycle are identified
+        # in one pass over the task transitions. The tasks spec is not modified after it is
+        # created so the index is built on first use and kept for the life of the spec.
+        if self._transition_index is not None:
+            return self._transition_index
+
+        next_tasks = {}
+        prev_tasks = {}
+        graph = graph_util.MultiDiGraph()
 
-        for name, task_spec in self.items():
-            for next_task in self.get_next_tasks(name):
-                if task_name == next_task[0]:
-                    prev_tasks.append((name, next_task[1], next_task[2]))
+        for task_name in self.keys():
+            next_tasks[task_name] = self._get_transitions(task_name)
+            graph.add_node(task_name)
 
-        return sorted(prev_tasks, key=lambda x: x[0])
+            for next_task_name, condition, task_transition_item_idx in next_tasks[task_name]:
+                prev_task = (task_name, condition, task_transition_item_idx)
+                prev_tasks.setdefault(next_task_name, []).append(prev_task)
+                graph.add_edge(task_name, next_task_name)
+
+        self._transition_index = {
+            "next": next_tasks,
+            "prev": {k: sorted(v, key=lambda x: x[0]) for k, v in prev_tasks.items()},
+            "cycle": frozenset(graph_util.get_nodes_in_cycle(graph)),
+        }
+
+        return self._transition_index
+
+    def get_next_tasks(self, task_name, *args, **kwargs):
+        next_tasks = self._get_transition_index()["next"]
+
+        if task_name not in next_tasks:
+            return self._get_transitions(task_name)
+
+        return list(next_tasks[task_name])
+
+    def get_prev_tasks(self, task_name, *args, **kwargs):
+        return list(self._get_transition_index()["prev"].get(task_name, []))
 
     def get_start_tasks(self):
+        prev_tasks = self._get_transition_index()["prev"]
+
         start_tasks = [
-            (task_name, None, None)
-            for task_name in self.keys()
-            if not self.get_prev_tasks(task_name)
+            (task_name, None, None) for task_name in self.keys() if not prev_tasks.get(task_name)
         ]
 
         return sorted(start_tasks, key=lambda x: x[0])
@@ -292,41 +372,15 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
         return getattr(task_spec, "join", None) is not None
 
     def is_split_task(self, task_name):
-        return not self.is_join_task(task_name) and len(self.get_prev_tasks(task_name)) > 1
-
-    def in_cycle(self, task_name):
-        traversed = []
-        q = queue.Queue()
-
-        for task in self.get_next_tasks(task_name):
-            q.put(task[0])
+        prev_tasks = self._get_transition_index()["prev"]
 
-        while not q.empty():
-            next_task_name = q.get()
-
-            # If the next task matches the original task, then it's in a loop.
-            if next_task_name == task_name:
-                return True
-
-            # If the next task has already been traversed but didn't match the
-            # original task, then there's a loop but the original task is not
-            # in the loop.
-            if next_task_name in traversed:
-                continue
-
-            for task in self.get_next_tasks(next_task_name):
-                q.put(task[0])
-
-            traversed.append(next_task_name)
+        return not self.is_join_task(task_name) and len(prev_tasks.get(task_name, [])) > 1
 
-        return False
+    def in_cycle(self, task_name):
+        return task_name in self._get_transition_index()["cycle"]
 
     def has_cycles(self):
-        for task_name, task_spec in self.items():
-            if self.in_cycle(task_name):
-                return True
-
-        return False
+        return len(self._get_transition_index()["cycle"]) > 0
 
     def detect_actionless_with_items(self, parent=None):
         result = []
@@ -380,8 +434,8 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
     def detect_undefined_tasks(self, parent=None):
         # Identify the undefined task in task transitions.
         result = []
-        traversed = []
-        queued_task = []
+        traversed = set()
+        queued_task = set()
         q = queue.Queue()
 
         for task in self.get_start_tasks():
@@ -389,7 +443,7 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
 
         while not q.empty():
             task_name = q.get()
-            traversed.append(task_name)
+            traversed.add(task_name)
 
             # Identify the next set of tasks and related transition specs.
             # The get_next_tasks function is not used here because it doesn't
@@ -413,11 +467,12 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
 
                     if self.has_task(next_task_name):
                         if (
-                            next_task_name not in RESERVED_TASK_NAMES + traversed
+                            next_task_name not in RESERVED_TASK_NAMES
+                            and next_task_name not in traversed
                             and next_task_name not in queued_task
                         ):
                             q.put(next_task_name)
-                            queued_task.append(next_task_name)
+                            queued_task.add(next_task_name)
                     else:
                         entry = {
                             "message": 'The task "%s" is not defined.' % next_task_name,
@@ -687,7 +742,7 @@ class WorkflowSpec(native_v1_specs.Spec):
 
     def render_output(self, in_ctx):
         output_specs = getattr(self, "output") or []
-        rolling_ctx = json_util.deepcopy(in_ctx)
+        rolling_ctx = dict(in_ctx) if in_ctx else dict()
         rendered_outputs = {}
         errors = []
 
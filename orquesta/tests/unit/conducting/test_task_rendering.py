@@ -16,6 +16,7 @@ from orquesta import conducting
 from orquesta.specs import native as native_specs
 from orquesta import statuses
 from orquesta.tests.unit import base as test_base
+from orquesta.utils import jsonify as json_util
 
 
 class WorkflowConductorTaskRenderingTest(test_base.WorkflowConductorTest):
@@ -188,6 +189,89 @@ class WorkflowConductorTaskRenderingTest(test_base.WorkflowConductorTest):
 
         self.assert_task_list(conductor, conductor.get_next_tasks(), expected_tasks)
 
+    def test_rendering_does_not_modify_task_spec(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - xs
+
+        tasks:
+          task1:
+            with: x in <% ctx(xs) %>
+            action: core.echo
+            input:
+              message: <% item(x) %>
+              meta:
+                xs: <% ctx(xs) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+        expected_spec = json_util.deepcopy(spec.serialize())
+
+        inputs = {"xs": ["fee", "fi"]}
+        conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The task spec is shared with the frozen spec of the compiled workflow.
+        task = conductor.get_task("task1", 0)
+        self.assertIs(task["spec"], conductor.compiled.spec.tasks.get_task("task1"))
+        self.assertIsNot(task["spec"], spec.tasks.get_task("task1"))
+        self.assertRaises(TypeError, task["spec"].spec.__setitem__, "action", "core.foobar")
+        self.assertRaises(TypeError, task["spec"].spec["input"].pop, "message")
+
+        # The rendered action specs do not share any value with the task spec.
+        for action_spec in task["actions"]:
+            action_spec["input"]["meta"]["xs"].append("fo")
+
+        self.assertDictEqual(spec.serialize(), expected_spec)
+
+        # The task spec can be rendered again for another context.
+        conductor = conducting.WorkflowConductor(spec, inputs={"xs": ["fo"]})
+        conductor.request_workflow_status(statuses.RUNNING)
+        task = conductor.get_task("task1", 0)
+
+        self.assertListEqual(
+            list(task["actions"]),
+            [
+                {
+                    "action": "core.echo",
+                    "input": {"message": "fo", "meta": {"xs": ["fo"]}},
+                    "item_id": 0,
+                }
+            ],
+        )
+
+        self.assertDictEqual(spec.serialize(), expected_spec)
+
+    def test_task_spec_is_not_modified_by_other_conductors(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        data = conductor.serialize()
+
+        # The conductors deserialized from the same data share the task spec which is frozen.
+        conductor1 = conducting.WorkflowConductor.deserialize(data)
+        conductor2 = conducting.WorkflowConductor.deserialize(data)
+        task1 = conductor1.get_task("task1", 0)
+        task2 = conductor2.get_task("task1", 0)
+
+        self.assertIs(task1["spec"], task2["spec"])
+        self.assertRaises(TypeError, task1["spec"].spec.__setitem__, "action", "core.foobar")
+        self.assertEqual(task2["spec"].action, "core.noop")
+        self.assertEqual(conductor2.get_task("task1", 0)["actions"][0]["action"], "core.noop")
+
     def test_task_delay_rendering(self):
         wf_def = """
         version: 1.0
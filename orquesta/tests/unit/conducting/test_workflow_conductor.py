@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import mock
+
 from orquesta import conducting
 from orquesta import exceptions as exc
 from orquesta import graphing
+from orquesta import resolving
 from orquesta.specs import native as native_specs
 from orquesta import statuses
 from orquesta.tests.unit import base as test_base
@@ -115,6 +119,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             "spec": conductor.spec.serialize(),
             "graph": conductor.graph.serialize(),
+            "graph_hash": conductor.compiled.graph_hash,
             "context": {},
             "input": {},
             "output": None,
@@ -154,6 +159,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             "spec": conductor.spec.serialize(),
             "graph": conductor.graph.serialize(),
+            "graph_hash": conductor.compiled.graph_hash,
             "context": {},
             "input": inputs,
             "output": None,
@@ -195,6 +201,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             "spec": conductor.spec.serialize(),
             "graph": conductor.graph.serialize(),
+            "graph_hash": conductor.compiled.graph_hash,
             "context": {},
             "input": inputs,
             "output": None,
@@ -237,6 +244,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             "spec": conductor.spec.serialize(),
             "graph": conductor.graph.serialize(),
+            "graph_hash": conductor.compiled.graph_hash,
             "context": context,
             "input": inputs,
             "output": None,
@@ -281,6 +289,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             "spec": conductor.spec.serialize(),
             "graph": conductor.graph.serialize(),
+            "graph_hash": conductor.compiled.graph_hash,
             "state": conductor.workflow_state.serialize(),
             "context": conductor.get_workflow_parent_context(),
             "input": conductor.get_workflow_input(),
@@ -302,6 +311,291 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         self.assertEqual(len(conductor.workflow_state.tasks), 5)
         self.assertEqual(len(conductor.workflow_state.sequence), 5)
 
+    def test_serialize_delta(self):
+        inputs = {"a": 123, "b": True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        base = conductor.serialize()
+        conductor.checkpoint()
+
+        # Mock task flows and serialize the delta after each task.
+        deltas = []
+
+        for i in range(1, 6):
+            status_changes = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, "task" + str(i), status_changes)
+            deltas.append(conductor.serialize_delta())
+
+        # The delta only includes the sections that changed.
+        paths = [tuple(change["path"][0:2]) for change in deltas[0]]
+        self.assertNotIn(("spec",), paths)
+        self.assertNotIn(("graph",), paths)
+        self.assertIn(("state", "sequence"), paths)
+
+        # There is no change since the last delta.
+        self.assertListEqual(conductor.serialize_delta(), [])
+
+        # The base and the deltas are applied to the same serialized conductor.
+        data = base
+
+        for delta in deltas:
+            data = conducting.WorkflowConductor.apply_delta(data, delta)
+
+        self.assertDictEqual(data, conductor.serialize())
+        self.assertListEqual(base["state"]["sequence"], [])
+
+        # Deserialize the base and the deltas and check.
+        conductor = conducting.WorkflowConductor.deserialize(base, deltas=deltas)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertEqual(len(conductor.workflow_state.sequence), 5)
+        self.assertDictEqual(conductor.serialize(), data)
+
+    def test_serialize_delta_with_serialize_sections(self):
+        conductor = self._prep_conductor(status=statuses.RUNNING)
+        base = conductor.serialize()
+        conductor.checkpoint()
+
+        # Serializing some sections between checkpoints does not drop them from the delta.
+        self.forward_task_statuses(conductor, "task1", [statuses.RUNNING, statuses.SUCCEEDED])
+        conductor.serialize(sections=["state", "output"])
+        delta = conductor.serialize_delta()
+
+        paths = [tuple(change["path"][0:2]) for change in delta]
+        self.assertIn(("state", "sequence"), paths)
+        data = conducting.WorkflowConductor.apply_delta(base, delta)
+        self.assertDictEqual(data, conductor.serialize())
+
+        # Only the appended and modified entries are copied into the delta.
+        self.forward_task_statuses(conductor, "task2", [statuses.RUNNING])
+
+        with mock.patch.object(
+            json_util, "deepcopy", side_effect=json_util.deepcopy
+        ) as mock_deepcopy:
+            delta = conductor.serialize_delta()
+
+        copied = [c[0][0] for c in mock_deepcopy.call_args_list]
+        self.assertNotIn(conductor.workflow_state.sequence, copied)
+        self.assertNotIn(conductor.workflow_state.sequence[0], copied)
+        self.assertIn(conductor.workflow_state.sequence[1:2], copied)
+
+        data = conducting.WorkflowConductor.apply_delta(data, delta)
+        self.assertDictEqual(data, conductor.serialize())
+
+    def test_serialize_delta_without_checkpoint(self):
+        conductor = self._prep_conductor(status=statuses.RUNNING)
+
+        self.assertRaises(exc.WorkflowCheckpointError, conductor.serialize_delta)
+
+    def _persist_changes(self, conductor, data):
+        # Serialize only the sections that changed and replace them in the persisted data.
+        changes = conductor.get_changes()
+        sections = [k for k in changes if k != "state"]
+        sections += ["state." + k for k in changes.get("state", {})]
+        partial = conductor.serialize(sections=sections)
+        data.setdefault("state", {}).update(partial.pop("state", {}))
+        data.update(partial)
+
+        return changes
+
+    def test_get_changes(self):
+        conductor = self._prep_conductor(status=statuses.RUNNING)
+
+        # All sections are changed if the conductor is not serialized yet.
+        changes = conductor.get_changes()
+        self.assertListEqual(sorted(changes.keys()), sorted(conductor.sections))
+        self.assertDictEqual(changes["state"]["contexts"], {"appended": [0, 1]})
+
+        # There is no change after the conductor is serialized.
+        data = conductor.serialize()
+        self.assertDictEqual(conductor.get_changes(), {})
+
+        # Only the sections that changed are returned.
+        self.forward_task_statuses(conductor, "task1", [statuses.RUNNING])
+        changes = self._persist_changes(conductor, data)
+        expected_state_changes = {
+            "sequence": {"appended": [0, 1]},
+            "staged": {"modified": True},
+            "tasks": {"modified": True},
+        }
+        self.assertDictEqual(changes, {"state": expected_state_changes})
+        self.assertDictEqual(data, conductor.serialize())
+
+        # The modified entries in the sequence are identified by index.
+        self.forward_task_statuses(conductor, "task1", [statuses.SUCCEEDED])
+        changes = self._persist_changes(conductor, data)
+        self.assertListEqual(changes["state"]["sequence"]["modified"], [0])
+        self.assertDictEqual(changes["state"]["contexts"], {"appended": [1, 2]})
+        self.assertDictEqual(data, conductor.serialize())
+
+        # Persist the changes until the workflow is completed.
+        for i in range(2, 6):
+            self.forward_task_statuses(conductor, "task" + str(i), [statuses.RUNNING])
+            self._persist_changes(conductor, data)
+            self.forward_task_statuses(conductor, "task" + str(i), [statuses.SUCCEEDED])
+            self._persist_changes(conductor, data)
+            self.assertDictEqual(data, conductor.serialize())
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertIn("output", data)
+
+    def test_get_changes_with_rerun(self):
+        conductor = self._prep_conductor(status=statuses.RUNNING)
+        data = conductor.serialize()
+
+        self.forward_task_statuses(conductor, "task1", [statuses.RUNNING, statuses.FAILED])
+        changes = self._persist_changes(conductor, data)
+        self.assertEqual(conductor.get_workflow_status(), statuses.FAILED)
+        self.assertDictEqual(changes["errors"], {"appended": [0, 1]})
+        self.assertDictEqual(data, conductor.serialize())
+
+        # The errors for the task are removed on rerun so the section is flagged as modified.
+        conductor.request_workflow_rerun()
+        changes = self._persist_changes(conductor, data)
+        self.assertDictEqual(changes["errors"], {"modified": True})
+        self.assertDictEqual(changes["state"]["reruns"], {"modified": True})
+        self.assertListEqual(changes["state"]["sequence"]["modified"], [0])
+        self.assertDictEqual(data, conductor.serialize())
+
+        self.forward_task_statuses(conductor, "task1", [statuses.RUNNING, statuses.SUCCEEDED])
+        self._persist_changes(conductor, data)
+        self.assertDictEqual(data, conductor.serialize())
+
+    def test_serialize_sections(self):
+        conductor = self._prep_conductor(status=statuses.RUNNING)
+        self.forward_task_statuses(conductor, "task1", [statuses.RUNNING])
+
+        data = conductor.serialize(sections=["log", "state.sequence"])
+        expected_data = {"log": [], "state": {"sequence": conductor.workflow_state.sequence}}
+        self.assertDictEqual(data, expected_data)
+        self.assertIsNot(data["state"]["sequence"], conductor.workflow_state.sequence)
+
+        # The changes are only reset for the sections that are serialized.
+        changes = conductor.get_changes()
+        self.assertNotIn("log", changes)
+        self.assertNotIn("sequence", changes["state"])
+        self.assertIn("spec", changes)
+        self.assertIn("staged", changes["state"])
+
+        self.assertRaises(KeyError, conductor.serialize, sections=["foobar"])
+        self.assertRaises(KeyError, conductor.serialize, sections=["state.foobar"])
+
+    def test_compiled_workflow_cache(self):
+        cache = conducting.WorkflowConductor.compiled_workflow_cache
+        cache.clear()
+
+        conductor1 = self._prep_conductor(status=statuses.RUNNING)
+        conductor2 = self._prep_conductor(status=statuses.RUNNING)
+
+        # The conductors of the same workflow definition share the compiled graph.
+        self.assertIs(conductor1.graph, conductor2.graph)
+        self.assertTrue(conductor1.graph.frozen)
+        self.assertDictEqual(cache.get_stats(), {"hits": 1, "misses": 1, "size": 1, "maxsize": 256})
+
+        # The deserialized conductor uses the compiled spec and graph.
+        data = conductor1.serialize()
+        conductor3 = conducting.WorkflowConductor.deserialize(data)
+        compiled = conducting.WorkflowConductor.get_compiled_workflow(conductor1.spec)
+
+        self.assertIs(conductor3.spec, compiled.spec)
+        self.assertIs(conductor3.graph, conductor1.graph)
+        self.assertEqual(data["graph_hash"], compiled.graph_hash)
+        self.assertDictEqual(conductor3.serialize(), data)
+
+        # The compiled spec is a frozen copy and cannot be modified by any conductor.
+        self.assertIsNot(compiled.spec, conductor1.spec)
+        self.assertDictEqual(compiled.spec.serialize(), conductor1.spec.serialize())
+
+        with self.assertRaises(TypeError):
+            conductor3.spec.spec["tasks"]["task1"]["action"] = "core.foobar"
+
+        with self.assertRaises(TypeError):
+            conductor3.spec.tasks.get_task("task1").spec["next"].append({})
+
+        self.assertEqual(conductor1.spec.tasks.get_task("task1").action, "core.noop")
+
+        # The graph is deserialized if there is no content hash for the graph.
+        data.pop("graph_hash")
+        data["graph"]["nodes"][0]["foobar"] = True
+        conductor4 = conducting.WorkflowConductor.deserialize(data)
+
+        self.assertIs(conductor4.spec, compiled.spec)
+        self.assertIsNot(conductor4.graph, conductor1.graph)
+        self.assertDictEqual(conductor4.serialize()["graph"], data["graph"])
+
+        # The graph is not composed to compare with the serialized graph on a cache miss.
+        data = conductor1.serialize()
+        cache.clear()
+
+        with mock.patch.object(
+            conducting.CompiledWorkflow, "graph", new_callable=mock.PropertyMock
+        ) as mock_graph:
+            conductor5 = conducting.WorkflowConductor.deserialize(data)
+            conductor5.serialize()
+            mock_graph.assert_not_called()
+
+        self.assertIsNot(conductor5.graph, conductor1.graph)
+        self.assertDictEqual(conductor5.serialize()["graph"], conductor1.graph.serialize())
+
+    def test_serialize_by_reference(self):
+        conducting.WorkflowConductor.compiled_workflow_cache.clear()
+        resolver = resolving.MemoryContentResolver()
+        conductor = self._prep_conductor(status=statuses.RUNNING)
+        compiled = conductor.compiled
+        expected = conductor.serialize()
+
+        # The spec and the graph are stored in the resolver and only the hashes are serialized.
+        data = conductor.serialize(resolver=resolver)
+
+        self.assertNotIn("spec", data)
+        self.assertNotIn("graph", data)
+        self.assertEqual(data["spec_hash"], compiled.spec_hash)
+        self.assertEqual(data["graph_hash"], compiled.graph_hash)
+        self.assertDictEqual(resolver.get(data["spec_hash"]), expected["spec"])
+        self.assertDictEqual(resolver.get(data["graph_hash"]), expected["graph"])
+
+        # The compiled workflow is used without fetching the content from the resolver.
+        with mock.patch.object(resolver, "get") as mock_get:
+            conductor = conducting.WorkflowConductor.deserialize(data, resolver=resolver)
+            mock_get.assert_not_called()
+
+        self.assertIs(conductor.spec, compiled.spec)
+        self.assertIs(conductor.graph, compiled.graph)
+        self.assertDictEqual(conductor.serialize(), expected)
+        self.assertIsNot(compiled.spec, self._prep_conductor().spec)
+
+        # The spec and the graph are fetched from the resolver if they are not compiled.
+        conducting.WorkflowConductor.compiled_workflow_cache.clear()
+        conductor = conducting.WorkflowConductor.deserialize(data, resolver=resolver)
+        self.assertIsNot(conductor.spec, compiled.spec)
+        self.assertIsNot(conductor.graph, compiled.graph)
+        self.assertDictEqual(
+            conductor.serialize(), {k: v for k, v in expected.items() if k != "graph_hash"}
+        )
+
+        # The graph that is different than the compiled graph is fetched from the resolver.
+        graph_data = json_util.deepcopy(expected["graph"])
+        graph_data["nodes"][0]["foobar"] = True
+        conductor.restore(
+            graphing.WorkflowGraph.deserialize(graph_data), state=conductor.workflow_state
+        )
+        data = conductor.serialize(sections=["spec", "graph"], resolver=resolver)
+        self.assertNotEqual(data["graph_hash"], compiled.graph_hash)
+        self.assertDictEqual(resolver.get(data["graph_hash"]), graph_data)
+
+        # The resolver is required if the spec or the graph is serialized by reference.
+        conducting.WorkflowConductor.compiled_workflow_cache.clear()
+        data = dict(expected, spec_hash=compiled.spec_hash)
+        data.pop("spec")
+        self.assertRaises(ValueError, conducting.WorkflowConductor.deserialize, data)
+
+        self.assertRaises(
+            exc.ContentNotFoundError,
+            conducting.WorkflowConductor.deserialize,
+            data,
+            resolver=resolving.MemoryContentResolver(),
+        )
+
     def test_get_workflow_initial_context(self):
         conductor = self._prep_conductor()
         expected_init_ctx = {"a": None, "b": False}
@@ -371,6 +665,65 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         self.assertEqual(task["route"], task_route)
         self.assertDictEqual(task["ctx"], expected_ctx)
 
+    def test_get_task_state_is_serialized(self):
+        inputs = {"a": 123}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        task = conductor.get_next_tasks()[0]
+        expected_state = conductor.workflow_state.serialize()
+
+        # The workflow state in the task context is a plain dict that is not changed by events.
+        self.assertIsInstance(task["ctx"]["__state"], dict)
+        self.assertDictEqual(json.loads(json.dumps(task["ctx"]["__state"])), expected_state)
+
+        self.forward_task_statuses(conductor, "task1", [statuses.RUNNING, statuses.SUCCEEDED])
+
+        self.assertDictEqual(task["ctx"]["__state"], expected_state)
+        self.assertDictEqual(task["ctx"]["__state"]["tasks"], {})
+
+    def test_get_next_tasks_serializes_state_once(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+          task2:
+            action: core.noop
+          task3:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        with mock.patch.object(
+            conducting.WorkflowStateView,
+            "toDict",
+            autospec=True,
+            side_effect=conducting.WorkflowStateView.toDict,
+        ) as mock_to_dict:
+            next_tasks = conductor.get_next_tasks()
+
+        self.assertEqual(mock_to_dict.call_count, 1)
+        self.assertListEqual([t["id"] for t in next_tasks], ["task1", "task2", "task3"])
+
+        for task in next_tasks:
+            self.assertDictEqual(task["ctx"]["__state"], conductor.workflow_state.serialize())
+
+    def test_update_task_state_does_not_copy_graph_nodes(self):
+        conductor = self._prep_conductor(status=statuses.RUNNING)
+
+        with mock.patch.object(graphing.WorkflowGraph, "get_task") as mock_get_task:
+            for i in range(1, 6):
+                status_changes = [statuses.RUNNING, statuses.SUCCEEDED]
+                self.forward_task_statuses(conductor, "task" + str(i), status_changes)
+
+            mock_get_task.assert_not_called()
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
     def test_get_next_tasks(self):
         inputs = {"a": 123}
         conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
@@ -825,6 +1178,7 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_data = {
             "spec": conductor.spec.serialize(),
             "graph": conductor.graph.serialize(),
+            "graph_hash": conductor.compiled.graph_hash,
             "context": {},
             "input": inputs,
             "output": None,
@@ -309,3 +309,122 @@ class WorkflowConductorContextTest(test_base.WorkflowConductorTest):
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
         self.assertListEqual(conductor.errors, expected_errors)
         self.assertDictEqual(conductor.get_workflow_output(), expected_output)
+
+    def test_get_task_context_is_cached(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - a: {"x": 1}
+
+        tasks:
+          task1:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        conductor.workflow_state.contexts.append({"a": {"y": 2}, "b": 1})
+        conductor.workflow_state.contexts.append({"b": 2})
+
+        expected_ctx = {"a": {"x": 1, "y": 2}, "b": 2}
+        self.assertDictEqual(conductor.get_task_context([0, 1, 2]), expected_ctx)
+        self.assertIn((0, 1, 2), conductor._task_ctx_cache)
+
+        # The merged context is built on the cached prefix.
+        expected_ctx = {"a": {"x": 1, "y": 2}, "b": 1}
+        self.assertDictEqual(conductor.get_task_context([0, 1]), expected_ctx)
+
+        # The contexts in the workflow state are not modified by the merge.
+        self.assertDictEqual(conductor.workflow_state.contexts[0], {"a": {"x": 1}})
+
+        # The context returned is a copy and changes do not affect the cache.
+        ctx = conductor.get_task_context([0, 1, 2])
+        ctx["a"]["x"] = 0
+        self.assertDictEqual(conductor.get_task_context([0, 1, 2])["a"], {"x": 1, "y": 2})
+
+    def test_get_task_context_empty_list(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - a: {"x": 1}
+
+        tasks:
+          task1:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        self.assertDictEqual(conductor.get_task_context([]), {})
+        self.assertDictEqual(conductor.get_task_context([]), {})
+        self.assertDictEqual(conductor.get_task_context([0]), {"a": {"x": 1}})
+
+    def test_get_next_tasks_does_not_share_context(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs: [1, 2]
+
+        tasks:
+          task1:
+            action: core.echo
+            input:
+              message: "{{ ctx('xs') }}"
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # Changes to the task context and action input do not affect the workflow state.
+        task = conductor.get_next_tasks()[0]
+        task["ctx"]["xs"].append(99)
+        task["actions"][0]["input"]["message"].append(99)
+
+        self.assertDictEqual(conductor.workflow_state.contexts[0], {"xs": [1, 2]})
+        self.assertDictEqual(conductor.get_task_context([0]), {"xs": [1, 2]})
+
+        task = conductor.get_task("task1", 0)
+        self.assertListEqual(task["ctx"]["xs"], [1, 2])
+        self.assertListEqual(task["actions"][0]["input"]["message"], [1, 2])
+
+    def test_expression_does_not_modify_context(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - d:
+              a: 1
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                publish:
+                  - x: "{% set _ = ctx('d').update({'b': 2}) %}{{ ctx('d') }}"
+                do: task2
+          task2:
+            action: core.echo
+            input:
+              message: "{{ ctx('d') }}"
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        self.forward_task_statuses(conductor, "task1", [statuses.RUNNING, statuses.SUCCEEDED])
+
+        # The expression modifies a copy of the value and not the contexts in the workflow state.
+        self.assertDictEqual(conductor.workflow_state.contexts[0], {"d": {"a": 1}})
+        self.assertDictEqual(conductor.get_workflow_initial_context(), {"d": {"a": 1}})
+        self.assertDictEqual(conductor.workflow_state.contexts[1], {"x": "{'a': 1, 'b': 2}"})
+
+        task = conductor.get_next_tasks()[0]
+        self.assertDictEqual(task["actions"][0]["input"], {"message": {"a": 1}})
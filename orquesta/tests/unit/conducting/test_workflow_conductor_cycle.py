@@ -82,3 +82,54 @@ class WorkflowConductorExtendedTest(test_base.WorkflowConductorTest):
         expected_term_ctx = {"loop": False}
         self.assertDictEqual(conductor.get_workflow_terminal_context(), expected_term_ctx)
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_get_task_sequence_in_cycle(self):
+        wf_def = """
+        version: 1.0
+
+        description: A basic workflow with cycle.
+
+        vars:
+          - loop: True
+
+        tasks:
+          init:
+            action: core.noop
+            next:
+              - do: task1
+          task1:
+            action: core.noop
+            next:
+              - do: task2
+          task2:
+            action: core.noop
+            next:
+              - when: <% ctx(loop) = true %>
+                publish:
+                  - loop: False
+                do: task1
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        for task_name in ["init", "task1", "task2", "task1", "task2"]:
+            self.forward_task_statuses(conductor, task_name, [statuses.RUNNING, statuses.SUCCEEDED])
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        # The sequence of a task is the last entry of the task followed by the entries that
+        # succeed any entry of the task, which is the same as scanning the whole sequence.
+        state = conductor.workflow_state
+
+        for task_id, expected_idxs in [("init", [0, 1]), ("task1", [3, 2, 4]), ("task2", [4, 3])]:
+            expected_seq = [(expected_idxs[0], state.get_task(task_id, 0))]
+
+            for i, t in enumerate(state.sequence):
+                for prev_idx in t["prev"].values():
+                    if state.sequence[prev_idx]["id"] == task_id:
+                        expected_seq.append((i, t))
+
+            self.assertListEqual(state.get_task_sequence(task_id, 0), expected_seq)
+            self.assertListEqual([i for i, t in expected_seq], expected_idxs)
@@ -12,13 +12,102 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+
 from orquesta import conducting
+from orquesta import events
+from orquesta import exceptions as exc
 from orquesta.specs import native as native_specs
 from orquesta import statuses
 from orquesta.tests.unit import base as test_base
 
 
 class WorkflowConductorWithItemsTest(test_base.WorkflowConductorWithItemsTest):
+    def test_get_task_action_specs(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+
+        tasks:
+          task1:
+            with:
+              items: <% ctx(xs) %>
+              concurrency: 1
+            action: core.echo message=<% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        expected_action_specs = [
+            {"action": "core.echo", "input": {"message": "fee"}, "item_id": 0},
+            {"action": "core.echo", "input": {"message": "fi"}, "item_id": 1},
+        ]
+
+        # The action specs of all the items are returned as a list.
+        task = conductor.get_task("task1", 0)
+        self.assertIsInstance(task["actions"], list)
+        self.assertListEqual(task["actions"], expected_action_specs)
+        self.assertListEqual(json.loads(json.dumps(task["actions"])), expected_action_specs)
+
+        # The action specs of the items to dispatch per concurrency are returned as a list.
+        task = conductor.get_next_tasks()[0]
+        self.assertIsInstance(task["actions"], list)
+        self.assertListEqual(task["actions"], expected_action_specs[:1])
+
+    def test_item_expression_does_not_modify_context(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - a: 1
+              - a: 2
+
+        tasks:
+          task1:
+            with: x in {{ ctx('xs') }}
+            action: core.echo
+            input:
+              message: "{% set _ = item('x').update({'b': 0}) %}{{ item('x') }}"
+              xs: "{% set _ = ctx('xs').append(3) %}{{ ctx('xs') | length }}"
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The expressions of each item modify copies of the item and of the base context.
+        expected_action_specs = [
+            {
+                "action": "core.echo",
+                "input": {"message": "{'a': 1, 'b': 0}", "xs": "3"},
+                "item_id": 0,
+            },
+            {
+                "action": "core.echo",
+                "input": {"message": "{'a': 2, 'b': 0}", "xs": "3"},
+                "item_id": 1,
+            },
+        ]
+
+        task = conductor.get_next_tasks()[0]
+        self.assertListEqual(task["actions"], expected_action_specs)
+
+        expected_ctx = {"xs": [{"a": 1}, {"a": 2}]}
+        self.assertDictEqual(conductor.workflow_state.contexts[0], expected_ctx)
+        self.assertDictEqual(conductor.get_task_context([0]), expected_ctx)
+        self.assertEqual(conductor.get_task("task1", 0)["items_count"], 2)
+
     def test_empty_items_list(self):
         wf_def = """
         version: 1.0
@@ -228,6 +317,232 @@ class WorkflowConductorWithItemsTest(test_base.WorkflowConductorWithItemsTest):
         expected_output = {"items": task_ctx["xs"]}
         self.assertDictEqual(conductor.get_workflow_output(), expected_output)
 
+    def test_basic_items_list_with_item_results_added_to_conductor(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+              - fo
+              - fum
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+            next:
+              - publish:
+                  - items: <% result() %>
+
+        output:
+          - items: <% ctx(items) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        task_route = 0
+        task_name = "task1"
+        items = ["fee", "fi", "fo", "fum"]
+
+        next_tasks = conductor.get_next_tasks()
+        self.assertEqual(len(next_tasks[0]["actions"]), len(items))
+
+        for item_id in range(0, len(items)):
+            ac_ex_event = events.TaskItemActionExecutionEvent(item_id, statuses.RUNNING)
+            conductor.update_task_state(task_name, task_route, ac_ex_event)
+
+        # Complete the items in reverse order and only pass the result of each item.
+        for item_id in reversed(range(0, len(items))):
+            conductor.add_task_item_result(task_name, task_route, item_id, items[item_id])
+            ac_ex_event = events.TaskItemActionExecutionEvent(
+                item_id, statuses.SUCCEEDED, result=items[item_id]
+            )
+            conductor.update_task_state(task_name, task_route, ac_ex_event)
+
+        # Assert the workflow succeeded and the item results are cleared from the store.
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertFalse(conductor.task_item_result_store.has_results(task_name, task_route))
+        self.assertNotIn("item_results", conductor.serialize())
+
+        # Assert the workflow output is assembled from the item results.
+        conductor.render_workflow_output()
+        self.assertDictEqual(conductor.get_workflow_output(), {"items": items})
+
+    def test_item_results_are_serialized(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+              - fo
+              - fum
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+            next:
+              - publish:
+                  - items: <% result() %>
+
+        output:
+          - items: <% ctx(items) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        task_route = 0
+        task_name = "task1"
+        items = ["fee", "fi", "fo", "fum"]
+
+        conductor.get_next_tasks()
+
+        for item_id in range(0, len(items)):
+            ac_ex_event = events.TaskItemActionExecutionEvent(item_id, statuses.RUNNING)
+            conductor.update_task_state(task_name, task_route, ac_ex_event)
+
+        base = conductor.serialize()
+        conductor.checkpoint()
+        deltas = []
+
+        # Reload the conductor from the full serialization and the deltas between events.
+        for item_id in range(0, len(items)):
+            conductor.add_task_item_result(task_name, task_route, item_id, items[item_id])
+            data = conductor.serialize()
+            deltas.append(conductor.serialize_delta())
+
+            self.assertDictEqual(
+                data["item_results"],
+                {"task1__r0": {str(i): items[i] for i in range(0, item_id + 1)}},
+            )
+
+            conductor = conducting.WorkflowConductor.deserialize(data)
+            self.assertDictEqual(
+                conducting.WorkflowConductor.deserialize(base, deltas=deltas).serialize(), data
+            )
+
+            conductor.checkpoint()
+            ac_ex_event = events.TaskItemActionExecutionEvent(item_id, statuses.SUCCEEDED)
+            conductor.update_task_state(task_name, task_route, ac_ex_event)
+
+        # The item results are removed once the task is completed.
+        data = conductor.serialize()
+        deltas.append(conductor.serialize_delta())
+        self.assertNotIn("item_results", data)
+        self.assertDictEqual(
+            conducting.WorkflowConductor.deserialize(base, deltas=deltas).serialize(), data
+        )
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        conductor.render_workflow_output()
+        self.assertDictEqual(conductor.get_workflow_output(), {"items": items})
+
+    def test_item_results_missing(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        conductor.get_next_tasks()
+
+        for item_id in range(0, 2):
+            ac_ex_event = events.TaskItemActionExecutionEvent(item_id, statuses.RUNNING)
+            conductor.update_task_state("task1", 0, ac_ex_event)
+
+        # The task cannot be completed if the result of a completed item is missing.
+        conductor.add_task_item_result("task1", 0, 1, "fi")
+        ac_ex_event = events.TaskItemActionExecutionEvent(1, statuses.SUCCEEDED)
+        conductor.update_task_state("task1", 0, ac_ex_event)
+        ac_ex_event = events.TaskItemActionExecutionEvent(0, statuses.SUCCEEDED)
+        expected_data = conductor.serialize()
+
+        self.assertRaises(
+            exc.TaskItemResultsError, conductor.update_task_state, "task1", 0, ac_ex_event
+        )
+
+        # The results are validated before the workflow state is updated.
+        self.assertDictEqual(conductor.serialize(), expected_data)
+        self.assertEqual(conductor.get_task_state_entry("task1", 0)["status"], statuses.RUNNING)
+
+        # The task is completed once the result of the item is added.
+        conductor.add_task_item_result("task1", 0, 0, "fee")
+        conductor.update_task_state("task1", 0, ac_ex_event)
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertFalse(conductor.task_item_result_store.has_results("task1", 0))
+
+        store = conductor.task_item_result_store
+        store.add_item_result("task2", 0, 1, "fi")
+        self.assertRaises(exc.TaskItemResultsError, store.get_accumulated_result, "task2", 0, 2)
+        self.assertListEqual(
+            store.get_accumulated_result("task2", 0, 2, item_ids=[1]), [None, "fi"]
+        )
+
+    def test_add_task_item_result_invalid_item(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The items are not tracked until the task is returned.
+        self.assertRaises(
+            exc.InvalidTaskStateEntry, conductor.add_task_item_result, "task1", 0, 0, "fee"
+        )
+
+        conductor.get_next_tasks()
+
+        self.assertRaises(exc.InvalidTask, conductor.add_task_item_result, "task2", 0, 0, "fee")
+        self.assertRaises(
+            exc.InvalidTaskStateEntry, conductor.add_task_item_result, "task1", 1, 0, "fee"
+        )
+
+        for item_id in [-1, 2, "0", None]:
+            self.assertRaises(
+                exc.InvalidTaskItem, conductor.add_task_item_result, "task1", 0, item_id, "fee"
+            )
+
+        ac_ex_event = events.TaskItemActionExecutionEvent(2, statuses.RUNNING)
+        self.assertRaises(exc.InvalidTaskItem, conductor.update_task_state, "task1", 0, ac_ex_event)
+        self.assertFalse(conductor.task_item_result_store.has_results("task1", 0))
+
     def test_basic_items_list_with_different_types(self):
         wf_def = """
         version: 1.0
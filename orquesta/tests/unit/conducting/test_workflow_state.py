@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import copy
+import json
 import unittest
 
 from orquesta import conducting
@@ -264,3 +265,269 @@ class WorkflowStateTest(unittest.TestCase):
         actual_task_sequence = state.get_tasks_by_status(statuses.SUCCEEDED, last_occurrence=True)
 
         self.assertListEqual(actual_task_sequence, expected_task_sequence)
+
+    def test_get_view(self):
+        data = copy.deepcopy(MOCK_WORKFLOW_STATE)
+
+        task_sequence = [
+            {"id": "task1", "route": 0, "status": "succeeded"},
+            {"id": "task2", "route": 0, "status": "running"},
+        ]
+
+        data["sequence"] = copy.deepcopy(task_sequence)
+        data["tasks"] = {"task1__r0": 0, "task2__r0": 1}
+
+        state = conducting.WorkflowState.deserialize(data)
+        view = state.get_view()
+
+        self.assertIsInstance(view, conducting.WorkflowStateView)
+        self.assertDictEqual(dict(view), state.serialize())
+        self.assertEqual(view, state.serialize())
+
+        # Entries are copied when they are read so the workflow state cannot be modified.
+        view["sequence"][1]["status"] = "failed"
+        self.assertEqual(state.sequence[1]["status"], "running")
+        self.assertEqual(view["sequence"][1]["status"], "running")
+
+        # Copies of the view are plain dictionaries that can be dumped to JSON.
+        self.assertIsInstance(copy.deepcopy(view), dict)
+        self.assertIsInstance(view.toDict(), dict)
+        self.assertIsInstance(view.toDict()["sequence"], list)
+        self.assertIsInstance(view.toDict()["tasks"], dict)
+        self.assertDictEqual(json.loads(json.dumps(view.toDict())), state.serialize())
+
+    def test_get_view_is_snapshot(self):
+        state = conducting.WorkflowState.deserialize(copy.deepcopy(MOCK_WORKFLOW_STATE))
+        state.status = statuses.RUNNING
+        view = state.get_view()
+
+        self.assertNotIn("reruns", view)
+        self.assertRaises(KeyError, view.__getitem__, "foobar")
+
+        state.status = statuses.SUCCEEDED
+        state.contexts.append({"foo": "bar"})
+        state.add_task_state_entry({"id": "task1", "route": 0, "status": statuses.RUNNING})
+        state.add_staged_task("task2", 0)
+
+        # The changes to the workflow state after the view is created are not in the view.
+        self.assertEqual(view["status"], statuses.RUNNING)
+        self.assertListEqual(list(view["contexts"]), [])
+        self.assertListEqual(list(view["sequence"]), [])
+        self.assertListEqual(list(view["staged"]), [])
+        self.assertDictEqual(dict(view["tasks"]), {})
+        self.assertNotIn("task1__r0", view["tasks"])
+
+        view = state.get_view()
+        state.add_task_state_entry({"id": "task1", "route": 0, "status": statuses.PENDING})
+
+        self.assertEqual(view["status"], statuses.SUCCEEDED)
+        self.assertEqual(len(view["sequence"]), 1)
+        self.assertDictEqual(dict(view["tasks"]), {"task1__r0": 0})
+        self.assertDictEqual(dict(state.get_view()["tasks"]), {"task1__r0": 1})
+
+    def test_status_index(self):
+        state = conducting.WorkflowState()
+
+        task1 = {"id": "task1", "route": 0, "status": statuses.RUNNING}
+        state.add_task_state_entry(task1)
+
+        self.assertTrue(state.has_active_tasks)
+        self.assertListEqual(state.get_tasks_by_status([statuses.RUNNING]), [(0, task1)])
+
+        state.update_task_status(task1, statuses.PAUSED)
+
+        self.assertFalse(state.has_active_tasks)
+        self.assertTrue(state.has_paused_tasks)
+        self.assertListEqual(state.get_tasks_by_status([statuses.RUNNING]), [])
+        self.assertListEqual(state.get_tasks_by_status([statuses.PAUSED]), [(0, task1)])
+
+        # A new entry for the same task and route replaces the last occurrence.
+        task1_cycle = {"id": "task1", "route": 0}
+        state.add_task_state_entry(task1_cycle)
+        state.update_task_status(task1_cycle, statuses.RUNNING)
+
+        self.assertTrue(state.has_active_tasks)
+        self.assertFalse(state.has_paused_tasks)
+        self.assertDictEqual(state.tasks, {"task1__r0": 1})
+        self.assertListEqual(state.get_tasks_by_status([statuses.PAUSED]), [])
+
+        self.assertListEqual(
+            state.get_tasks_by_status([statuses.PAUSED], last_occurrence=False), [(0, task1)]
+        )
+
+        self.assertListEqual(
+            state.get_tasks(task_id="task1", last_occurrence=True), [(1, task1_cycle)]
+        )
+
+    def test_staged_index(self):
+        state = conducting.WorkflowState()
+
+        state.add_staged_task("task1", 0)
+        state.add_staged_task("task2", 1, ready=False)
+
+        self.assertEqual(state.get_staged_task("task1", 0)["id"], "task1")
+        self.assertEqual(state.get_staged_task("task2", 1)["route"], 1)
+        self.assertIsNone(state.get_staged_task("task2", 0))
+
+        state.remove_staged_task("task1", 0)
+
+        self.assertIsNone(state.get_staged_task("task1", 0))
+        self.assertListEqual([x["id"] for x in state.staged], ["task2"])
+
+    def test_staged_task_items(self):
+        items = conducting.StagedTaskItems(4)
+
+        self.assertEqual(len(items), 4)
+        self.assertDictEqual(items[0], {"status": statuses.UNSET})
+        self.assertListEqual(items.get_indices(statuses.UNSET, limit=2), [0, 1])
+
+        items.set_status(0, statuses.RUNNING)
+        items.set_status(1, statuses.SUCCEEDED)
+        items.set_status(2, statuses.FAILED)
+
+        self.assertEqual(items.get_status(0), statuses.RUNNING)
+        self.assertEqual(items.count_statuses(statuses.ACTIVE_STATUSES), 1)
+        self.assertEqual(items.count_statuses(statuses.COMPLETED_STATUSES), 2)
+        self.assertListEqual(items.get_indices(statuses.UNSET), [3])
+
+        expected_counts = {
+            statuses.RUNNING: 1,
+            statuses.SUCCEEDED: 1,
+            statuses.FAILED: 1,
+            statuses.UNSET: 1,
+        }
+
+        self.assertDictEqual(dict(items.get_status_counts()), expected_counts)
+
+        items.reset_statuses(statuses.ABENDED_STATUSES)
+
+        self.assertListEqual(items.get_indices(statuses.UNSET), [2, 3])
+        self.assertEqual(items.count_statuses([statuses.FAILED]), 0)
+
+    def test_staged_task_items_serialization(self):
+        data = copy.deepcopy(MOCK_WORKFLOW_STATE)
+
+        data["staged"] = [
+            {
+                "id": "task1",
+                "route": 0,
+                "ctxs": {"in": [0]},
+                "prev": {},
+                "items": [{"status": statuses.SUCCEEDED}, {"status": statuses.UNSET}],
+            }
+        ]
+
+        state = conducting.WorkflowState.deserialize(data)
+        items = state.get_staged_task("task1", 0)["items"]
+
+        self.assertIsInstance(items, conducting.StagedTaskItems)
+        self.assertEqual(items.count_statuses([statuses.SUCCEEDED]), 1)
+
+        # The items are serialized as the list of status dicts.
+        self.assertDictEqual(state.serialize(), data)
+        self.assertListEqual(list(state.get_view()["staged"]), data["staged"])
+
+        items.set_status(1, statuses.RUNNING)
+        data["staged"][0]["items"][1]["status"] = statuses.RUNNING
+
+        self.assertDictEqual(state.serialize(), data)
+
+    def test_indexes_rebuilt_on_deserialize(self):
+        data = copy.deepcopy(MOCK_WORKFLOW_STATE)
+
+        data["sequence"] = [
+            {"id": "task1", "route": 0, "status": statuses.CANCELED},
+            {"id": "task1", "route": 0, "status": statuses.RUNNING},
+            {"id": "task2", "route": 0, "status": statuses.CANCELING},
+        ]
+
+        data["tasks"] = {"task1__r0": 1, "task2__r0": 2}
+        data["staged"] = [{"id": "task3", "route": 0, "ctxs": {"in": [0]}, "prev": {}}]
+
+        state = conducting.WorkflowState.deserialize(data)
+
+        self.assertTrue(state.has_active_tasks)
+        self.assertTrue(state.has_canceling_tasks)
+        self.assertFalse(state.has_canceled_tasks)
+        self.assertIsNotNone(state.get_staged_task("task3", 0))
+
+        # The indexes are not part of the serialized workflow state.
+        self.assertDictEqual(state.serialize(), data)
+
+    def test_get_task_sequence(self):
+        data = copy.deepcopy(MOCK_WORKFLOW_STATE)
+
+        # task1 -> task2 -> task3 -> task4 where task2 splits into task5.
+        task_sequence = [
+            {"id": "task1", "route": 0, "prev": {}},
+            {"id": "task2", "route": 0, "prev": {"task1__t0": 0}},
+            {"id": "task3", "route": 0, "prev": {"task2__t0": 1}},
+            {"id": "task5", "route": 0, "prev": {"task2__t1": 1}},
+            {"id": "task4", "route": 0, "prev": {"task3__t0": 2}},
+            {"id": "task6", "route": 0, "prev": {}},
+        ]
+
+        data["sequence"] = copy.deepcopy(task_sequence)
+        data["tasks"] = {"%s__r0" % t["id"]: i for i, t in enumerate(task_sequence)}
+        state = conducting.WorkflowState.deserialize(data)
+
+        self.assertListEqual([i for i, t in state.get_task_sequence("task1", 0)], [0, 1])
+        self.assertListEqual([i for i, t in state.get_task_sequence("task2", 0)], [1, 2, 3])
+
+        self.assertListEqual([i for i, t in state.get_task_sequence("task3", 0)], [2, 4])
+        self.assertListEqual([i for i, t in state.get_task_sequence("task4", 0)], [4])
+        self.assertListEqual([i for i, t in state.get_task_sequence("task6", 0)], [5])
+
+        # The index of successors is kept in sync when entries are added.
+        state.add_task_state_entry({"id": "task7", "route": 0, "prev": {"task4__t0": 4}})
+
+        self.assertListEqual([i for i, t in state.get_task_sequence("task3", 0)], [2, 4])
+        self.assertListEqual([i for i, t in state.get_task_sequence("task4", 0)], [4, 6])
+
+    def test_get_task_sequence_with_cycle(self):
+        data = copy.deepcopy(MOCK_WORKFLOW_STATE)
+
+        task_sequence = [
+            {"id": "init", "route": 0, "prev": {}},
+            {"id": "task1", "route": 0, "prev": {"init__t0": 0}},
+            {"id": "task2", "route": 0, "prev": {"task1__t0": 1}},
+            {"id": "task1", "route": 0, "prev": {"task2__t0": 2}},
+            {"id": "task2", "route": 0, "prev": {"task1__t0": 3}},
+        ]
+
+        data["sequence"] = copy.deepcopy(task_sequence)
+        data["tasks"] = {"init__r0": 0, "task1__r0": 3, "task2__r0": 4}
+        state = conducting.WorkflowState.deserialize(data)
+
+        # The successors of every entry of the task are included in the order of the sequence.
+        self.assertListEqual([i for i, t in state.get_task_sequence("init", 0)], [0, 1])
+        self.assertListEqual([i for i, t in state.get_task_sequence("task1", 0)], [3, 2, 4])
+        self.assertListEqual([i for i, t in state.get_task_sequence("task2", 0)], [4, 3])
+
+    def test_get_changes(self):
+        data = copy.deepcopy(MOCK_WORKFLOW_STATE)
+        data["sequence"] = [{"id": "task1", "route": 0, "status": statuses.RUNNING}]
+        data["tasks"] = {"task1__r0": 0}
+        state = conducting.WorkflowState.deserialize(data)
+
+        # There is no change if the workflow state is just deserialized.
+        self.assertDictEqual(state.get_changes(), {})
+
+        # Track the changes to the existing entries and the new entries.
+        state.update_task_status(state.sequence[0], statuses.SUCCEEDED)
+        state.add_task_state_entry({"id": "task2", "route": 0})
+        state.status = statuses.SUCCEEDED
+
+        expected_changes = {
+            "sequence": {"appended": [1, 2], "modified": [0]},
+            "status": {"modified": True},
+            "tasks": {"modified": True},
+        }
+
+        self.assertDictEqual(state.get_changes(), expected_changes)
+
+        # Only the changes for the serialized sections are reset.
+        self.assertListEqual(list(state.serialize(sections=["sequence"]).keys()), ["sequence"])
+        self.assertDictEqual(
+            state.get_changes(), {k: expected_changes[k] for k in ["status", "tasks"]}
+        )
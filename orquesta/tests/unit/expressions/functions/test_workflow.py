@@ -14,6 +14,7 @@
 
 import unittest
 
+from orquesta import conducting
 from orquesta import constants
 from orquesta import exceptions as exc
 from orquesta.expressions.functions import workflow as funcs
@@ -398,3 +399,19 @@ class WorkflowFunctionTest(unittest.TestCase):
         self.assertEqual(funcs.task_status_(current_ctx, "t5"), statuses.FAILED)
         self.assertEqual(funcs.task_status_(current_ctx, "t6"), statuses.FAILED)
         self.assertEqual(funcs.task_status_(current_ctx, "t7"), statuses.DELAYED)
+
+    def test_task_status_with_workflow_state_view(self):
+        state = conducting.WorkflowState.deserialize(
+            {
+                "routes": [[]],
+                "sequence": [{"id": "t1", "route": 0, "status": statuses.SUCCEEDED}],
+                "tasks": {"t1__r0": 0},
+            }
+        )
+
+        context = {"__current_task": {"id": "t1", "route": 0}, "__state": state.get_view()}
+
+        self.assertEqual(funcs.task_status_(context, "t1"), statuses.SUCCEEDED)
+        self.assertEqual(funcs.task_status_(context, "t2"), statuses.UNSET)
+        self.assertTrue(funcs.succeeded_(context))
+        self.assertFalse(funcs.failed_(context))
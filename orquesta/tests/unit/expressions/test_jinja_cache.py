@@ -0,0 +1,96 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from orquesta.expressions import jinja as jinja_expr
+from orquesta.tests.unit import base as test_base
+
+
+class JinjaCacheTest(test_base.ExpressionEvaluatorTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.language = "jinja"
+        super(JinjaCacheTest, cls).setUpClass()
+
+    def setUp(self):
+        super(JinjaCacheTest, self).setUp()
+        self.evaluator.clear_cache()
+
+    def tearDown(self):
+        self.evaluator.set_cache_size(self.evaluator.cache_size)
+        self.evaluator.clear_cache()
+        super(JinjaCacheTest, self).tearDown()
+
+    def test_compiled_expression_is_cached(self):
+        expr = "{{ ctx('foo') }} and {{ ctx('bar') }}"
+
+        self.assertEqual(self.evaluator.evaluate(expr, {"foo": "fee", "bar": "fi"}), "fee and fi")
+        self.assertEqual(self.evaluator.evaluate(expr, {"foo": "fo", "bar": "fum"}), "fo and fum")
+
+        stats = self.evaluator.get_cache_stats()
+        self.assertDictEqual(
+            stats["expressions"], {"hits": 2, "misses": 2, "size": 2, "maxsize": 1024}
+        )
+        self.assertDictEqual(
+            stats["templates"], {"hits": 0, "misses": 0, "size": 0, "maxsize": 1024}
+        )
+
+    def test_compiled_template_is_cached(self):
+        expr = "{% for i in ctx().x %}{{ i }}{% endfor %}"
+
+        self.assertEqual(self.evaluator.evaluate(expr, {"x": ["a", "b", "c"]}), "abc")
+        self.assertEqual(self.evaluator.evaluate(expr, {"x": ["d", "e"]}), "de")
+
+        stats = self.evaluator.get_cache_stats()
+        self.assertDictEqual(
+            stats["templates"], {"hits": 1, "misses": 1, "size": 1, "maxsize": 1024}
+        )
+
+    def test_raw_block_template_is_not_cached(self):
+        expr = "{{ ctx().foo }} {% raw %}{{ ctx().foo }}{% endraw %}"
+
+        self.assertEqual(self.evaluator.evaluate(expr, {"foo": "bar"}), "bar {{ ctx().foo }}")
+        self.assertEqual(self.evaluator.evaluate(expr, {"foo": "bar"}), "bar {{ ctx().foo }}")
+
+        # The raw blocks are rendered with the evaluated data so the template is not cached.
+        stats = self.evaluator.get_cache_stats()
+        self.assertDictEqual(
+            stats["templates"], {"hits": 0, "misses": 0, "size": 0, "maxsize": 1024}
+        )
+
+    def test_data_text_is_not_cached(self):
+        data = {"foo": "{{ ctx().bar }}", "bar": "fee", "fum": "{{ ctx().foo }} fi"}
+
+        self.assertEqual(self.evaluator.evaluate("{{ ctx().foo | trim }}", data), "fee")
+        self.assertEqual(self.evaluator.evaluate("{{ ctx().fum }} fo", data), "fee fi fo")
+
+        stats = self.evaluator.get_cache_stats()
+        self.assertEqual(stats["expressions"]["size"], 2)
+        self.assertEqual(stats["templates"]["size"], 0)
+
+    def test_undefined_error_is_raised_from_cached_expression(self):
+        expr = "{{ ctx().foo | upper }}"
+
+        self.assertEqual(self.evaluator.evaluate(expr, {"foo": "bar"}), "BAR")
+
+        self.assertRaises(
+            jinja_expr.JinjaEvaluationException, self.evaluator.evaluate, expr, {"fu": "bar"}
+        )
+
+        self.assertEqual(self.evaluator.get_cache_stats()["expressions"]["hits"], 1)
+
+    def test_set_cache_size(self):
+        self.evaluator.set_cache_size(0)
+
+        self.assertEqual(self.evaluator.evaluate("{{ ctx().foo }}", {"foo": "bar"}), "bar")
+        self.assertEqual(self.evaluator.get_cache_stats()["expressions"]["size"], 0)
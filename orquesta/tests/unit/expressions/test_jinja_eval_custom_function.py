@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from orquesta import conducting
 from orquesta.expressions import jinja as jinja_expr
+from orquesta import statuses
 from orquesta.tests.unit import base as test_base
+from orquesta.utils import context as ctx_util
 from orquesta.utils import plugin as plugin_util
 
 
@@ -34,7 +37,44 @@ class JinjaEvaluationTest(test_base.ExpressionEvaluatorTest):
 
         self.assertDictEqual({"a": 123}, self.evaluator.evaluate(expr))
 
+    def test_custom_functions_are_not_added_to_context(self):
+        ctx = self.evaluator.contextualize({"foo": "bar"})
+
+        self.assertListEqual(
+            sorted(ctx.keys()), ["__current_item", "__current_task", "__state", "__vars"]
+        )
+
+        # The functions that take the context are passed the context of the evaluation.
+        self.assertEqual(self.evaluator.evaluate("{{ json('[1, 2]') | length }}"), 2)
+        self.assertEqual(self.evaluator.evaluate("{{ ctx('foo') }}", {"foo": "bar"}), "bar")
+        self.assertEqual(self.evaluator.evaluate("{{ ctx('foo') }}", {"foo": "fu"}), "fu")
+
+        expr = "{% for i in ctx('xs') %}{{ ctx('foo') }}{{ i }}{% endfor %}"
+        self.assertEqual(self.evaluator.evaluate(expr, {"foo": "-", "xs": [1, 2]}), "-1-2")
+
     def test_custom_function_failure(self):
         expr = "{{ json(int(123)) }}"
 
         self.assertRaises(jinja_expr.JinjaEvaluationException, self.evaluator.evaluate, expr)
+
+    def test_custom_function_with_workflow_state_view(self):
+        state = conducting.WorkflowState.deserialize(
+            {
+                "routes": [[]],
+                "sequence": [{"id": "t1", "route": 0, "status": statuses.SUCCEEDED}],
+                "tasks": {"t1__r0": 0},
+            }
+        )
+
+        data = {"__current_task": {"id": "t1", "route": 0}, "__state": state.get_view()}
+
+        self.assertEqual(
+            statuses.SUCCEEDED, self.evaluator.evaluate("{{ task_status('t1') }}", data)
+        )
+
+    def test_custom_function_with_context_overlay(self):
+        data = ctx_util.set_current_item({"foo": "bar", "__current_item": None}, {"x": 1})
+
+        self.assertEqual(1, self.evaluator.evaluate("{{ item('x') }}", data))
+        self.assertEqual("bar", self.evaluator.evaluate("{{ ctx('foo') }}", data))
+        self.assertDictEqual({"foo": "bar"}, self.evaluator.evaluate("{{ ctx() }}", data))
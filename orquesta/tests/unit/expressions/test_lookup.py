@@ -0,0 +1,168 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import unittest
+
+from orquesta.expressions import base as expr_base
+from orquesta.expressions import jinja as jinja_expr
+from orquesta.expressions import yql as yaql_expr
+
+
+class LookupExpressionTest(unittest.TestCase):
+    def setUp(self):
+        super(LookupExpressionTest, self).setUp()
+
+        self.data = {
+            "a": {"b": {"c": [1, 2, {"d": None}]}, "items": "foo"},
+            "x": "foobar",
+            "y": "<% ctx(x) %>",
+            "z": "{{ ctx('x') }}",
+            "n": None,
+            "t": (1, 2),
+            "s": {1, 2},
+            "__private": "fu",
+            "__current_task": {"id": "t1", "route": 0, "result": {"stdout": "foo", "code": 0}},
+            "__current_item": {"k": "v", "l": {"m": 1}},
+        }
+
+    def assert_same_as_engine(self, evaluator, expr, data, expected_fast_path):
+        with mock.patch.object(
+            evaluator, "_evaluate_lookup", mock.MagicMock(return_value=(False, None))
+        ):
+            try:
+                expected, expected_error = evaluator.evaluate(expr, data), None
+            except Exception as e:
+                expected, expected_error = None, e
+
+        fast_path = evaluator._evaluate_lookup(expr, data)[0]
+        self.assertEqual(fast_path, expected_fast_path, expr)
+
+        if expected_error:
+            with self.assertRaises(expected_error.__class__) as cm:
+                evaluator.evaluate(expr, data)
+
+            self.assertEqual(str(cm.exception), str(expected_error))
+        else:
+            result = evaluator.evaluate(expr, data)
+            self.assertEqual(type(result), type(expected), expr)
+
+            # The methods are bound to the copies of the values that the engine is given.
+            if callable(expected):
+                self.assertEqual(result.__name__, expected.__name__, expr)
+            else:
+                self.assertEqual(result, expected, expr)
+
+    def test_parse_lookup(self):
+        self.assertEqual(expr_base.parse_lookup("ctx()"), ("ctx", None, ()))
+        self.assertEqual(expr_base.parse_lookup("ctx('a').b.c"), ("ctx", "a", ("b", "c")))
+        self.assertEqual(expr_base.parse_lookup('ctx( "a" )'), ("ctx", "a", ()))
+        self.assertEqual(expr_base.parse_lookup("ctx(a)", bare_keys=True), ("ctx", "a", ()))
+        self.assertEqual(expr_base.parse_lookup("item()"), ("item", None, ()))
+        self.assertEqual(expr_base.parse_lookup("result().stdout"), ("result", None, ("stdout",)))
+        self.assertIsNone(expr_base.parse_lookup("ctx(a)"))
+        self.assertIsNone(expr_base.parse_lookup("ctx(true)", bare_keys=True))
+        self.assertIsNone(expr_base.parse_lookup("ctx().a.not"))
+        self.assertIsNone(expr_base.parse_lookup("ctx().__a"))
+        self.assertIsNone(expr_base.parse_lookup("result('a')"))
+        self.assertIsNone(expr_base.parse_lookup("ctx().a[0]"))
+        self.assertIsNone(expr_base.parse_lookup("ctx().a.len()"))
+        self.assertIsNone(expr_base.parse_lookup("ctx(a) + 1", bare_keys=True))
+
+    def test_yaql_lookup(self):
+        evaluator = yaql_expr.YAQLEvaluator
+
+        exprs = [
+            ("<% ctx() %>", False),
+            ("<% ctx(a) %>", True),
+            ("<% ctx('a').b.c %>", True),
+            ('<% ctx("a").items %>', True),
+            ("<% ctx().a.b %>", True),
+            ("<% ctx('') %>", False),
+            ("<% ctx(n) %>", True),
+            ("<% ctx(x) %>", True),
+            ("<% ctx(y) %>", False),
+            ("<% ctx(t) %>", True),
+            ("<% ctx(s) %>", False),
+            ("<% ctx(foo) %>", False),
+            ("<% ctx(__private) %>", False),
+            ("<% ctx().a.foo %>", False),
+            ("<% ctx(x).foo %>", False),
+            ("<% item() %>", True),
+            ("<% item(k) %>", True),
+            ("<% item(l).m %>", True),
+            ("<% item(foo) %>", False),
+            ("<% result() %>", True),
+            ("<% result().stdout %>", True),
+            ("<% result().foo %>", False),
+            (" <% ctx(x) %>", False),
+            ("<% ctx(x) %> <% ctx(x) %>", False),
+        ]
+
+        for expr, expected_fast_path in exprs:
+            self.assert_same_as_engine(evaluator, expr, self.data, expected_fast_path)
+
+        data = {"x": "foobar"}
+
+        for expr in ["<% item() %>", "<% item(k) %>", "<% result() %>"]:
+            self.assert_same_as_engine(evaluator, expr, data, expr == "<% item() %>")
+
+        for expr in ["<% ctx(x) %>", "<% item() %>", "<% result() %>"]:
+            self.assert_same_as_engine(evaluator, expr, None, False)
+
+    def test_jinja_lookup(self):
+        evaluator = jinja_expr.JinjaEvaluator
+
+        exprs = [
+            ("{{ ctx() }}", True),
+            ("{{ ctx('a') }}", True),
+            ("{{ ctx('a').b.c }}", True),
+            ("{{ ctx('a').items }}", False),
+            ("{{ ctx().a.b }}", True),
+            ("{{ ctx('n') }}", True),
+            ("{{ ctx('x') }}", True),
+            ("{{ ctx('z') }}", False),
+            ("{{ ctx('t') }}", True),
+            ("{{ ctx('s') }}", True),
+            ("{{ ctx(x) }}", False),
+            ("{{ ctx('foo') }}", False),
+            ("{{ ctx('__private') }}", False),
+            ("{{ ctx().a.foo }}", False),
+            ("{{ item() }}", True),
+            ("{{ item('k') }}", True),
+            ("{{ item('l').m }}", True),
+            ("{{ item('foo') }}", False),
+            ("{{ result() }}", True),
+            ("{{ result().stdout }}", True),
+            ("{{ result().foo }}", False),
+            ("{{ ctx('x') }}{% raw %}{{ ctx('x') }}{% endraw %}", False),
+        ]
+
+        for expr, expected_fast_path in exprs:
+            self.assert_same_as_engine(evaluator, expr, self.data, expected_fast_path)
+
+        # The value is not copied by the Jinja engine.
+        self.assertIs(evaluator.evaluate("{{ ctx('a') }}", self.data), self.data["a"])
+
+        data = {"x": "foobar"}
+
+        for expr in ["{{ item() }}", "{{ item('k') }}", "{{ result() }}"]:
+            self.assert_same_as_engine(evaluator, expr, data, expr == "{{ item() }}")
+
+    def test_yaql_lookup_copies_value(self):
+        result = yaql_expr.YAQLEvaluator.evaluate("<% ctx(a) %>", self.data)
+
+        self.assertDictEqual(result, self.data["a"])
+        self.assertIsNot(result, self.data["a"])
+        self.assertIsNot(result["b"]["c"], self.data["a"]["b"]["c"])
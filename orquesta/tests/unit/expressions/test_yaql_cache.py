@@ -0,0 +1,95 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from orquesta.expressions import yql as yaql_expr
+from orquesta.tests.unit import base as test_base
+
+
+class YAQLCacheTest(test_base.ExpressionEvaluatorTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.language = "yaql"
+        super(YAQLCacheTest, cls).setUpClass()
+
+    def setUp(self):
+        super(YAQLCacheTest, self).setUp()
+        self.evaluator.clear_cache()
+
+    def tearDown(self):
+        self.evaluator.set_cache_size(self.evaluator.cache_size)
+        self.evaluator.clear_cache()
+        super(YAQLCacheTest, self).tearDown()
+
+    def test_parsed_expression_is_cached(self):
+        expr = "<% ctx(foo) %> and <% ctx(bar) %>"
+        data = {"foo": "fee", "bar": "fi"}
+
+        self.assertEqual(self.evaluator.evaluate(expr, data), "fee and fi")
+
+        stats = self.evaluator.get_cache_stats()
+        self.assertDictEqual(
+            stats["expressions"], {"hits": 0, "misses": 2, "size": 2, "maxsize": 1024}
+        )
+        self.assertDictEqual(stats["findall"], {"hits": 0, "misses": 1, "size": 1, "maxsize": 1024})
+
+        data = {"foo": "fo", "bar": "fum"}
+
+        self.assertEqual(self.evaluator.evaluate(expr, data), "fo and fum")
+
+        stats = self.evaluator.get_cache_stats()
+        self.assertDictEqual(
+            stats["expressions"], {"hits": 2, "misses": 2, "size": 2, "maxsize": 1024}
+        )
+        self.assertDictEqual(stats["findall"], {"hits": 1, "misses": 1, "size": 1, "maxsize": 1024})
+
+        # The expression is parsed from the cache when validated.
+        self.assertListEqual(self.evaluator.validate(expr), [])
+        self.assertEqual(self.evaluator.get_cache_stats()["expressions"]["hits"], 4)
+
+    def test_grammar_error_is_not_cached(self):
+        expr = "<% <% ctx(foo) %> %>"
+
+        self.assertEqual(len(self.evaluator.validate(expr)), 1)
+        self.assertEqual(len(self.evaluator.validate(expr)), 1)
+        self.assertEqual(self.evaluator.get_cache_stats()["expressions"]["size"], 0)
+
+    def test_long_text_is_not_cached(self):
+        expr = "<% ctx(foo) %>" + "x" * self.evaluator.cache_max_text_length
+
+        self.assertEqual(self.evaluator.evaluate(expr, {"foo": "bar"}), "bar" + expr[14:])
+        self.assertEqual(self.evaluator.get_cache_stats()["findall"]["size"], 0)
+
+    def test_data_text_is_not_cached(self):
+        data = {"foo": "<% ctx(bar) %>", "bar": "fee", "fum": "<% ctx(foo) %> fi"}
+
+        self.assertEqual(self.evaluator.evaluate("<% ctx(foo) %>", data), "fee")
+        self.assertEqual(self.evaluator.evaluate("<% ctx(fum) %> fo", data), "fee fi fo")
+
+        stats = self.evaluator.get_cache_stats()
+        self.assertEqual(stats["findall"]["size"], 2)
+        self.assertEqual(stats["expressions"]["size"], 2)
+
+    def test_set_cache_size(self):
+        self.evaluator.set_cache_size(1)
+        self.evaluator.evaluate("<% ctx(foo) %> and <% ctx(bar) %>", {"foo": "fee", "bar": "fi"})
+
+        stats = self.evaluator.get_cache_stats()
+        self.assertDictEqual(
+            stats["expressions"], {"hits": 0, "misses": 2, "size": 1, "maxsize": 1}
+        )
+
+        # The cache is disabled if the size is zero.
+        self.evaluator.set_cache_size(0)
+        self.assertEqual(self.evaluator.evaluate("<% ctx(foo) %>", {"foo": "fee"}), "fee")
+        self.assertEqual(yaql_expr.YAQLEvaluator.get_cache_stats()["expressions"]["size"], 0)
@@ -111,3 +111,25 @@ class YAQLEvaluationTest(test_base.ExpressionEvaluatorTest):
         data = {"foo": 101, "bar": 201}
 
         self.assertEqual("101 -> 201", self.evaluator.evaluate(expr, data))
+
+    def test_lazy_input_conversion(self):
+        data = {"foo": {"bar": [{"a": 1}, {"a": 1}, {"a": 2}]}, "fu": [1, 2]}
+        ctx = self.evaluator.contextualize(data)
+
+        # The values are only converted when they are read.
+        self.assertIsInstance(ctx["__vars"], yaql_expr.LazyFrozenDict)
+        self.assertDictEqual(ctx["__vars"]._converted, {})
+        self.assertIsInstance(ctx["__vars"]["foo"], yaql_expr.LazyFrozenDict)
+        self.assertTupleEqual(ctx["__vars"]["foo"]["bar"][0:1], ({"a": 1},))
+        self.assertNotIn("fu", ctx["__vars"]._converted)
+
+        # The lazily converted values are hashable and comparable.
+        self.assertListEqual(
+            self.evaluator.evaluate("<% ctx(foo).bar.distinct() %>", data), [{"a": 1}, {"a": 2}]
+        )
+
+        self.assertTrue(self.evaluator.evaluate("<% ctx(foo) = dict(bar => ctx(foo).bar) %>", data))
+        self.assertDictEqual(self.evaluator.evaluate("<% ctx(foo) %>", data), data["foo"])
+        self.assertListEqual(
+            sorted(self.evaluator.evaluate("<% ctx().keys() %>", data)), ["foo", "fu"]
+        )
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from orquesta import conducting
 from orquesta.expressions import yql as yaql_expr
+from orquesta import statuses
 from orquesta.tests.unit import base as test_base
+from orquesta.utils import context as ctx_util
 from orquesta.utils import plugin as plugin_util
 
 
@@ -38,3 +41,23 @@ class YAQLEvaluationTest(test_base.ExpressionEvaluatorTest):
         expr = "<% json(int(123)) %>"
 
         self.assertRaises(yaql_expr.YaqlEvaluationException, self.evaluator.evaluate, expr)
+
+    def test_custom_function_with_workflow_state_view(self):
+        state = conducting.WorkflowState.deserialize(
+            {
+                "routes": [[]],
+                "sequence": [{"id": "t1", "route": 0, "status": statuses.SUCCEEDED}],
+                "tasks": {"t1__r0": 0},
+            }
+        )
+
+        data = {"__current_task": {"id": "t1", "route": 0}, "__state": state.get_view()}
+
+        self.assertEqual(statuses.SUCCEEDED, self.evaluator.evaluate("<% task_status(t1) %>", data))
+
+    def test_custom_function_with_context_overlay(self):
+        data = ctx_util.set_current_item({"foo": "bar", "__current_item": None}, {"x": 1})
+
+        self.assertEqual(1, self.evaluator.evaluate("<% item(x) %>", data))
+        self.assertEqual("bar", self.evaluator.evaluate("<% ctx(foo) %>", data))
+        self.assertDictEqual({"foo": "bar"}, self.evaluator.evaluate("<% ctx() %>", data))
@@ -0,0 +1,110 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import mock
+import os
+
+import networkx as nx
+
+from orquesta import graphing
+from orquesta.tests.fixtures import loader as fixture_loader
+from orquesta.tests.unit import base as test_base
+from orquesta.utils import graph as graph_util
+
+
+class GraphBackendTest(test_base.WorkflowComposerTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.spec_module_name = "native"
+        super(GraphBackendTest, cls).setUpClass()
+
+    def get_wf_names(self):
+        path = os.path.join(fixture_loader.get_workflow_fixtures_base_path(), "native")
+
+        return sorted(os.path.splitext(f)[0] for f in os.listdir(path) if f.endswith(".yaml"))
+
+    def compose_wf_graphs(self, wf_name):
+        wf_graph = self.compose_wf_ex_graph(wf_name)
+
+        with mock.patch.object(
+            graphing.WorkflowGraph, "graph_cls", graph_util.NetworkxMultiDiGraph
+        ):
+            nx_wf_graph = self.compose_wf_ex_graph(wf_name)
+
+        return wf_graph, nx_wf_graph
+
+    def test_serialize_is_identical(self):
+        for wf_name in self.get_wf_names():
+            wf_graph, nx_wf_graph = self.compose_wf_graphs(wf_name)
+
+            self.assertIsInstance(wf_graph._graph, graph_util.MultiDiGraph)
+            self.assertIsInstance(nx_wf_graph._graph, graph_util.NetworkxMultiDiGraph)
+            self.assertEqual(json.dumps(wf_graph.serialize()), json.dumps(nx_wf_graph.serialize()))
+
+            # The deserialized graph is serialized to the same data.
+            data = wf_graph.serialize()
+            wf_graph = graphing.WorkflowGraph.deserialize(data)
+            self.assertEqual(json.dumps(wf_graph.serialize()), json.dumps(data))
+
+    def test_lookups_are_identical(self):
+        for wf_name in self.get_wf_names():
+            wf_graph, nx_wf_graph = self.compose_wf_graphs(wf_name)
+            tasks = list(wf_graph._graph.nodes)
+
+            self.assertListEqual(wf_graph.roots, nx_wf_graph.roots)
+            self.assertListEqual(wf_graph.leaves, nx_wf_graph.leaves)
+            self.assertDictEqual(wf_graph.get_barriers(), nx_wf_graph.get_barriers())
+
+            for task_id in tasks:
+                self.assertListEqual(
+                    wf_graph.get_next_transitions(task_id),
+                    nx_wf_graph.get_next_transitions(task_id),
+                )
+
+                self.assertListEqual(
+                    wf_graph.get_prev_transitions(task_id),
+                    nx_wf_graph.get_prev_transitions(task_id),
+                )
+
+                self.assertEqual(wf_graph.in_cycle(task_id), nx_wf_graph.in_cycle(task_id))
+
+    def test_strongly_connected_components(self):
+        graph = graph_util.MultiDiGraph()
+
+        for source, destination in [
+            ("a", "b"),
+            ("b", "c"),
+            ("c", "a"),
+            ("c", "d"),
+            ("d", "e"),
+            ("e", "d"),
+            ("e", "f"),
+            ("g", "g"),
+        ]:
+            graph.add_edge(source, destination)
+
+        expected = [{"f"}, {"d", "e"}, {"a", "b", "c"}, {"g"}]
+
+        self.assertListEqual(graph.get_strongly_connected_components(), expected)
+        self.assertListEqual(graph.get_self_loops(), ["g"])
+        self.assertSetEqual(graph_util.get_nodes_in_cycle(graph), {"a", "b", "c", "d", "e", "g"})
+
+    def test_to_networkx(self):
+        wf_graph = self.compose_wf_ex_graph("cycle")
+        nx_graph = wf_graph.to_networkx()
+
+        self.assertIsInstance(nx_graph, nx.MultiDiGraph)
+        self.assertEqual(len(nx_graph), len(wf_graph._graph))
+        self.assertEqual(len(wf_graph.get_cycles()), 1)
@@ -209,6 +209,24 @@ class WorkflowGraphTest(test_base.WorkflowGraphTest):
         expected = ("task2", "task3", 0, {})
         self.assertEqual(wf_graph.get_transition("task2", "task3"), expected)
 
+    def test_get_transition_between_same_tasks(self):
+        wf_graph = self._prep_graph()
+
+        wf_graph.add_transition("task1", "task2", attr1="fubar")
+        wf_graph.update_transition("task1", "task2", 1, attr2="foobar")
+
+        expected = [("task1", "task2", 1, {"attr1": "fubar", "attr2": "foobar"})]
+        self.assertListEqual(wf_graph.has_transition("task1", "task2", attr1="fubar"), expected)
+        self.assertListEqual(wf_graph.has_transition("task1", "task3"), [])
+        self.assertListEqual(wf_graph.has_transition("task998", "task999"), [])
+        self.assertEqual(len(wf_graph.has_transition("task1", "task2")), 2)
+        self.assertEqual(wf_graph.get_transition("task1", "task2", key=1), expected[0])
+        self.assertEqual(wf_graph.get_transition("task1", "task2", attr2="foobar"), expected[0])
+
+        self.assertRaises(
+            exc.InvalidTaskTransition, wf_graph.update_transition, "task1", "task2", 2, foo="bar"
+        )
+
     def test_get_nonexistent_transition(self):
         wf_graph = self._prep_graph()
 
@@ -273,3 +291,57 @@ class WorkflowGraphTest(test_base.WorkflowGraphTest):
         self.assertTrue(
             len(wf_graph.get_prev_transitions("task9")) > 1 and not wf_graph.has_barrier("task9")
         )
+
+    def test_freeze(self):
+        wf_graph = self._prep_graph()
+        wf_graph.add_transition("task6", "task4")
+        wf_graph.update_task("task7", retry={"count": 3})
+
+        tasks = ["task" + str(i) for i in range(1, 10)]
+        next_transitions = {t: wf_graph.get_next_transitions(t) for t in tasks}
+        prev_transitions = {t: wf_graph.get_prev_transitions(t) for t in tasks}
+        roots = wf_graph.roots
+        leaves = wf_graph.leaves
+        data = wf_graph.serialize()
+
+        self.assertIs(wf_graph.freeze(), wf_graph)
+        self.assertTrue(wf_graph.frozen)
+
+        # The lookups of the frozen graph return the same results as the graph.
+        self.assertDictEqual(wf_graph.serialize(), data)
+        self.assertListEqual(wf_graph.roots, roots)
+        self.assertListEqual(wf_graph.leaves, leaves)
+
+        for task_id in tasks:
+            self.assertListEqual(wf_graph.get_next_transitions(task_id), next_transitions[task_id])
+            self.assertListEqual(wf_graph.get_prev_transitions(task_id), prev_transitions[task_id])
+
+        self.assertTrue(wf_graph.has_barrier("task5"))
+        self.assertFalse(wf_graph.has_barrier("task9"))
+        self.assertTrue(wf_graph.task_has_retry("task7"))
+        self.assertFalse(wf_graph.task_has_retry("task9"))
+        self.assertDictEqual(wf_graph.get_task_retry_spec("task7"), {"count": 3})
+        self.assertRaises(exc.InvalidTask, wf_graph.get_barrier, "task10")
+        self.assertRaises(exc.InvalidTask, wf_graph.get_task_retry_spec, "task10")
+
+        # The tasks in the cycle are identified from the strongly connected components.
+        self.assertListEqual(
+            [t for t in tasks if wf_graph.in_cycle(t)], ["task4", "task5", "task6"]
+        )
+
+        # The frozen graph cannot be modified.
+        self.assertRaises(exc.WorkflowGraphFrozenError, wf_graph.add_task, "task10")
+        self.assertRaises(exc.WorkflowGraphFrozenError, wf_graph.update_task, "task1", foo="bar")
+        self.assertRaises(exc.WorkflowGraphFrozenError, wf_graph.set_barrier, "task9")
+        self.assertRaises(exc.WorkflowGraphFrozenError, wf_graph.add_transition, "task9", "task1")
+
+        self.assertRaises(
+            exc.WorkflowGraphFrozenError, wf_graph.update_transition, "task1", "task2", 0, foo="bar"
+        )
+
+    def test_in_cycle(self):
+        wf_graph = self._prep_graph()
+        wf_graph.add_transition("task9", "task9")
+
+        self.assertFalse(wf_graph.in_cycle("task1"))
+        self.assertTrue(wf_graph.in_cycle("task9"))
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from orquesta import exceptions as exc
 from orquesta.specs import native as native_specs
 from orquesta.tests.unit.specs.native import base as test_base
 
@@ -529,6 +530,42 @@ class TaskSpecTest(test_base.OrchestraWorkflowSpecTest):
             tk_with_attr = getattr(wf_spec.tasks[task_name], "with")
             self.assertEqual(tk_with_attr.items, items_expr)
 
+    def test_with_items_render(self):
+        wf_def = """
+            version: 1.0
+
+            input:
+              - xs
+
+            tasks:
+              task1:
+                with: x in <% ctx(xs) %>
+                action: core.echo message=<% 10 / item(x) %>
+        """
+
+        wf_spec = self.instantiate(wf_def)
+
+        self.assertDictEqual(wf_spec.inspect(), {})
+
+        task_spec = wf_spec.tasks.get_task("task1")
+        rendered_spec, action_specs = task_spec.render({"xs": [1, 0, 2]})
+
+        # The number of items is known before any of the items is rendered.
+        self.assertEqual(len(action_specs), 3)
+        self.assertDictEqual(action_specs._action_specs, {})
+
+        expected_action_spec = {"action": "core.echo", "input": {"message": 5}, "item_id": 2}
+        self.assertDictEqual(action_specs[2], expected_action_spec)
+        self.assertDictEqual(action_specs[-1], expected_action_spec)
+        self.assertListEqual(list(action_specs._action_specs.keys()), [2])
+
+        # The error of an item is only raised when the item is rendered.
+        self.assertRaises(exc.ExpressionEvaluationException, action_specs.__getitem__, 1)
+        self.assertRaises(IndexError, action_specs.__getitem__, 3)
+
+        # The representation does not render the items.
+        self.assertEqual(repr(action_specs), "<TaskItemActionSpecs items=3 rendered=1>")
+
     def test_with_items_bad_vars(self):
         wf_def = """
             version: 1.0
@@ -110,6 +110,22 @@ class WorkflowSpecTest(test_base.OrchestraWorkflowSpecTest):
 
         self.assertListEqual(wf_spec.tasks.get_start_tasks(), [("task1", None, None)])
 
+    def test_get_next_and_prev_tasks(self):
+        wf_name = "split"
+        wf_spec = self.get_wf_spec(wf_name)
+
+        expected_next_tasks = [("task5", "<% succeeded() %>", 0), ("task6", "<% succeeded() %>", 0)]
+        expected_prev_tasks = [("task2", "<% succeeded() %>", 0), ("task3", "<% succeeded() %>", 0)]
+
+        self.assertListEqual(wf_spec.tasks.get_next_tasks("task4"), expected_next_tasks)
+        self.assertListEqual(wf_spec.tasks.get_prev_tasks("task4"), expected_prev_tasks)
+        self.assertListEqual(wf_spec.tasks.get_next_tasks("fail"), [])
+        self.assertListEqual(wf_spec.tasks.get_prev_tasks("task1"), [])
+
+        # The lists returned are copies and the index is not changed by the caller.
+        wf_spec.tasks.get_prev_tasks("task4").pop()
+        self.assertListEqual(wf_spec.tasks.get_prev_tasks("task4"), expected_prev_tasks)
+
     def test_is_join_task(self):
         wf_name = "split"
         wf_spec = self.get_wf_spec(wf_name)
@@ -145,6 +161,27 @@ class WorkflowSpecTest(test_base.OrchestraWorkflowSpecTest):
         self.assertTrue(wf_spec.tasks.in_cycle("task2"))
         self.assertTrue(wf_spec.tasks.in_cycle("task3"))
 
+    def test_in_cycle_with_self_transition(self):
+        wf_def = """
+            version: 1.0
+            tasks:
+              task1:
+                action: core.noop
+                next:
+                  - when: <% failed() %>
+                    do: task1
+                  - when: <% succeeded() %>
+                    do: task2
+              task2:
+                action: core.noop
+        """
+
+        wf_spec = native_specs.WorkflowSpec(wf_def)
+
+        self.assertTrue(wf_spec.tasks.has_cycles())
+        self.assertTrue(wf_spec.tasks.in_cycle("task1"))
+        self.assertFalse(wf_spec.tasks.in_cycle("task2"))
+
     def test_in_cycle_of_multiple(self):
         wf_name = "cycles"
         wf_spec = self.get_wf_spec(wf_name)
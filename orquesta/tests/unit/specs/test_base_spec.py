@@ -13,9 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
 import unittest
+import weakref
 
 from orquesta import exceptions as exc
+from orquesta.specs import base as spec_base
 from orquesta.specs import types as spec_types
 from orquesta.tests.unit.specs import base as test_specs
 from orquesta.utils import jsonify as json_util
@@ -130,6 +133,86 @@ class SpecTest(unittest.TestCase):
 
         self.assertDictEqual(schema, test_specs.MockSpec._schema)
 
+    def test_schema_cache(self):
+        spec1 = test_specs.MockLeafSpec({"attr1": "foobar"})
+        spec2 = test_specs.MockLeafSpec({"attr1": "fubar"})
+
+        # The merged schemas are shared by the instances of the same spec class.
+        self.assertIs(spec1._schema, spec2._schema)
+        self.assertIs(spec1._meta_schema, spec2._meta_schema)
+
+        # The merged schemas returned by the class are copies of the cached schemas.
+        schema = test_specs.MockLeafSpec.get_schema(includes=None)
+        schema["properties"]["foobar"] = spec_types.NONEMPTY_STRING
+        self.assertNotIn("foobar", test_specs.MockLeafSpec.get_schema()["properties"])
+
+        # The cache is rebuilt if the schema of the spec class is changed.
+        class MockLeafSubSpec(test_specs.MockLeafSpec):
+            pass
+
+        self.assertNotIn("attr3", MockLeafSubSpec({"attr1": "foobar"})._schema["properties"])
+
+        original_schema = test_specs.MockLeafSpec._schema
+        changed_schema = json_util.deepcopy(original_schema)
+        changed_schema["properties"]["attr3"] = spec_types.NONEMPTY_STRING
+
+        try:
+            test_specs.MockLeafSpec._schema = changed_schema
+            spec3 = MockLeafSubSpec({"attr1": "foobar", "attr3": "fubar"})
+            self.assertIn("attr3", spec3._schema["properties"])
+            self.assertEqual(spec3.attr3, "fubar")
+        finally:
+            test_specs.MockLeafSpec._schema = original_schema
+
+        self.assertNotIn("attr3", MockLeafSubSpec({"attr1": "foobar"})._schema["properties"])
+
+    def test_schema_cache_keyed_by_class(self):
+        class MockLeafSubSpec(test_specs.MockLeafSpec):
+            _schema = {"type": "object", "properties": {"attr3": spec_types.NONEMPTY_STRING}}
+
+        MockLeafSubSpec({"attr1": "foobar"})
+
+        # The cache entry keeps the schemas it is merged from so they are compared by identity.
+        schema_cache = spec_base._schema_caches[MockLeafSubSpec]
+        self.assertIs(schema_cache["schemas"][0], MockLeafSubSpec.__dict__["_schema"])
+        self.assertIs(MockLeafSubSpec._get_schema_cache(), schema_cache)
+
+        # A schema that is assigned to the class is not mistaken for the cached schema.
+        MockLeafSubSpec._schema = {
+            "type": "object",
+            "properties": {"attr4": spec_types.NONEMPTY_STRING},
+        }
+        spec = MockLeafSubSpec({"attr1": "foobar", "attr4": "fubar"})
+        self.assertIsNot(MockLeafSubSpec._get_schema_cache(), schema_cache)
+        self.assertIn("attr4", spec._schema["properties"])
+        self.assertNotIn("attr3", spec._schema["properties"])
+
+        # The cache entry is dropped when the class is garbage collected.
+        spec_cls_ref = weakref.ref(MockLeafSubSpec)
+        size = len(spec_base._schema_caches)
+        del spec, MockLeafSubSpec
+        gc.collect()
+
+        self.assertIsNone(spec_cls_ref())
+        self.assertLessEqual(len(spec_base._schema_caches), size - 1)
+
+    def test_schema_attributes(self):
+        spec_obj = test_specs.MockSpec({"name": "mock", "attr1": "foobar", "attr1-1": "fubar"})
+
+        # The attributes that map to the spec properties are resolved once per spec class.
+        self.assertIs(
+            spec_obj._schema_attributes, test_specs.MockSpec(spec_obj.spec)._schema_attributes
+        )
+        self.assertEqual(spec_obj._schema_attributes["name"], ("name", None))
+        self.assertEqual(spec_obj._schema_attributes["attr1_1"], ("attr1-1", None))
+        self.assertEqual(spec_obj._schema_attributes["attr1-1"], ("attr1-1", None))
+        self.assertNotIn("attr1-2", spec_obj._schema_attributes)
+
+        self.assertEqual(spec_obj.name, "mock")
+        self.assertEqual(spec_obj.attr1_1, "fubar")
+        self.assertIsNone(spec_obj.attr2)
+        self.assertRaises(AttributeError, getattr, spec_obj, "foobar")
+
     def test_spec_init_arg_none_type(self):
         self.assertRaises(ValueError, test_specs.MockSpec, None)
 
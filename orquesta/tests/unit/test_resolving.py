@@ -0,0 +1,84 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from orquesta import exceptions as exc
+from orquesta import resolving
+from orquesta.utils import jsonify as json_util
+
+
+class ContentResolverTest(unittest.TestCase):
+    def setUp(self):
+        super(ContentResolverTest, self).setUp()
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        super(ContentResolverTest, self).tearDown()
+
+    def assert_resolver(self, resolver):
+        content = {"foo": "bar", "items": [1, 2, 3]}
+        content_hash = json_util.content_hash(content)
+
+        self.assertFalse(resolver.has(content_hash))
+        self.assertRaises(exc.ContentNotFoundError, resolver.get, content_hash)
+
+        resolver.put(content_hash, content)
+
+        self.assertTrue(resolver.has(content_hash))
+        self.assertDictEqual(resolver.get(content_hash), content)
+
+        # The content returned is a copy of the stored content.
+        resolver.get(content_hash)["foo"] = "foobar"
+        self.assertDictEqual(resolver.get(content_hash), content)
+
+        # The content hash is validated.
+        self.assertRaises(ValueError, resolver.put, "../foobar", content)
+        self.assertRaises(ValueError, resolver.get, None)
+
+        # The content that does not match its hash is not returned.
+        other_hash = json_util.content_hash({"foo": "fubar"})
+        resolver.put(other_hash, content)
+        self.assertTrue(resolver.has(other_hash))
+        self.assertRaises(exc.ContentHashMismatchError, resolver.get, other_hash)
+
+    def test_memory_resolver(self):
+        self.assert_resolver(resolving.MemoryContentResolver())
+
+    def test_file_resolver(self):
+        resolver = resolving.FileContentResolver(os.path.join(self.path, "contents"))
+        self.assert_resolver(resolver)
+
+        # The content is written to a file named after the content hash.
+        self.assertEqual(len(os.listdir(resolver.path)), 2)
+        self.assertTrue(all(f.endswith(".json") for f in os.listdir(resolver.path)))
+
+        # The content that is changed in the file is not returned.
+        content = {"foo": "bar"}
+        content_hash = json_util.content_hash(content)
+        resolver.put(content_hash, content)
+
+        with open(resolver.get_file_path(content_hash), "w") as f:
+            f.write('{"foo": "foobar"}')
+
+        self.assertRaisesRegex(
+            exc.ContentHashMismatchError,
+            content_hash,
+            resolver.get,
+            content_hash,
+        )
@@ -0,0 +1,80 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from orquesta.utils import cache as cache_util
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = cache_util.LRUCache(maxsize=2)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", "foobar"), "foobar")
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(len(cache), 2)
+        self.assertIn("a", cache)
+
+        expected_stats = {"hits": 2, "misses": 2, "size": 2, "maxsize": 2}
+        self.assertDictEqual(cache.get_stats(), expected_stats)
+
+    def test_evict_least_recently_used(self):
+        cache = cache_util.LRUCache(maxsize=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_resize(self):
+        cache = cache_util.LRUCache(maxsize=3)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.resize(1)
+
+        self.assertEqual(cache.maxsize, 1)
+        self.assertListEqual([k for k in ["a", "b", "c"] if k in cache], ["c"])
+
+    def test_disabled(self):
+        cache = cache_util.LRUCache(maxsize=0)
+        cache.put("a", 1)
+
+        self.assertNotIn("a", cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = cache_util.LRUCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        expected_stats = {"hits": 0, "misses": 0, "size": 0, "maxsize": 128}
+        self.assertDictEqual(cache.get_stats(), expected_stats)
+
+    def test_bad_maxsize(self):
+        self.assertRaises(ValueError, cache_util.LRUCache, maxsize=-1)
+        self.assertRaises(ValueError, cache_util.LRUCache, maxsize="foobar")
+        self.assertRaises(ValueError, cache_util.LRUCache(maxsize=1).resize, None)
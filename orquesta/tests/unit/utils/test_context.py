@@ -41,6 +41,15 @@ class ContextUtilTest(unittest.TestCase):
 
         self.assertDictEqual(context, expected_context)
 
+    def test_set_current_task_shares_values(self):
+        context = {"var1": {"foo": "bar"}}
+        task = {"id": "t1", "route": 0}
+
+        task_context = ctx_util.set_current_task(context, task)
+
+        self.assertNotIn("__current_task", context)
+        self.assertIs(task_context["var1"], context["var1"])
+
     def test_set_current_task_nonetype_context(self):
         task = {"id": "t1", "route": 0}
 
@@ -68,3 +77,33 @@ class ContextUtilTest(unittest.TestCase):
         self.assertRaises(TypeError, ctx_util.set_current_task, "foobar", task)
 
         self.assertRaises(TypeError, ctx_util.set_current_task, dict(), "foobar")
+
+    def test_set_current_item(self):
+        context = {"var1": {"foo": "bar"}, "__current_item": None}
+
+        item_context = ctx_util.set_current_item(context, "foobar")
+        expected_context = {"var1": {"foo": "bar"}, "__current_item": "foobar"}
+
+        self.assertIsInstance(item_context, ctx_util.ContextOverlay)
+        self.assertDictEqual(dict(item_context), expected_context)
+        self.assertDictEqual(item_context.toDict(), expected_context)
+        self.assertEqual(len(item_context), 2)
+        self.assertIsNone(context["__current_item"])
+        self.assertIs(item_context["var1"], context["var1"])
+
+    def test_set_current_item_empty_context(self):
+        item_context = ctx_util.set_current_item(None, "foobar")
+
+        self.assertDictEqual(dict(item_context), {"__current_item": "foobar"})
+
+    def test_set_current_item_bad_types(self):
+        self.assertRaises(TypeError, ctx_util.set_current_item, "foobar", "foobar")
+
+    def test_context_overlay_copy(self):
+        context = {"var1": {"foo": "bar"}}
+        item_context = ctx_util.set_current_item(context, "foobar")
+
+        copied = json_util.deepcopy(item_context)
+
+        self.assertDictEqual(copied, {"var1": {"foo": "bar"}, "__current_item": "foobar"})
+        self.assertIsNot(copied["var1"], context["var1"])
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import unittest
 
 from orquesta.utils import dictionary as dict_util
@@ -54,6 +55,51 @@ class DictUtilsTest(unittest.TestCase):
 
         self.assertDictEqual(left, expected)
 
+    def test_dict_layer(self):
+        base = json_util.deepcopy(LEFT)
+        base["k5"] = {"k51": "foo"}
+        layer = json_util.deepcopy(RIGHT)
+
+        result = dict_util.layer_dicts(base, layer)
+
+        expected = {
+            "k1": "123",
+            "k2": "def",
+            "k3": {"k31": True, "k32": 2.0, "k33": {"k331": "foo"}},
+            "k4": "bar",
+            "k5": {"k51": "foo"},
+        }
+
+        self.assertDictEqual(result, expected)
+
+        # The base is not modified and the values not changed by the layer are shared.
+        self.assertDictEqual(base["k3"], LEFT["k3"])
+        self.assertIsNot(result["k3"], base["k3"])
+        self.assertIs(result["k5"], base["k5"])
+        self.assertIs(result["k3"]["k33"], layer["k3"]["k33"])
+
+    def test_dict_layer_overwrite_false(self):
+        base = json_util.deepcopy(LEFT)
+        layer = json_util.deepcopy(RIGHT)
+
+        result = dict_util.layer_dicts(base, layer, overwrite=False)
+
+        expected = {
+            "k1": "123",
+            "k2": "abc",
+            "k3": {"k31": True, "k32": 1.0, "k33": {"k331": "foo"}},
+            "k4": "bar",
+        }
+
+        self.assertDictEqual(result, expected)
+        self.assertDictEqual(base, LEFT)
+
+    def test_dict_layer_empty(self):
+        self.assertDictEqual(dict_util.layer_dicts(None, None), {})
+        self.assertDictEqual(dict_util.layer_dicts(LEFT, None), LEFT)
+        self.assertDictEqual(dict_util.layer_dicts(None, RIGHT), RIGHT)
+        self.assertIsNot(dict_util.layer_dicts(LEFT, None), LEFT)
+
     def test_dict_dot_notation_access(self):
         data = {
             "a": "foo",
@@ -128,3 +174,27 @@ class DictUtilsTest(unittest.TestCase):
         self.assertRaises(
             KeyError, dict_util.set_dict_value, data, "a.b", "foobar", raise_key_error=True
         )
+
+    def test_freeze(self):
+        data = {"a": [1, {"b": "foo"}], "c": {"d": [True]}}
+        frozen = dict_util.freeze(data)
+
+        self.assertDictEqual(frozen, data)
+        self.assertIsInstance(frozen, dict)
+        self.assertIsInstance(frozen["a"], list)
+        self.assertEqual(json_util.deepcopy(frozen), data)
+
+        self.assertRaises(TypeError, frozen.__setitem__, "x", 1)
+        self.assertRaises(TypeError, frozen.update, {"x": 1})
+        self.assertRaises(TypeError, frozen["a"].append, 2)
+        self.assertRaises(TypeError, frozen["a"][1].pop, "b")
+        self.assertRaises(TypeError, frozen["c"]["d"].__setitem__, 0, False)
+
+        # The original is not frozen and the copies of the frozen values can be modified.
+        data["a"].append(2)
+        self.assertListEqual(frozen["a"], [1, {"b": "foo"}])
+
+        copied = copy.deepcopy(frozen)
+        copied["a"][1]["b"] = "bar"
+        copied["c"]["d"].append(False)
+        self.assertDictEqual(frozen, {"a": [1, {"b": "foo"}], "c": {"d": [True]}})
@@ -78,3 +78,15 @@ class SerializationTest(unittest.TestCase):
         obj = json_util.deserialize(FakeModel, MOCK_JSON_UNSERIALIZEABLE)
 
         self.assertIsNone(obj.k1)
+
+    def test_content_hash(self):
+        value1 = {"a": 1, "b": {"c": [1, 2, 3], "d": "foobar"}}
+        value2 = {"b": {"d": "foobar", "c": [1, 2, 3]}, "a": 1}
+
+        self.assertEqual(json_util.content_hash(value1), json_util.content_hash(value2))
+        self.assertNotEqual(json_util.content_hash(value1), json_util.content_hash({"a": 1}))
+
+        # Values that cannot be encoded by ujson are also hashed.
+        value3 = {"a": date_util.parse("2019-01-01T00:00:00Z")}
+
+        self.assertEqual(json_util.content_hash(value3), json_util.content_hash(dict(value3)))
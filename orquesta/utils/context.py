@@ -12,14 +12,59 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections.abc
+import copy
 import logging
 
-from orquesta.utils import jsonify as json_util
-
 
 LOG = logging.getLogger(__name__)
 
 
+class ContextOverlay(collections.abc.Mapping):
+    # A read-only mapping of a few variables such as the current item on top of a base context.
+    # The base context is shared instead of copied so the overlay is cheap enough to be created
+    # for each item of a with items task. Variables in the overlay take precedence over the base.
+    # The nested values are shared too, so the expression evaluators only give the expressions
+    # frozen or copied values and the values are not to be modified in place otherwise.
+
+    def __init__(self, base, overlay):
+        self._base = base if base is not None else {}
+        self._overlay = overlay
+
+    def __getitem__(self, key):
+        if key in self._overlay:
+            return self._overlay[key]
+
+        return self._base[key]
+
+    def __contains__(self, key):
+        return key in self._overlay or key in self._base
+
+    def __iter__(self):
+        for key in self._overlay:
+            yield key
+
+        for key in self._base:
+            if key not in self._overlay:
+                yield key
+
+    def __len__(self):
+        return len(self._overlay) + len([k for k in self._base if k not in self._overlay])
+
+    def __repr__(self):
+        return repr(self.toDict())
+
+    def __copy__(self):
+        return self.toDict()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.toDict(), memo)
+
+    def toDict(self):
+        # The method name is the hook used by ujson to serialize custom objects.
+        return {k: self[k] for k in self}
+
+
 def set_current_task(context, task):
     if context and not isinstance(context, dict):
         raise TypeError("The context is not type of dict.")
@@ -30,7 +75,10 @@ def set_current_task(context, task):
     if not isinstance(task, dict):
         raise TypeError("The task is not type of dict.")
 
-    ctx = json_util.deepcopy(context) if context else dict()
+    # Only the top level is copied and the values are shared with the given context. The values
+    # are not modified in place and the expression evaluators only give the expressions frozen
+    # or copied values.
+    ctx = dict(context) if context else dict()
 
     ctx["__current_task"] = {"id": task.get("id"), "route": task.get("route")}
 
@@ -41,10 +89,7 @@ def set_current_task(context, task):
 
 
 def set_current_item(context, item):
-    if context and not isinstance(context, dict):
+    if context and not isinstance(context, collections.abc.Mapping):
         raise TypeError("The context is not type of dict.")
 
-    ctx = json_util.deepcopy(context) if context else dict()
-    ctx["__current_item"] = item
-
-    return ctx
+    return ContextOverlay(context, {"__current_item": item})
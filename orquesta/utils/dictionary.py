@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+
 
 def merge_dicts(left, right, overwrite=True):
     if left is None:
@@ -35,6 +37,29 @@ def merge_dicts(left, right, overwrite=True):
     return left
 
 
+def layer_dicts(base, layer, overwrite=True):
+    # Unlike merge_dicts, the base is not modified. A new dict is returned where only the dicts
+    # along the path of the keys in the layer are copied and everything else is shared with the
+    # base and the layer. The dicts given and returned are expected to be treated as immutable.
+    result = dict(base) if base else dict()
+
+    if not layer:
+        return result
+
+    for k, v in layer.items():
+        if k not in result:
+            result[k] = v
+        else:
+            base_v = result[k]
+
+            if isinstance(base_v, dict) and isinstance(v, dict):
+                result[k] = layer_dicts(base_v, v, overwrite=overwrite)
+            elif overwrite:
+                result[k] = v
+
+    return result
+
+
 def get_dict_value(obj, path, raise_key_error=False):
     item = obj
     traversed = ""
@@ -79,3 +104,60 @@ def set_dict_value(obj, path, value, raise_key_error=False, insert_null=True):
                 item[key] = {}
 
             item = item[key]
+
+
+class FrozenDict(dict):
+    # A dict that cannot be modified. It is still a dict so it can be validated, encoded, and
+    # read like the original. The copies are regular dicts that can be modified.
+
+    def _raise_frozen(self, *args, **kwargs):
+        raise TypeError("The %s cannot be modified." % self.__class__.__name__)
+
+    __setitem__ = __delitem__ = __ior__ = _raise_frozen
+    clear = pop = popitem = setdefault = update = _raise_frozen
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def copy(self):
+        return dict(self)
+
+
+class FrozenList(list):
+    # A list that cannot be modified. The copies are regular lists that can be modified.
+
+    def _raise_frozen(self, *args, **kwargs):
+        raise TypeError("The %s cannot be modified." % self.__class__.__name__)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_frozen
+    append = clear = extend = insert = pop = remove = reverse = sort = _raise_frozen
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def copy(self):
+        return list(self)
+
+
+def freeze(value):
+    # Return a copy of the value where the dicts and lists, including the nested ones, cannot
+    # be modified. Any other value is returned as is.
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+
+    return value
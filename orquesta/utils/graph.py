@@ -0,0 +1,290 @@
+# Copyright 2021 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+
+LOG = logging.getLogger(__name__)
+
+
+def get_nodes_in_cycle(graph):
+    # A node is in a cycle if it is in a strongly connected component with other nodes or if it
+    # has an edge to itself.
+    nodes = set(graph.get_self_loops())
+
+    for component in graph.get_strongly_connected_components():
+        if len(component) > 1:
+            nodes.update(component)
+
+    return nodes
+
+
+class MultiDiGraph(object):
+    # A directed graph that allows more than one edge between the same pair of nodes. The nodes,
+    # the edges, and the keys of the edges are kept in the same order as the MultiDiGraph in
+    # networkx so the adjacency data of both graphs are identical.
+
+    def __init__(self):
+        self.graph = {}
+        self.nodes = {}
+        self._succ = {}
+        self._pred = {}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @classmethod
+    def deserialize(cls, data):
+        instance = cls()
+        instance.graph = dict(data.get("graph", []))
+        mapping = []
+
+        for node_data in data["nodes"]:
+            node_data = dict(node_data)
+            node = node_data.pop("id")
+            mapping.append(node)
+            instance.add_node(node, **node_data)
+
+        for idx, adjacency in enumerate(data["adjacency"]):
+            for edge_data in adjacency:
+                edge_data = dict(edge_data)
+                destination = edge_data.pop("id")
+                key = edge_data.pop("key", None)
+                instance.add_edge(mapping[idx], destination, key=key, **edge_data)
+
+        return instance
+
+    def serialize(self):
+        data = {
+            "directed": True,
+            "multigraph": True,
+            "graph": list(self.graph.items()),
+            "nodes": [],
+            "adjacency": [],
+        }
+
+        for node, neighbors in self._succ.items():
+            data["nodes"].append({**self.nodes[node], "id": node})
+
+            data["adjacency"].append(
+                [
+                    {**attrs, "id": destination, "key": key}
+                    for destination, edges in neighbors.items()
+                    for key, attrs in edges.items()
+                ]
+            )
+
+        return data
+
+    def has_node(self, node):
+        return node in self.nodes
+
+    def add_node(self, node, **attrs):
+        if node not in self.nodes:
+            self.nodes[node] = {}
+            self._succ[node] = {}
+            self._pred[node] = {}
+
+        self.nodes[node].update(attrs)
+
+    def add_edge(self, source, destination, key=None, **attrs):
+        self.add_node(source)
+        self.add_node(destination)
+
+        # The edges between the same pair of nodes are shared by the successors of the source
+        # and the predecessors of the destination.
+        edges = self._succ[source].get(destination)
+
+        if edges is None:
+            edges = {}
+            self._succ[source][destination] = edges
+            self._pred[destination][source] = edges
+
+        if key is None:
+            key = len(edges)
+
+            while key in edges:
+                key += 1
+
+        edges.setdefault(key, {}).update(attrs)
+
+        return key
+
+    def get_edge(self, source, destination, key):
+        return self._succ[source][destination][key]
+
+    def get_edges_between(self, source, destination):
+        edges = self._succ.get(source, {}).get(destination, {})
+
+        return [(source, destination, key, attrs) for key, attrs in edges.items()]
+
+    def get_edges(self):
+        return [
+            (source, destination, key, attrs)
+            for source, neighbors in self._succ.items()
+            for destination, edges in neighbors.items()
+            for key, attrs in edges.items()
+        ]
+
+    def get_out_edges(self, node):
+        return [
+            (node, destination, key, attrs)
+            for destination, edges in self._succ.get(node, {}).items()
+            for key, attrs in edges.items()
+        ]
+
+    def get_in_edges(self, node):
+        return [
+            (source, node, key, attrs)
+            for source, edges in self._pred.get(node, {}).items()
+            for key, attrs in edges.items()
+        ]
+
+    def get_in_degree(self, node):
+        return sum(len(edges) for edges in self._pred[node].values())
+
+    def get_out_degree(self, node):
+        return sum(len(edges) for edges in self._succ[node].values())
+
+    def get_self_loops(self):
+        return [node for node, neighbors in self._succ.items() if node in neighbors]
+
+    def get_strongly_connected_components(self):
+        # Identify the strongly connected components using the Tarjan algorithm. The depth first
+        # search is iterative so large graphs do not run into the recursion limit.
+        components = []
+        indices = {}
+        lowlinks = {}
+        stack = []
+        on_stack = set()
+
+        for root in self._succ:
+            if root in indices:
+                continue
+
+            indices[root] = lowlinks[root] = len(indices)
+            stack.append(root)
+            on_stack.add(root)
+            path = [(root, iter(self._succ[root]))]
+
+            while path:
+                node, neighbors = path[-1]
+                neighbor = next(neighbors, None)
+
+                if neighbor is not None:
+                    if neighbor not in indices:
+                        indices[neighbor] = lowlinks[neighbor] = len(indices)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        path.append((neighbor, iter(self._succ[neighbor])))
+                    elif neighbor in on_stack:
+                        lowlinks[node] = min(lowlinks[node], indices[neighbor])
+
+                    continue
+
+                path.pop()
+
+                if path:
+                    parent = path[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+
+                if lowlinks[node] == indices[node]:
+                    component = set()
+
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+
+                        if member == node:
+                            break
+
+                    components.append(component)
+
+        return components
+
+
+class NetworkxMultiDiGraph(object):
+    # The graph with the same methods as the native graph but backed by the MultiDiGraph in
+    # networkx. The networkx library is not required at runtime and is only imported when this
+    # graph is used, for example, by tooling that wants to run graph algorithms from networkx.
+
+    def __init__(self, graph=None):
+        import networkx as nx
+
+        self._nx = nx
+        self._graph = graph if graph is not None else nx.MultiDiGraph()
+
+    def __len__(self):
+        return len(self._graph)
+
+    @property
+    def graph(self):
+        return self._graph.graph
+
+    @property
+    def nodes(self):
+        return self._graph.nodes
+
+    @classmethod
+    def deserialize(cls, data):
+        from networkx.readwrite import json_graph
+
+        return cls(graph=json_graph.adjacency_graph(data, directed=True, multigraph=True))
+
+    def serialize(self):
+        from networkx.readwrite import json_graph
+
+        return json_graph.adjacency_data(self._graph)
+
+    def to_networkx(self):
+        return self._graph
+
+    def has_node(self, node):
+        return self._graph.has_node(node)
+
+    def add_node(self, node, **attrs):
+        self._graph.add_node(node, **attrs)
+
+    def add_edge(self, source, destination, key=None, **attrs):
+        return self._graph.add_edge(source, destination, key=key, **attrs)
+
+    def get_edge(self, source, destination, key):
+        return self._graph[source][destination][key]
+
+    def get_edges_between(self, source, destination):
+        edges = self._graph.get_edge_data(source, destination) or {}
+
+        return [(source, destination, key, attrs) for key, attrs in edges.items()]
+
+    def get_edges(self):
+        return list(self._graph.edges(data=True, keys=True))
+
+    def get_out_edges(self, node):
+        return list(self._graph.out_edges([node], data=True, keys=True))
+
+    def get_in_edges(self, node):
+        return list(self._graph.in_edges([node], data=True, keys=True))
+
+    def get_in_degree(self, node):
+        return self._graph.in_degree(node)
+
+    def get_out_degree(self, node):
+        return self._graph.out_degree(node)
+
+    def get_self_loops(self):
+        return list(self._nx.nodes_with_selfloops(self._graph))
+
+    def get_strongly_connected_components(self):
+        return list(self._nx.strongly_connected_components(self._graph))
@@ -15,6 +15,8 @@
 
 import copy
 import datetime
+import hashlib
+import json
 import logging
 import ujson
 
@@ -67,3 +69,13 @@ def deepcopy(value):
         value = copy.deepcopy(value)
 
     return value
+
+
+def content_hash(value):
+    # The hash is the same for equal values regardless of the order of the keys in the dicts.
+    try:
+        data = ujson.dumps(value, sort_keys=True)  # pylint: disable=no-member
+    except (OverflowError, ValueError, TypeError):
+        data = json.dumps(value, sort_keys=True, default=str)
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
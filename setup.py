@@ -53,6 +53,10 @@ setup(
     url="https://www.stackstorm.com",
     packages=find_packages(exclude=[]),
     install_requires=get_requirements(),
+    extras_require={
+        # networkx v3.5 and greater does not support Python3.10.
+        "networkx": ["networkx>=2.6,<3.4"],
+    },
     license="Apache License (2.0)",
     classifiers=[
         "Development Status :: 4 - Beta",